@@ -0,0 +1 @@
+"""Module for custom middleware."""
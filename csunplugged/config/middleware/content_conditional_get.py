@@ -0,0 +1,87 @@
+"""Middleware for conditional GET requests of content pages."""
+
+import hashlib
+from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.translation import get_language
+from config import __version__
+from utils.content_version import get_content_version
+
+
+class ContentConditionalGetMiddleware(object):
+    """Answer conditional GET requests of content pages.
+
+    Content pages only change when content is loaded or the website is
+    updated, so their ETag is derived from the content version, website
+    version, active language, and URL. Requests with a matching
+    If-None-Match header are answered with a 304 response without
+    running the view. No Last-Modified header is sent, as the time the
+    content was loaded does not change when only the website is updated.
+
+    Only views within CONTENT_CONDITIONAL_GET_NAMESPACES are handled,
+    except views listed in CONTENT_CONDITIONAL_GET_EXCLUDED_VIEWS.
+    """
+
+    def __init__(self, get_response):
+        """Create middleware for a WSGI application.
+
+        Args:
+            get_response: Function returning the response for a request.
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Return the response for a request, adding an ETag header.
+
+        Args:
+            request: HttpRequest object.
+
+        Returns:
+            HttpResponse object.
+        """
+        response = self.get_response(request)
+        etag = getattr(request, "content_etag", None)
+        if etag is not None and response.status_code in (200, 304) and not response.has_header("ETag"):
+            response["ETag"] = etag
+        return response
+
+    def process_view(self, request, view_function, view_args, view_kwargs):
+        """Return a 304 response if the client's copy of the page is current.
+
+        Args:
+            request: HttpRequest object.
+            view_function: View function that will handle the request.
+            view_args: Positional arguments for the view.
+            view_kwargs: Keyword arguments for the view.
+
+        Returns:
+            HttpResponseNotModified object, or None to run the view.
+        """
+        if request.method not in ("GET", "HEAD"):
+            return None
+        resolver_match = request.resolver_match
+        if (not resolver_match.namespaces or
+                resolver_match.namespaces[0] not in settings.CONTENT_CONDITIONAL_GET_NAMESPACES or
+                resolver_match.view_name in settings.CONTENT_CONDITIONAL_GET_EXCLUDED_VIEWS):
+            return None
+        content_version = get_content_version()
+        if content_version is None:
+            return None
+        etag = get_content_etag(content_version, get_language(), request.get_full_path())
+        request.content_etag = etag
+        return get_conditional_response(request, etag=etag)
+
+
+def get_content_etag(content_version, language, path):
+    """Return ETag of a content page.
+
+    Args:
+        content_version: Version of loaded content (str).
+        language: Language code of page (str).
+        path: Path of page, including query string (str).
+
+    Returns:
+        Quoted ETag (str).
+    """
+    key = "{}:{}:{}:{}".format(content_version, __version__, language, path)
+    return '"{}"'.format(hashlib.sha256(key.encode("UTF-8")).hexdigest())
@@ -67,6 +67,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "config.middleware.content_conditional_get.ContentConditionalGetMiddleware",
 ]
 
 # DEBUG
@@ -242,6 +243,24 @@ ROOT_URLCONF = "config.urls"
 # See: https://docs.djangoproject.com/en/dev/ref/settings/#wsgi-application
 WSGI_APPLICATION = "config.wsgi.application"
 
+# CACHING
+# ----------------------------------------------------------------------------
+# See: https://docs.djangoproject.com/en/dev/ref/settings/#caches
+# Content pages are cached in memory, as content only changes when loaded
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": ""
+    },
+    "content_pages": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "content-pages",
+        "OPTIONS": {
+            "MAX_ENTRIES": 5000,
+        },
+    },
+}
+
 # PASSWORD VALIDATION
 # https://docs.djangoproject.com/en/dev/ref/settings/#auth-password-validators
 # ------------------------------------------------------------------------------
@@ -266,8 +285,24 @@ DJANGO_PRODUCTION = env.bool("DJANGO_PRODUCTION")
 TOPICS_CONTENT_BASE_PATH = os.path.join(str(ROOT_DIR.path("topics")), "content")
 RESOURCES_CONTENT_BASE_PATH = os.path.join(str(ROOT_DIR.path("resources")), "content")
 RESOURCE_GENERATION_LOCATION = os.path.join(str(ROOT_DIR.path("staticfiles")), "resources")
+RESOURCE_PDF_MANIFEST_LOCATION = RESOURCE_GENERATION_LOCATION
+RESOURCE_PDF_MANIFEST_REQUEST_TIMEOUT = 5
+RESOURCE_PDF_MANIFEST_CACHE_TIMEOUT = 60 * 5
+RESOURCE_PDF_MANIFEST_ERROR_CACHE_TIMEOUT = 30
+RESOURCE_GENERATION_CHECKPOINT = os.path.join(str(ROOT_DIR.path("temp")), "makeresources-checkpoint.txt")
+RESOURCE_GENERATION_REPORT = os.path.join(str(ROOT_DIR.path("temp")), "makeresources-report")
 RESOURCE_GENERATORS_PACKAGE = "resources.generators"
+RESOURCE_BENCHMARK_BASELINE = os.path.join(str(ROOT_DIR.path("resources")), "benchmarks", "baseline.json")
+RESOURCE_BENCHMARK_THRESHOLD = 0.2
 RESOURCE_COPY_AMOUNT = 20
+RESOURCE_PDF_ETAG_CACHE_TIMEOUT = 60 * 60
+CONTENT_PAGE_CACHE_ALIAS = "content_pages"
+CONTENT_PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+CONTENT_VERSION_CACHE_TIMEOUT = 60
+CONTENT_CONDITIONAL_GET_NAMESPACES = ["general", "topics", "resources"]
+# Resource PDFs have their own ETag, based on the PDF contents
+CONTENT_CONDITIONAL_GET_EXCLUDED_VIEWS = ["resources:generate"]
 SCRATCH_GENERATION_LOCATION = str(ROOT_DIR.path("temp"))
+MARKDOWN_CONVERSION_CACHE_LOCATION = os.path.join(str(ROOT_DIR.path("temp")), "markdown-conversions")
 CUSTOM_VERTO_TEMPLATES = os.path.join(str(ROOT_DIR.path("utils")), "custom_converter_templates", "")
 MODELTRANSLATION_CUSTOM_FIELDS = ("JSONField",)
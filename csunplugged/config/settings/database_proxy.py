@@ -20,3 +20,9 @@ DATABASES = {
 }
 
 SECRET_KEY = env("DJANGO_SECRET_KEY")  # noqa: F405
+
+# STATIC FILES CONFIGURATION
+# ----------------------------------------------------------------------------
+# Content is stored with static URLs already rendered when loaded,
+# so these must match the URLs of the deployed website.
+STATIC_URL = "https://storage.googleapis.com/" + env("GOOGLE_CLOUD_STORAGE_BUCKET_NAME") + "/static/"  # noqa: F405
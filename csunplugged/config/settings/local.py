@@ -45,7 +45,11 @@ CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": ""
-    }
+    },
+    # Pages are not cached while developing, so template changes are shown
+    "content_pages": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    },
 }
 
 # django-debug-toolbar
@@ -37,6 +37,7 @@ DATABASES["default"]["ATOMIC_REQUESTS"] = True
 
 # Static files
 STATIC_URL = "https://storage.googleapis.com/" + env("GOOGLE_CLOUD_STORAGE_BUCKET_NAME") + "/static/"  # noqa: F405
+RESOURCE_PDF_MANIFEST_LOCATION = STATIC_URL + "resources/"
 
 # SECURITY CONFIGURATION
 # ------------------------------------------------------------------------------
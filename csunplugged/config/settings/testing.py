@@ -40,9 +40,21 @@ CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": ""
-    }
+    },
+    "content_pages": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "content-pages"
+    },
 }
 
+# Always read the content version from the database, as each test
+# starts with a fresh database
+CONTENT_VERSION_CACHE_TIMEOUT = 0
+
+# Convert Markdown content in each test, instead of using conversions
+# stored by previous test runs
+MARKDOWN_CONVERSION_CACHE_LOCATION = None
+
 # TESTING
 # ----------------------------------------------------------------------------
 TEST_RUNNER = "django.test.runner.DiscoverRunner"
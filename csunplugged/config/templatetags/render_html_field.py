@@ -1,9 +1,32 @@
 """Module for the custom render_html_field template tag."""
 
+from functools import lru_cache
 from django import template
+from django.utils.safestring import mark_safe
 
 register = template.Library()
 
+# Maximum number of compiled HTML templates kept in memory
+COMPILED_TEMPLATE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def compile_html_with_static(html):
+    """Compile the HTML into a template with the static template tag loaded.
+
+    Compiled templates are cached, so each unique HTML string is only
+    parsed once per process. The static template tag is resolved when
+    the template is rendered, so the cache is unaffected by changes to
+    STATIC_URL.
+
+    Args:
+        html (str): String of HTML to compile.
+
+    Returns:
+        Compiled template (Template).
+    """
+    return template.Template("{% load static %}" + html)
+
 
 def render_html_with_static(html):
     """Render the HTML with the static template tag.
@@ -14,7 +37,7 @@ def render_html_with_static(html):
     Returns:
         Rendered string of HTML.
     """
-    return template.Template("{% load static %}" + html).render(template.Context())
+    return compile_html_with_static(html).render(template.Context())
 
 
 @register.simple_tag
@@ -28,3 +51,22 @@ def render_html_field(html):
         Rendered string of HTML.
     """
     return render_html_with_static(html)
+
+
+@register.simple_tag
+def render_stored_html_field(rendered_html, html):
+    """Return the stored rendered HTML, or render the HTML if not stored.
+
+    Rendered HTML is stored by the loaders with static template tags
+    already resolved, so no template work is required.
+
+    Args:
+        rendered_html (str): String of rendered HTML, possibly empty.
+        html (str): String of HTML to render if rendered_html is empty.
+
+    Returns:
+        Rendered string of HTML.
+    """
+    if rendered_html:
+        return mark_safe(rendered_html)
+    return render_html_with_static(html)
@@ -1,7 +1,12 @@
 """Views for the dev application."""
 
+from collections import OrderedDict
+from django.db.models import Prefetch
 from django.views import generic
-from utils.group_lessons_by_age import group_lessons_by_age
+from utils.group_lessons_by_age import (
+    get_lesson_numbers,
+    group_lesson_numbers_by_age,
+)
 from topics.models import (
     Topic,
     CurriculumArea,
@@ -11,6 +16,7 @@ from topics.models import (
     ProgrammingChallengeLanguage,
     LearningOutcome,
     GlossaryTerm,
+    ordered_implementations_prefetch,
 )
 
 
@@ -23,34 +29,60 @@ class IndexView(generic.TemplateView):
     def get_context_data(self, **kwargs):
         """Return context for dev homepage.
 
+        All content is retrieved with a fixed number of queries, and
+        assembled into topic and curriculum area trees in memory.
+
         Returns:
             A dictionary of context data.
         """
         context = super(IndexView, self).get_context_data(**kwargs)
+        curriculum_areas_prefetch = Prefetch(
+            "curriculum_areas",
+            queryset=CurriculumArea.objects.select_related("parent")
+        )
 
         # Get topic, unit plan and lesson lists
-        context["topics"] = Topic.objects.order_by("name")
+        context["topics"] = list(Topic.objects.order_by("name").prefetch_related(
+            Prefetch("unit_plans", to_attr="units"),
+            Prefetch(
+                "curriculum_integrations",
+                queryset=CurriculumIntegration.objects.select_related("topic").prefetch_related(
+                    curriculum_areas_prefetch,
+                    "prerequisite_lessons",
+                ).order_by("number"),
+                to_attr="integrations",
+            ),
+            Prefetch(
+                "programming_challenges",
+                queryset=ProgrammingChallenge.objects.select_related("difficulty").prefetch_related(
+                    ordered_implementations_prefetch()
+                ).order_by("challenge_set_number", "challenge_number"),
+                to_attr="ordered_programming_challenges",
+            ),
+        ))
 
-        # Build dictionaries for each unit plan and lesson
+        # Build dictionaries of grouped lessons for each unit plan
+        unit_plan_lesson_numbers = OrderedDict()
+        for lesson_number in get_lesson_numbers():
+            unit_plan_lesson_numbers.setdefault(lesson_number.lesson.unit_plan_id, []).append(lesson_number)
         for topic in context["topics"]:
-            unit_plans = []
-            for unit_plan in topic.unit_plans.all():
-                unit_plan.grouped_lessons = group_lessons_by_age(unit_plan.lessons.all())
-                unit_plans.append(unit_plan)
-            topic.units = unit_plans
-            topic.integrations = CurriculumIntegration.objects.filter(topic=topic).order_by("number")
-            topic.programming_challenges = ProgrammingChallenge.objects.filter(topic=topic).order_by(
-                "challenge_set_number", "challenge_number"
-            )
+            for unit_plan in topic.units:
+                unit_plan.grouped_lessons = group_lesson_numbers_by_age(
+                    unit_plan_lesson_numbers.get(unit_plan.id, [])
+                )
 
         # Get curriculum area list
-        context["curriculum_areas"] = []
-        for parent in CurriculumArea.objects.filter(parent=None):
-            children = [child for child in CurriculumArea.objects.filter(parent=parent)]
-            context["curriculum_areas"].append((parent, children))
+        children = OrderedDict()
+        parents = []
+        for area in CurriculumArea.objects.select_related("parent"):
+            if area.parent_id is None:
+                parents.append(area)
+            else:
+                children.setdefault(area.parent_id, []).append(area)
+        context["curriculum_areas"] = [(parent, children.get(parent.id, [])) for parent in parents]
 
         # Get learning outcome list
-        context["learning_outcomes"] = LearningOutcome.objects.all()
+        context["learning_outcomes"] = LearningOutcome.objects.prefetch_related(curriculum_areas_prefetch)
 
         # Get learning outcome list
         context["programming_challenge_languages"] = ProgrammingChallengeLanguage.objects.all()
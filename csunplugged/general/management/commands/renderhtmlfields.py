@@ -0,0 +1,49 @@
+"""Module for the custom Django renderhtmlfields command."""
+
+from django.apps import apps
+from django.core import management
+from django.db import transaction
+from django.utils import translation
+from modeltranslation.utils import fallbacks
+from config.templatetags.render_html_field import render_html_with_static
+from utils.content_version import update_content_version
+from utils.language_utils import get_available_languages
+
+
+class Command(management.base.BaseCommand):
+    """Required command class for the custom Django renderhtmlfields command."""
+
+    help = "Render stored HTML fields again, for example after STATIC_URL has changed."
+
+    def handle(self, *args, **options):
+        """Automatically called when the renderhtmlfields command is given."""
+        with transaction.atomic():
+            for model in apps.get_models():
+                if getattr(model, "rendered_html_fields", None):
+                    count = render_model_html_fields(model)
+                    print("Rendered HTML fields of {} {} objects".format(count, model.__name__))
+            update_content_version()
+
+
+def render_model_html_fields(model):
+    """Render the rendered variants of HTML fields for all objects of a model.
+
+    Args:
+        model: Model class with rendered_html_fields.
+
+    Returns:
+        Number of objects rendered (int).
+    """
+    count = 0
+    for model_object in model.objects.all():
+        for language in get_available_languages():
+            with translation.override(language):
+                with fallbacks(False):
+                    for field in model.rendered_html_fields:
+                        html = getattr(model_object, field)
+                        if html:
+                            html = render_html_with_static(html)
+                        setattr(model_object, "{}_rendered".format(field), html)
+        model_object.save()
+        count += 1
+    return count
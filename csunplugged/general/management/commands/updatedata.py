@@ -1,6 +1,45 @@
 """Module for the custom Django updatedata command."""
 
+import os.path
+from django.conf import settings
 from django.core import management
+from django.db import transaction
+from utils.BaseLoader import BaseLoader
+from utils.content_version import (
+    SHARED_CONTENT_HASH_NAME,
+    TOPIC_CONTENT_HASH_NAME_TEMPLATE,
+    calculate_content_revision,
+    calculate_content_hashes,
+    get_content_hashes,
+    get_content_version,
+    save_content_hashes,
+    update_content_version,
+)
+from resources.models import Resource
+from topics.models import (
+    AgeGroup,
+    ClassroomResource,
+    CurriculumArea,
+    GlossaryTerm,
+    LearningOutcome,
+    ProgrammingChallengeDifficulty,
+    ProgrammingChallengeLanguage,
+    Topic,
+)
+
+# Objects of these models (and objects related to them) are deleted
+# before all content is loaded again
+CONTENT_MODELS = [
+    Topic,
+    GlossaryTerm,
+    LearningOutcome,
+    CurriculumArea,
+    ClassroomResource,
+    AgeGroup,
+    ProgrammingChallengeDifficulty,
+    ProgrammingChallengeLanguage,
+    Resource,
+]
 
 
 class Command(management.base.BaseCommand):
@@ -8,8 +47,81 @@ class Command(management.base.BaseCommand):
 
     help = "Update all data from content folders for all applications"
 
+    def add_arguments(self, parser):
+        """Add optional parameters to updatedata command."""
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            dest="incremental",
+            help="Only load content that has changed since it was last loaded, without flushing the database",
+        )
+
     def handle(self, *args, **options):
         """Automatically called when the updatedata command is given."""
-        management.call_command("flush", interactive=False)
-        management.call_command("loadresources")
-        management.call_command("loadtopics")
+        revision = calculate_content_revision(
+            settings.RESOURCES_CONTENT_BASE_PATH,
+            settings.TOPICS_CONTENT_BASE_PATH,
+        )
+        structure_file_path = os.path.join(settings.TOPICS_CONTENT_BASE_PATH, "structure", "structure.yaml")
+        structure = BaseLoader().load_yaml_file(structure_file_path)
+        content_hashes = calculate_content_hashes(
+            settings.RESOURCES_CONTENT_BASE_PATH,
+            settings.TOPICS_CONTENT_BASE_PATH,
+            structure,
+        )
+
+        if options["incremental"]:
+            if get_content_version() == revision:
+                print("Content revision {} is already loaded".format(revision))
+                return
+            # The website continues to show the previous content until
+            # all changes are loaded
+            with transaction.atomic():
+                self.load_changed_content(content_hashes, structure.get("topics") or [])
+                save_content_hashes(content_hashes)
+                update_content_version(revision)
+        else:
+            management.call_command("flush", interactive=False)
+            management.call_command("loadresources")
+            management.call_command("loadtopics")
+            save_content_hashes(content_hashes)
+            update_content_version(revision)
+        print("Content revision {}".format(revision))
+
+    def load_changed_content(self, content_hashes, topics):
+        """Load content that differs from the content in the database.
+
+        If content shared by topics has changed, all content is loaded
+        again. Otherwise only topics that have changed are loaded again,
+        and removed topics are deleted.
+
+        Args:
+            content_hashes: Dictionary of hashes of the current content,
+                keyed by content hash name.
+            topics: List of slugs of topics in the structure file (list).
+        """
+        loaded_hashes = get_content_hashes()
+        if loaded_hashes.get(SHARED_CONTENT_HASH_NAME) != content_hashes[SHARED_CONTENT_HASH_NAME]:
+            print("Shared content has changed, loading all content")
+            for model in CONTENT_MODELS:
+                model.objects.all().delete()
+            management.call_command("loadresources")
+            management.call_command("loadtopics")
+            return
+
+        loaded_topics = set(Topic.objects.values_list("slug", flat=True))
+        changed_topics = []
+        for slug in topics:
+            hash_name = TOPIC_CONTENT_HASH_NAME_TEMPLATE.format(slug)
+            if slug not in loaded_topics or loaded_hashes.get(hash_name) != content_hashes[hash_name]:
+                changed_topics.append(slug)
+        removed_topics = sorted(loaded_topics - set(topics))
+
+        if removed_topics:
+            print("Deleting topics: {}".format(", ".join(removed_topics)))
+        Topic.objects.filter(slug__in=changed_topics + removed_topics).delete()
+        if changed_topics:
+            print("Loading changed topics: {}".format(", ".join(changed_topics)))
+            management.call_command("loadtopics", topics=changed_topics)
+        else:
+            print("No topics have changed")
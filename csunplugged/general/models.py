@@ -0,0 +1,35 @@
+"""Models for the general application."""
+
+from django.db import models
+
+
+class ContentVersion(models.Model):
+    """Model for the version of the content loaded into the database."""
+
+    #  Auto-incrementing 'id' field is automatically set by Django
+    version = models.CharField(max_length=64)
+    updated = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """Text representation of ContentVersion object.
+
+        Returns:
+            Version of content (str).
+        """
+        return self.version
+
+
+class ContentHash(models.Model):
+    """Model for the hash of a part of the content loaded into the database."""
+
+    #  Auto-incrementing 'id' field is automatically set by Django
+    name = models.CharField(max_length=100, unique=True)
+    content_hash = models.CharField(max_length=64)
+
+    def __str__(self):
+        """Text representation of ContentHash object.
+
+        Returns:
+            Name of content part (str).
+        """
+        return self.name
@@ -30,6 +30,8 @@ MAX_NUMBER_VALUE = {
 class SearchingCardsResourceGenerator(BaseResourceGenerator):
     """Class for Searching Cards resource generator."""
 
+    random_data = True
+
     @classmethod
     def get_additional_options(cls):
         """Additional options for SearchingCardsResourceGenerator."""
@@ -28,6 +28,8 @@ TYPE_VALUES = {
 class SortingNetworkCardsResourceGenerator(BaseResourceGenerator):
     """Class for Sorting Network Cards resource generator."""
 
+    random_data = True
+
     @classmethod
     def get_additional_options(cls):
         """Additional options for SortingNetworkCardsResourceGenerator."""
@@ -18,6 +18,7 @@ class SortingNetworkResourceGenerator(BaseResourceGenerator):
     """Class for Sorting Network resource generator."""
 
     copies = True
+    random_data = True
 
     @classmethod
     def get_additional_options(cls):
@@ -30,6 +30,7 @@ class TreasureHuntResourceGenerator(BaseResourceGenerator):
     """Class for Treasure Hunt resource generator."""
 
     copies = True
+    random_data = True
 
     @classmethod
     def get_additional_options(cls):
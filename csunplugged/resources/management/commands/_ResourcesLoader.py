@@ -1,7 +1,7 @@
 """Custom loader for loading resources."""
 
-from django.db import transaction
 from django.http.request import QueryDict
+from utils.BaseLoader import atomic_load
 from utils.TranslatableModelLoader import TranslatableModelLoader
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
 from utils.errors.InvalidYAMLValueError import InvalidYAMLValueError
@@ -13,7 +13,9 @@ from django.contrib.staticfiles import finders
 class ResourcesLoader(TranslatableModelLoader):
     """Custom loader for loading resources."""
 
-    @transaction.atomic
+    loaded_models = [Resource]
+
+    @atomic_load
     def load(self):
         """Load the content for resources.
 
@@ -73,7 +75,7 @@ class ResourcesLoader(TranslatableModelLoader):
             )
             self.populate_translations(resource, resource_translations)
             self.mark_translation_availability(resource, required_fields=["name", "content"])
-            resource.save()
+            self.save_object(resource)
 
             self.log("Added Resource: {}".format(resource.name))
         self.log("All resources loaded!\n")
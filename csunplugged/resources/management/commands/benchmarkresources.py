@@ -0,0 +1,148 @@
+"""Module for the custom Django benchmarkresources command."""
+
+import importlib
+import json
+import os
+import os.path
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from resources.utils.benchmark_resource_generator import (
+    get_generator_modules,
+    get_representative_combinations,
+    benchmark_resource_generator,
+    find_benchmark_regressions,
+)
+
+RESULT_HEADER_TEMPLATE = "{:<40} {:>6} {:>10} {:>10} {:>10} {:>10} {:>12}"
+RESULT_ROW_TEMPLATE = "{:<40} {:>6} {:>10.4f} {:>10.4f} {:>10.4f} {:>10.2f} {:>12}"
+REGRESSION_TEMPLATE = "{generator} {stage}: {current:.4f}s per combination (baseline {baseline:.4f}s)"
+
+
+class Command(BaseCommand):
+    """Required command class for the custom Django benchmarkresources command."""
+
+    help = "Benchmarks resource generators and compares against baseline results."
+
+    def add_arguments(self, parser):
+        """Add optional parameters to benchmarkresources command."""
+        parser.add_argument(
+            "generator_module",
+            nargs="?",
+            default=None,
+            help="The resource generator to benchmark, for example 'GridResourceGenerator'",
+        )
+        parser.add_argument(
+            "--combinations",
+            type=int,
+            default=3,
+            help="Maximum number of option combinations to benchmark per generator",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1,
+            help="Number of times to time each stage, with the fastest time being used",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=settings.RESOURCE_BENCHMARK_THRESHOLD,
+            help="Allowed fractional slowdown over baseline, for example 0.2 allows 20%% slower",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=settings.RESOURCE_BENCHMARK_BASELINE,
+            help="Path to baseline JSON file",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            dest="save_baseline",
+            help="Save results to the baseline JSON file instead of comparing against it",
+        )
+
+    def handle(self, *args, **options):
+        """Automatically called when the benchmarkresources command is given.
+
+        Raises:
+            CommandError: If a generator is slower than its baseline by more
+                than the threshold.
+        """
+        if options["combinations"] < 1 or options["repeat"] < 1:
+            raise CommandError("--combinations and --repeat must be at least 1.")
+
+        if options["generator_module"]:
+            generator_modules = [options["generator_module"]]
+        else:
+            generators_module = importlib.import_module(settings.RESOURCE_GENERATORS_PACKAGE)
+            generator_modules = get_generator_modules(generators_module)
+
+        results = dict()
+        for generator_module in generator_modules:
+            print("Benchmarking {}".format(generator_module))
+            combinations = get_representative_combinations(generator_module, options["combinations"])
+            results[generator_module] = benchmark_resource_generator(
+                generator_module,
+                combinations,
+                options["repeat"],
+            )
+
+        print(RESULT_HEADER_TEMPLATE.format(
+            "Generator",
+            "Combs",
+            "data()",
+            "Thumbnail",
+            "PDF",
+            "Pages/sec",
+            "Peak RSS KB",
+        ))
+        for (generator_module, generator_results) in sorted(results.items()):
+            print(RESULT_ROW_TEMPLATE.format(
+                generator_module[:40],
+                generator_results["combinations"],
+                generator_results["data"],
+                generator_results["thumbnail"],
+                generator_results["pdf"],
+                generator_results["pages_per_second"],
+                generator_results["peak_rss_kb"],
+            ))
+
+        baseline_path = options["baseline"]
+        if os.path.exists(baseline_path):
+            with open(baseline_path, encoding="UTF-8") as baseline_file:
+                baseline = json.load(baseline_file)
+        else:
+            baseline = dict()
+
+        if options["save_baseline"]:
+            baseline.update(results)
+            baseline_directory = os.path.dirname(baseline_path)
+            if baseline_directory and not os.path.exists(baseline_directory):
+                os.makedirs(baseline_directory)
+            with open(baseline_path, "w", encoding="UTF-8") as baseline_file:
+                json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+            print("Baseline saved to {}".format(baseline_path))
+            return
+
+        if not baseline:
+            print("No baseline found at {}, skipping comparison.".format(baseline_path))
+            return
+
+        regressions = find_benchmark_regressions(results, baseline, options["threshold"])
+        if regressions:
+            messages = [
+                REGRESSION_TEMPLATE.format(
+                    generator=generator_module,
+                    stage=stage,
+                    baseline=baseline_time,
+                    current=current_time,
+                )
+                for (generator_module, stage, baseline_time, current_time) in regressions
+            ]
+            raise CommandError(
+                "Resource generators slower than baseline by more than {:.0%}:\n{}".format(
+                    options["threshold"],
+                    "\n".join(messages),
+                )
+            )
+        print("No regressions beyond {:.0%} of baseline.".format(options["threshold"]))
@@ -3,6 +3,8 @@
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from utils.LoaderFactory import LoaderFactory
+from utils.content_version import update_content_version
+from utils.parse_yaml_file import parsed_yaml_files
 
 
 class Command(BaseCommand):
@@ -20,3 +22,6 @@ class Command(BaseCommand):
             structure_filename=resource_structure_file,
             base_path=base_path
         ).load()
+
+        update_content_version()
+        parsed_yaml_files.clear()
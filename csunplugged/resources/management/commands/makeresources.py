@@ -1,16 +1,33 @@
 """Module for the custom Django makeresources command."""
 
+import json
 import os
 import os.path
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from resource import getrusage, RUSAGE_SELF
 from urllib.parse import urlencode
 from tqdm import tqdm
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.http.request import QueryDict
 from django.conf import settings
 from resources.models import Resource
 from resources.utils.get_resource_generator import get_resource_generator
 from resources.utils.resource_valid_configurations import resource_valid_configurations
 from resources.utils.resource_parameters import EnumResourceParameter
+from resources.utils.resource_pdf_manifest import (
+    get_manifest_key,
+    create_manifest_entry,
+    write_manifest,
+)
+from resources.utils.resource_render_report import (
+    create_render_record,
+    write_render_report,
+    format_render_summary,
+)
+
+SHARD_PATTERN = re.compile(r"^(\d+)/(\d+)$")
 
 
 class Command(BaseCommand):
@@ -26,6 +43,18 @@ class Command(BaseCommand):
             default=None,
             help="The resource name to generate",
         )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            dest="resume",
+            help="Skip PDFs recorded as completed in the checkpoint file",
+        )
+        parser.add_argument(
+            "--shard",
+            dest="shard",
+            default="1/1",
+            help="Only generate the given portion of PDFs, in the form 'i/n' (for example '2/3')",
+        )
 
     def handle(self, *args, **options):
         """Automatically called when the makeresources command is given."""
@@ -33,32 +62,220 @@ class Command(BaseCommand):
         if not os.path.exists(base_path):
             os.makedirs(base_path)
 
+        (shard_number, shard_count) = parse_shard(options["shard"])
+
         if options["resource_name"]:
             resources = [Resource.objects.get(name=options["resource_name"])]
         else:
             resources = Resource.objects.order_by("name")
 
+        jobs = []
         for resource in resources:
-            print("Creating {}".format(resource.name))
-
-            # TODO: Import repeated in next for loop, check alternatives
-            empty_generator = get_resource_generator(resource.generator_module)
-            if not all([isinstance(option, EnumResourceParameter)
-                        for option in empty_generator.get_options().values()]):
-                raise TypeError("Only EnumResourceParameters are supported for pre-generation")
-            valid_options = {option.name: list(option.valid_values.keys())
-                             for option in empty_generator.get_options().values()}
-            combinations = resource_valid_configurations(valid_options)
-            progress_bar = tqdm(combinations, ascii=True)
-            # Create PDF for all possible combinations
-            for combination in progress_bar:
-                if resource.copies:
-                    combination["copies"] = settings.RESOURCE_COPY_AMOUNT
-                requested_options = QueryDict(urlencode(combination, doseq=True))
-                generator = get_resource_generator(resource.generator_module, requested_options)
-                (pdf_file, filename) = generator.pdf(resource.name)
-
-                filename = "{}.pdf".format(filename)
-                pdf_file_output = open(os.path.join(base_path, filename), "wb")
-                pdf_file_output.write(pdf_file)
-                pdf_file_output.close()
+            jobs += get_resource_jobs(resource)
+        # Deal jobs out in turn so each shard receives an even mix of resources
+        jobs = jobs[shard_number - 1::shard_count]
+
+        checkpoint_path = settings.RESOURCE_GENERATION_CHECKPOINT
+        if options["resume"]:
+            completed = read_checkpoint(checkpoint_path, base_path)
+        else:
+            completed = dict()
+            remove_from_checkpoint(checkpoint_path, set(job[1] for job in jobs))
+        checkpoint_directory = os.path.dirname(checkpoint_path)
+        if checkpoint_directory and not os.path.exists(checkpoint_directory):
+            os.makedirs(checkpoint_directory)
+
+        print("Creating {} of {} PDFs (shard {}/{})".format(
+            len([job for job in jobs if job[1] not in completed]),
+            len(jobs),
+            shard_number,
+            shard_count,
+        ))
+        records = []
+        manifest_files = dict()
+        # Imported before the worker process is started, so it is not imported again
+        import weasyprint  # noqa: F401
+        progress_bar = tqdm(jobs, ascii=True)
+        # PDFs are created in a worker process, so a crash while creating a
+        # PDF stops the command (allowing it to be resumed) instead of
+        # killing it without recording the completed PDFs
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            # Create PDF for all combinations in this shard
+            for (resource, key, requested_options) in progress_bar:
+                if key in completed:
+                    manifest_files[key] = completed[key]
+                    continue
+                progress_bar.set_description(key)
+                future = executor.submit(
+                    render_pdf,
+                    resource.generator_module,
+                    requested_options.urlencode(),
+                    resource.name,
+                )
+                try:
+                    (pdf_file, filename, render_profile, peak_rss_increase_kb) = future.result()
+                except BrokenProcessPool as e:
+                    raise CommandError(
+                        "Worker process stopped while creating {}, run again with --resume to continue.".format(key)
+                    ) from e
+
+                # Write to a temporary file first so an interrupted run never
+                # leaves behind a partial PDF that looks complete.
+                manifest_entry = create_manifest_entry(filename, pdf_file)
+                pdf_file_path = os.path.join(base_path, manifest_entry["path"])
+                os.makedirs(os.path.dirname(pdf_file_path), exist_ok=True)
+                temporary_file_path = "{}.tmp".format(pdf_file_path)
+                with open(temporary_file_path, "wb") as pdf_file_output:
+                    pdf_file_output.write(pdf_file)
+                os.replace(temporary_file_path, pdf_file_path)
+                manifest_files[key] = manifest_entry
+
+                with open(checkpoint_path, "a", encoding="UTF-8") as checkpoint_file:
+                    checkpoint_file.write("{}\n".format(json.dumps(dict(manifest_entry, key=key), sort_keys=True)))
+
+                records.append(create_render_record(
+                    resource.name,
+                    filename,
+                    render_profile,
+                    peak_rss_increase_kb,
+                    len(pdf_file),
+                ))
+
+        write_manifest(manifest_files, base_path, shard_number, shard_count)
+
+        report_path = settings.RESOURCE_GENERATION_REPORT
+        if shard_count > 1:
+            report_path = "{}-shard-{}-of-{}".format(report_path, shard_number, shard_count)
+        summary = write_render_report(records, report_path)
+        print("Timing report written to {}.json and {}.csv".format(report_path, report_path))
+        print(format_render_summary(summary))
+
+
+def render_pdf(generator_module, query_string, resource_name):
+    """Create PDF of a resource in the worker process.
+
+    The worker process creates every PDF, so the increase in its peak
+    resident set size shows how much a PDF raised the memory needed.
+
+    Args:
+        generator_module: Name of resource generator (str).
+        query_string: Requested options of resource, as a query string (str).
+        resource_name: Name of resource (str).
+
+    Returns:
+        Tuple of PDF file, filename, render profile of the generator, and
+        increase in peak resident set size of the worker process in kilobytes.
+    """
+    peak_rss_kb = getrusage(RUSAGE_SELF).ru_maxrss
+    generator = get_resource_generator(generator_module, QueryDict(query_string))
+    (pdf_file, filename) = generator.pdf(resource_name)
+    peak_rss_increase_kb = getrusage(RUSAGE_SELF).ru_maxrss - peak_rss_kb
+    return (pdf_file, filename, generator.render_profile, peak_rss_increase_kb)
+
+
+def parse_shard(shard):
+    """Parse the value of the shard option.
+
+    Args:
+        shard: Value given for the shard option, in the form 'i/n' (str).
+
+    Returns:
+        Tuple of shard number (starting at 1) and number of shards.
+
+    Raises:
+        CommandError: If the value is not a valid shard.
+    """
+    match = SHARD_PATTERN.match(shard)
+    if match:
+        shard_number = int(match.group(1))
+        shard_count = int(match.group(2))
+        if 1 <= shard_number <= shard_count:
+            return (shard_number, shard_count)
+    raise CommandError("Invalid shard '{}', expected the form 'i/n' where 1 <= i <= n.".format(shard))
+
+
+def get_resource_jobs(resource):
+    """Return all PDF generation jobs for a resource.
+
+    Args:
+        resource: Resource to create jobs for (Resource).
+
+    Returns:
+        List of tuples of resource, manifest key, and requested
+        options, in a consistent order.
+
+    Raises:
+        TypeError: If the resource generator has options that are not
+            EnumResourceParameters.
+    """
+    empty_generator = get_resource_generator(resource.generator_module)
+    if not all([isinstance(option, EnumResourceParameter)
+                for option in empty_generator.get_options().values()]):
+        raise TypeError("Only EnumResourceParameters are supported for pre-generation")
+    valid_options = {option.name: list(option.valid_values.keys())
+                     for option in empty_generator.get_options().values()}
+    jobs = []
+    for combination in resource_valid_configurations(valid_options):
+        if resource.copies:
+            combination["copies"] = settings.RESOURCE_COPY_AMOUNT
+        requested_options = QueryDict(urlencode(combination, doseq=True))
+        generator = get_resource_generator(resource.generator_module, requested_options)
+        jobs.append((resource, get_manifest_key(resource.slug, generator), requested_options))
+    return jobs
+
+
+def read_checkpoint(checkpoint_path, base_path):
+    """Return manifest entries recorded as completed in the checkpoint file.
+
+    Entries without a matching PDF in the output directory are ignored,
+    so removed files are generated again.
+
+    Args:
+        checkpoint_path: Path to checkpoint file (str).
+        base_path: Path to directory of generated PDFs (str).
+
+    Returns:
+        Dictionary of completed manifest entries, keyed by manifest key.
+    """
+    completed = dict()
+    for entry in read_checkpoint_entries(checkpoint_path):
+        if os.path.isfile(os.path.join(base_path, entry["path"])):
+            key = entry.pop("key")
+            completed[key] = entry
+    return completed
+
+
+def read_checkpoint_entries(checkpoint_path):
+    """Return all entries in the checkpoint file.
+
+    Args:
+        checkpoint_path: Path to checkpoint file (str).
+
+    Returns:
+        List of dictionaries of checkpoint entries.
+    """
+    entries = []
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path, encoding="UTF-8") as checkpoint_file:
+            for line in checkpoint_file:
+                if line.strip():
+                    entries.append(json.loads(line))
+    return entries
+
+
+def remove_from_checkpoint(checkpoint_path, keys):
+    """Remove entries with the given manifest keys from the checkpoint file.
+
+    Entries for other keys are kept, so shards sharing a checkpoint
+    file do not discard each other's progress.
+
+    Args:
+        checkpoint_path: Path to checkpoint file (str).
+        keys: Manifest keys to remove (set).
+    """
+    if os.path.exists(checkpoint_path):
+        entries = read_checkpoint_entries(checkpoint_path)
+        with open(checkpoint_path, "w", encoding="UTF-8") as checkpoint_file:
+            for entry in entries:
+                if entry["key"] not in keys:
+                    checkpoint_file.write("{}\n".format(json.dumps(entry, sort_keys=True)))
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.5 on 2026-10-19 09:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0011_auto_20171126_2001'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resource',
+            name='content_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='content_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='content_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='content_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+    ]
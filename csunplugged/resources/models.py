@@ -7,6 +7,8 @@ from utils.TranslatableModel import TranslatableModel
 class Resource(TranslatableModel):
     """Model for resource in database."""
 
+    rendered_html_fields = ("content",)
+
     #  Auto-incrementing 'id' field is automatically set by Django
     slug = models.SlugField(unique=True)
     name = models.CharField(max_length=200, default="")
@@ -14,6 +16,7 @@ class Resource(TranslatableModel):
     thumbnail_static_path = models.CharField(max_length=200)
     copies = models.BooleanField()
     content = models.TextField(default="")
+    content_rendered = models.TextField(default="")
 
     def __str__(self):
         """Text representation of Resource object.
@@ -7,9 +7,10 @@ from resources.models import Resource
 class ResourceTranslationOptions(TranslationOptions):
     """Translation options for Resource model."""
 
-    fields = ("name", "content")
+    fields = ("name", "content", "content_rendered")
     fallback_undefined = {
         "content": None,
+        "content_rendered": None,
     }
 
 
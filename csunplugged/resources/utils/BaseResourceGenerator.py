@@ -1,17 +1,22 @@
 """Class for generator for a resource."""
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from time import perf_counter
+from urllib.parse import urlencode
 from resources.utils.resize_encode_resource_images import resize_encode_resource_images
 from utils.errors.ThumbnailPageNotFoundError import ThumbnailPageNotFoundError
 from utils.errors.MoreThanOneThumbnailPageFoundError import MoreThanOneThumbnailPageFoundError
 from django.conf import settings
 from django.template.loader import render_to_string
 from django.contrib.staticfiles import finders
+from utils.bool_to_yes_no import bool_to_yes_no
 
 from resources.utils.resource_parameters import (
     EnumResourceParameter,
     TextResourceParameter,
     IntegerResourceParameter,
+    MultiValuedParameter,
 )
 
 from django.utils.translation import ugettext as _
@@ -26,6 +31,7 @@ class BaseResourceGenerator(ABC):
     """Class for generator for a resource."""
 
     copies = False  # Default
+    random_data = False  # Default, True if data() differs between calls
 
     def __init__(self, requested_options=None):
         """Construct BaseResourceGenerator instance.
@@ -37,6 +43,7 @@ class BaseResourceGenerator(ABC):
         self.options.update(self.get_local_options())
         if requested_options:
             self.process_requested_options(requested_options)
+        self.render_profile = dict()
 
     @classmethod
     def get_options(cls):
@@ -122,6 +129,46 @@ class BaseResourceGenerator(ABC):
         """
         return self.options["paper_size"].value
 
+    def get_options_key(self, include_local_options=True):
+        """Return canonical serialisation of the parsed options.
+
+        Options are sorted by name and values are converted back to
+        their query string form, so equivalent requests have the same
+        key regardless of the order of query parameters.
+
+        Args:
+            include_local_options: Include local options in the key (bool).
+
+        Returns:
+            Query string of option values (str).
+        """
+        option_names = set(self.options)
+        if not include_local_options:
+            option_names -= set(self.get_local_options())
+        values = []
+        for option_name in sorted(option_names):
+            option = self.options[option_name]
+            if isinstance(option, MultiValuedParameter):
+                option_values = option.values
+            else:
+                option_values = [option.value]
+            for value in option_values:
+                if value is not None:
+                    values.append((option_name, bool_to_yes_no(value)))
+        return urlencode(values)
+
+    @contextmanager
+    def record_time(self, stage):
+        """Add the time spent within the context to the render profile.
+
+        Args:
+            stage: Name of rendering stage being timed (str).
+        """
+        start = perf_counter()
+        yield
+        duration = perf_counter() - start
+        self.render_profile[stage] = self.render_profile.get(stage, 0) + duration
+
     def process_requested_options(self, requested_options):
         """Convert requested options to usable types.
 
@@ -151,12 +198,16 @@ class BaseResourceGenerator(ABC):
         Args:
             resource_name: Name of the resource (str).
 
+        The time spent in each stage of rendering, and the number of pages
+        created, are stored in the render_profile attribute.
+
         Return:
             PDF file of resource.
         """
         # Only import weasyprint when required as production environment
         # does not have it installed.
         from weasyprint import HTML, CSS
+        self.render_profile = dict()
         context = dict()
         context["resource"] = resource_name
         context["header_text"] = self.options["header_text"].value
@@ -168,24 +219,32 @@ class BaseResourceGenerator(ABC):
             num_copies = 1
         context["all_data"] = []
         for copy in range(num_copies):
-            copy_data = self.data()
+            with self.record_time("data"):
+                copy_data = self.data()
             if not isinstance(copy_data, list):
                 copy_data = [copy_data]
-            copy_data = resize_encode_resource_images(
-                self.options["paper_size"].value,
-                copy_data
-            )
+            with self.record_time("resize_encode_resource_images"):
+                copy_data = resize_encode_resource_images(
+                    self.options["paper_size"].value,
+                    copy_data
+                )
             context["all_data"].append(copy_data)
 
         filename = "{} ({})".format(resource_name, self.subtitle)
         context["filename"] = filename
 
-        pdf_html = render_to_string("resources/base-resource-pdf.html", context)
+        with self.record_time("render_template"):
+            pdf_html = render_to_string("resources/base-resource-pdf.html", context)
         html = HTML(string=pdf_html, base_url=settings.BUILD_ROOT)
         css_file = finders.find("css/print-resource-pdf.css")
         css_string = open(css_file, encoding="UTF-8").read()
         base_css = CSS(string=css_string)
-        return (html.write_pdf(stylesheets=[base_css]), filename)
+        with self.record_time("layout"):
+            document = html.render(stylesheets=[base_css])
+        with self.record_time("write_pdf"):
+            pdf_file = document.write_pdf()
+        self.render_profile["pages"] = len(document.pages)
+        return (pdf_file, filename)
 
     def save_thumbnail(self, resource_name, path):
         """Create thumbnail for resource request.
@@ -0,0 +1,176 @@
+"""Benchmark the speed of resource generators."""
+
+import os.path
+import tempfile
+from inspect import isabstract, isclass
+from multiprocessing import Pool
+from resource import getrusage, RUSAGE_SELF
+from time import perf_counter
+from urllib.parse import urlencode
+from django.http.request import QueryDict
+from resources.utils.BaseResourceGenerator import BaseResourceGenerator
+from resources.utils.get_resource_generator import get_resource_generator
+from resources.utils.resource_valid_configurations import resource_valid_configurations
+from resources.utils.resource_parameters import EnumResourceParameter
+
+BENCHMARK_STAGES = ["data", "thumbnail", "pdf"]
+# Differences smaller than this are treated as timing noise
+MINIMUM_REGRESSION_SECONDS = 0.01
+
+
+def get_generator_modules(generators_module):
+    """Return names of all resource generator classes in a module.
+
+    Args:
+        generators_module: Module containing resource generators (module).
+
+    Returns:
+        Sorted list of generator class names (list).
+    """
+    return sorted(
+        name for (name, value) in vars(generators_module).items()
+        if isclass(value) and issubclass(value, BaseResourceGenerator) and not isabstract(value)
+    )
+
+
+def get_representative_combinations(generator_module, count):
+    """Return a spread of valid option combinations for a resource generator.
+
+    Combinations are picked evenly across all valid combinations of
+    the generator's EnumResourceParameters, always including the first
+    and last combinations.
+
+    Args:
+        generator_module: Name of resource generator (str).
+        count: Maximum number of combinations to return (int).
+
+    Returns:
+        List of dictionaries of combinations (list).
+    """
+    empty_generator = get_resource_generator(generator_module)
+    valid_options = {option.name: list(option.valid_values.keys())
+                     for option in empty_generator.get_options().values()
+                     if isinstance(option, EnumResourceParameter)}
+    combinations = resource_valid_configurations(valid_options)
+    if len(combinations) <= count:
+        return combinations
+    if count == 1:
+        return combinations[:1]
+    step = (len(combinations) - 1) / (count - 1)
+    indices = sorted(set(round(step * index) for index in range(count)))
+    return [combinations[index] for index in indices]
+
+
+def time_call(function, repeat):
+    """Return the fastest duration of calling a function.
+
+    Args:
+        function: Function to call with no arguments (function).
+        repeat: Number of times to call the function (int).
+
+    Returns:
+        Fastest duration in seconds (float).
+    """
+    durations = []
+    for count in range(repeat):
+        start = perf_counter()
+        function()
+        durations.append(perf_counter() - start)
+    return min(durations)
+
+
+def benchmark_resource_generator(generator_module, combinations, repeat=1):
+    """Benchmark data, thumbnail, and PDF creation of a resource generator.
+
+    The generator is benchmarked in a new worker process, so the peak
+    resident set size of the process is only affected by this generator,
+    and not by generators benchmarked before it.
+
+    Args:
+        generator_module: Name of resource generator (str).
+        combinations: List of dictionaries of combinations to benchmark (list).
+        repeat: Number of times to time each stage, with the fastest
+            time being used (int).
+
+    Returns:
+        Dictionary of benchmark results, with the mean time in seconds
+        per combination for each stage, and the peak resident set size
+        of the worker process in kilobytes.
+    """
+    with Pool(1) as pool:
+        return pool.apply(run_benchmark, (generator_module, combinations, repeat))
+
+
+def run_benchmark(generator_module, combinations, repeat):
+    """Benchmark a resource generator in the current process.
+
+    Args:
+        generator_module: Name of resource generator (str).
+        combinations: List of dictionaries of combinations to benchmark (list).
+        repeat: Number of times to time each stage, with the fastest
+            time being used (int).
+
+    Returns:
+        Dictionary of benchmark results, with the mean time in seconds
+        per combination for each stage, and the peak resident set size
+        of the process in kilobytes.
+    """
+    totals = {stage: 0 for stage in BENCHMARK_STAGES}
+    pages = 0
+
+    with tempfile.TemporaryDirectory() as thumbnail_directory:
+        thumbnail_path = os.path.join(thumbnail_directory, "thumbnail.png")
+        for combination in combinations:
+            requested_options = QueryDict(urlencode(combination, doseq=True))
+            generator = get_resource_generator(generator_module, requested_options)
+            totals["data"] += time_call(generator.data, repeat)
+            totals["thumbnail"] += time_call(
+                lambda: generator.save_thumbnail(generator_module, thumbnail_path),
+                repeat
+            )
+            totals["pdf"] += time_call(lambda: generator.pdf(generator_module), repeat)
+            pages += generator.render_profile.get("pages", 0)
+
+    results = {"combinations": len(combinations), "pages": pages}
+    for stage in BENCHMARK_STAGES:
+        if combinations:
+            results[stage] = round(totals[stage] / len(combinations), 4)
+        else:
+            results[stage] = 0
+    if totals["pdf"]:
+        results["pages_per_second"] = round(pages / totals["pdf"], 4)
+    else:
+        results["pages_per_second"] = 0
+    results["peak_rss_kb"] = getrusage(RUSAGE_SELF).ru_maxrss
+    return results
+
+
+def find_benchmark_regressions(results, baseline, threshold):
+    """Compare benchmark results against baseline results.
+
+    Args:
+        results: Dictionary of benchmark results, keyed by generator
+            name (dict).
+        baseline: Dictionary of baseline benchmark results, keyed by
+            generator name (dict).
+        threshold: Allowed fractional increase over baseline time,
+            for example 0.2 allows 20% slower (float).
+
+    Returns:
+        List of tuples of generator name, stage, baseline time and
+        current time, for each stage slower than allowed.
+    """
+    regressions = []
+    for (generator_module, generator_results) in sorted(results.items()):
+        generator_baseline = baseline.get(generator_module)
+        if generator_baseline is None:
+            continue
+        for stage in BENCHMARK_STAGES:
+            baseline_time = generator_baseline.get(stage)
+            current_time = generator_results[stage]
+            if baseline_time is None:
+                continue
+            if (current_time > baseline_time * (1 + threshold) and
+                    current_time - baseline_time > MINIMUM_REGRESSION_SECONDS):
+                regressions.append((generator_module, stage, baseline_time, current_time))
+    return regressions
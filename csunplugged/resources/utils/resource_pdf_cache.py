@@ -1,19 +1,32 @@
 """Provide redirect to static resource file."""
 
 from django.conf import settings
+from django.http import Http404
 from django.shortcuts import redirect
+from resources.utils.resource_pdf_manifest import get_manifest_key, load_manifest
 
 
-def resource_pdf_cache(name, generator):
+def resource_pdf_cache(resource, generator):
     """Provide redirect to static resource file.
 
+    The file is found in the manifest of pre-generated PDFs, rather than
+    guessing the filename from the generator subtitle.
+
     Args:
-        name: Name of resource to be created (str).
+        resource: Resource object to be created (Resource).
         generator: Instance of specific resource generator class.
 
     Returns:
         HTTP redirect.
+
+    Raises:
+        Http404: If the manifest cannot be loaded or does not contain
+            the requested PDF.
     """
-    filename = "{} ({})".format(name, generator.subtitle)
-    redirect_url = "{}resources/{}.pdf".format(settings.STATIC_URL, filename)
+    key = get_manifest_key(resource.slug, generator)
+    try:
+        entry = load_manifest(settings.RESOURCE_PDF_MANIFEST_LOCATION)[key]
+    except (OSError, ValueError, KeyError):
+        raise Http404("Resource PDF '{}' has not been generated.".format(key))
+    redirect_url = "{}resources/{}".format(settings.STATIC_URL, entry["path"])
     return redirect(redirect_url)
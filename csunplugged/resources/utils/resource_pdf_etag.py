@@ -0,0 +1,106 @@
+"""Entity tags for generated resource PDF files."""
+
+import hashlib
+import inspect
+from django.contrib.staticfiles import finders
+from django.template.loader import get_template
+from django.utils.http import parse_etags
+from config import __version__
+from resources.utils.BaseResourceGenerator import BaseResourceGenerator
+
+ETAG_CACHE_KEY_TEMPLATE = "resource-pdf-etag:{version}:{source_hash}:{key}"
+PDF_TEMPLATE = "resources/base-resource-pdf.html"
+PDF_STYLESHEET = "css/print-resource-pdf.css"
+
+
+def get_pdf_etag(pdf_file):
+    """Return strong entity tag for the contents of a PDF file.
+
+    Args:
+        pdf_file: Contents of PDF file (bytes).
+
+    Returns:
+        Quoted entity tag (str).
+    """
+    return '"{}"'.format(hashlib.sha256(pdf_file).hexdigest())
+
+
+def get_resource_key(resource_slug, generator, include_local_options=True):
+    """Return key identifying a resource PDF for the generator's options.
+
+    Equivalent requests produce the same key, regardless of the order of
+    query parameters.
+
+    Args:
+        resource_slug: Slug of resource (str).
+        generator: Instance of specific resource generator class.
+        include_local_options: Include local options in the key (bool).
+
+    Returns:
+        Resource key (str).
+    """
+    return "{}?{}".format(resource_slug, generator.get_options_key(include_local_options))
+
+
+def get_generator_source_hash(generator):
+    """Return hash of the source files used to render a generator's PDFs.
+
+    This includes the modules of the generator class and its base classes,
+    the PDF template, and the PDF stylesheet.
+
+    Args:
+        generator: Instance of specific resource generator class.
+
+    Returns:
+        Hex digest of source files (str).
+    """
+    source_paths = [
+        inspect.getsourcefile(generator_class)
+        for generator_class in type(generator).__mro__
+        if issubclass(generator_class, BaseResourceGenerator)
+    ]
+    source_paths.append(get_template(PDF_TEMPLATE).origin.name)
+    source_paths.append(finders.find(PDF_STYLESHEET))
+    source_hash = hashlib.sha256()
+    for source_path in source_paths:
+        with open(source_path, "rb") as source_file:
+            source_hash.update(source_file.read())
+    return source_hash.hexdigest()
+
+
+def get_etag_cache_key(resource_key, source_hash):
+    """Return cache key for storing the entity tag of a resource PDF.
+
+    The key includes the website version and a hash of the generator's
+    source files, so entity tags from previous versions of the generator
+    are not reused.
+
+    Args:
+        resource_key: Resource key from get_resource_key (str).
+        source_hash: Hash from get_generator_source_hash (str).
+
+    Returns:
+        Cache key (str).
+    """
+    return ETAG_CACHE_KEY_TEMPLATE.format(version=__version__, source_hash=source_hash, key=resource_key)
+
+
+def etag_matches_request(request, etag):
+    """Return whether the request's If-None-Match header matches the entity tag.
+
+    Uses the weak comparison required for If-None-Match.
+
+    Args:
+        request: HttpRequest object.
+        etag: Quoted entity tag (str).
+
+    Returns:
+        True if the header matches, otherwise False (bool).
+    """
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if not if_none_match:
+        return False
+    requested_etags = parse_etags(if_none_match)
+    if "*" in requested_etags:
+        return True
+    return any(requested_etag.replace("W/", "", 1) == etag for requested_etag in requested_etags)
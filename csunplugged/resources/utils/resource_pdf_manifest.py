@@ -0,0 +1,153 @@
+"""Manifest of pre-generated resource PDF files."""
+
+import json
+import os
+import os.path
+import time
+from urllib.parse import urljoin
+from urllib.request import urlopen
+from django.conf import settings
+from resources.utils.resource_pdf_etag import get_pdf_etag, get_resource_key
+
+MANIFEST_FILENAME_TEMPLATE = "manifest-{}.json"
+HASH_DIRECTORY_LENGTH = 16
+
+# Loaded manifests, keyed by location, as tuples of expiry time and
+# manifest entries (or None if the manifest could not be loaded)
+loaded_manifests = dict()
+
+
+def get_manifest_key(resource_slug, generator):
+    """Return the manifest key for a resource generator's options.
+
+    The key only contains options that are pre-generated (not local
+    options), in canonical order.
+
+    Args:
+        resource_slug: Slug of resource (str).
+        generator: Instance of specific resource generator class.
+
+    Returns:
+        Manifest key (str).
+    """
+    return get_resource_key(resource_slug, generator, include_local_options=False)
+
+
+def create_manifest_entry(filename, pdf_file):
+    """Return manifest entry for a generated PDF file.
+
+    The file is stored in a directory named after the hash of its
+    content, so each version of a file has a unique path.
+
+    Args:
+        filename: Filename of PDF, without extension (str).
+        pdf_file: Contents of PDF file (bytes).
+
+    Returns:
+        Dictionary containing the path, size, and ETag of the file.
+    """
+    etag = get_pdf_etag(pdf_file)
+    content_hash = etag.strip('"')
+    return {
+        "path": "{}/{}.pdf".format(content_hash[:HASH_DIRECTORY_LENGTH], filename),
+        "size": len(pdf_file),
+        "etag": etag,
+    }
+
+
+def write_manifest(files, base_path, shard_number=1, shard_count=1):
+    """Write manifest file for a shard of generated PDFs.
+
+    Entries already in the manifest file for the shard are kept,
+    unless replaced by a new entry with the same key.
+
+    Args:
+        files: Dictionary of manifest entries, keyed by manifest key (dict).
+        base_path: Path to directory of generated PDFs (str).
+        shard_number: Number of shard, starting at 1 (int).
+        shard_count: Number of shards (int).
+    """
+    manifest_path = os.path.join(base_path, MANIFEST_FILENAME_TEMPLATE.format(shard_number))
+    manifest_files = dict()
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="UTF-8") as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest.get("shards") == shard_count:
+            manifest_files = manifest["files"]
+    manifest_files.update(files)
+    manifest = {
+        "shard": shard_number,
+        "shards": shard_count,
+        "files": manifest_files,
+    }
+    with open(manifest_path, "w", encoding="UTF-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+
+def read_manifest_file(location, filename):
+    """Read a manifest file from a directory or URL.
+
+    Args:
+        location: Directory path or URL containing manifest files (str).
+        filename: Name of manifest file (str).
+
+    Returns:
+        Dictionary of manifest file contents.
+    """
+    if location.startswith(("http://", "https://")):
+        url = urljoin(location, filename)
+        with urlopen(url, timeout=settings.RESOURCE_PDF_MANIFEST_REQUEST_TIMEOUT) as response:
+            return json.loads(response.read().decode("UTF-8"))
+    else:
+        with open(os.path.join(location, filename), encoding="UTF-8") as manifest_file:
+            return json.load(manifest_file)
+
+
+def read_manifest(location):
+    """Read and merge the manifest files of all shards.
+
+    Args:
+        location: Directory path or URL containing manifest files (str).
+
+    Returns:
+        Dictionary of manifest entries, keyed by manifest key.
+    """
+    first_manifest = read_manifest_file(location, MANIFEST_FILENAME_TEMPLATE.format(1))
+    files = dict(first_manifest["files"])
+    for shard_number in range(2, first_manifest["shards"] + 1):
+        manifest = read_manifest_file(location, MANIFEST_FILENAME_TEMPLATE.format(shard_number))
+        files.update(manifest["files"])
+    return files
+
+
+def load_manifest(location):
+    """Load the merged manifest of all shards.
+
+    The manifest is kept for RESOURCE_PDF_MANIFEST_CACHE_TIMEOUT seconds,
+    so newly generated PDFs are found without restarting the process.
+    If the manifest cannot be loaded, it is not read again for
+    RESOURCE_PDF_MANIFEST_ERROR_CACHE_TIMEOUT seconds, so requests are
+    not held up while the manifest is unavailable.
+
+    Args:
+        location: Directory path or URL containing manifest files (str).
+
+    Returns:
+        Dictionary of manifest entries, keyed by manifest key.
+
+    Raises:
+        OSError: If the manifest cannot be loaded.
+    """
+    now = time.monotonic()
+    (expiry, files) = loaded_manifests.get(location, (now, None))
+    if expiry > now:
+        if files is None:
+            raise OSError("Resource PDF manifest at '{}' is unavailable.".format(location))
+        return files
+    try:
+        files = read_manifest(location)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        loaded_manifests[location] = (now + settings.RESOURCE_PDF_MANIFEST_ERROR_CACHE_TIMEOUT, None)
+        raise OSError("Resource PDF manifest at '{}' could not be loaded.".format(location)) from e
+    loaded_manifests[location] = (now + settings.RESOURCE_PDF_MANIFEST_CACHE_TIMEOUT, files)
+    return files
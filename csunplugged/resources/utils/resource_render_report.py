@@ -0,0 +1,130 @@
+"""Create timing reports for generated resources."""
+
+import csv
+import json
+import os
+import os.path
+
+RENDER_STAGES = [
+    "data",
+    "resize_encode_resource_images",
+    "render_template",
+    "layout",
+    "write_pdf",
+]
+RECORD_FIELDS = ["resource", "filename"] + RENDER_STAGES + ["total", "pages", "peak_rss_increase_kb", "size_bytes"]
+SUMMARY_HEADER_TEMPLATE = "{:<30} {:>6} {:>10} {:>7} {:>10} {:>12}"
+SUMMARY_ROW_TEMPLATE = "{:<30} {:>6} {:>10.2f} {:>7} {:>10.2f} {:>12}"
+
+
+def create_render_record(resource_name, filename, render_profile, peak_rss_increase_kb, size_bytes):
+    """Create a timing record for a single generated PDF.
+
+    Args:
+        resource_name: Name of resource (str).
+        filename: Filename of generated PDF, without extension (str).
+        render_profile: Render profile of the resource generator (dict).
+        peak_rss_increase_kb: Increase in the peak resident set size of the
+            process while creating the PDF, in kilobytes (int).
+        size_bytes: Size of the generated PDF in bytes (int).
+
+    Returns:
+        Dictionary of timing record.
+    """
+    record = {
+        "resource": resource_name,
+        "filename": filename,
+        "pages": render_profile.get("pages", 0),
+        "peak_rss_increase_kb": peak_rss_increase_kb,
+        "size_bytes": size_bytes,
+    }
+    for stage in RENDER_STAGES:
+        record[stage] = round(render_profile.get(stage, 0), 4)
+    record["total"] = round(sum(render_profile.get(stage, 0) for stage in RENDER_STAGES), 4)
+    return record
+
+
+def summarise_render_records(records):
+    """Summarise timing records per resource.
+
+    Args:
+        records: List of timing records (list).
+
+    Returns:
+        List of summary dictionaries, one per resource, sorted by
+        descending total time.
+    """
+    summaries = dict()
+    for record in records:
+        summary = summaries.setdefault(
+            record["resource"],
+            {
+                "resource": record["resource"],
+                "pdfs": 0,
+                "total": 0,
+                "pages": 0,
+                "peak_rss_increase_kb": 0,
+                "size_bytes": 0,
+            }
+        )
+        summary["pdfs"] += 1
+        summary["total"] += record["total"]
+        summary["pages"] += record["pages"]
+        summary["peak_rss_increase_kb"] = max(summary["peak_rss_increase_kb"], record["peak_rss_increase_kb"])
+        summary["size_bytes"] += record["size_bytes"]
+    for summary in summaries.values():
+        summary["total"] = round(summary["total"], 4)
+        if summary["total"]:
+            summary["pages_per_second"] = round(summary["pages"] / summary["total"], 4)
+        else:
+            summary["pages_per_second"] = 0
+    return sorted(summaries.values(), key=lambda summary: (-summary["total"], summary["resource"]))
+
+
+def write_render_report(records, report_path):
+    """Write timing records and summary as JSON and CSV files.
+
+    Creates '<report_path>.json' containing records and summary, and
+    '<report_path>.csv' containing records.
+
+    Args:
+        records: List of timing records (list).
+        report_path: Path to report files, without extension (str).
+
+    Returns:
+        List of summary dictionaries, sorted by descending total time.
+    """
+    report_directory = os.path.dirname(report_path)
+    if report_directory and not os.path.exists(report_directory):
+        os.makedirs(report_directory)
+
+    summary = summarise_render_records(records)
+    with open("{}.json".format(report_path), "w", encoding="UTF-8") as json_file:
+        json.dump({"summary": summary, "records": records}, json_file, indent=2)
+    with open("{}.csv".format(report_path), "w", encoding="UTF-8", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=RECORD_FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+    return summary
+
+
+def format_render_summary(summary):
+    """Format summary of timing records as a text table.
+
+    Args:
+        summary: List of summary dictionaries (list).
+
+    Returns:
+        Text table of summary (str).
+    """
+    lines = [SUMMARY_HEADER_TEMPLATE.format("Resource", "PDFs", "Seconds", "Pages", "Pages/sec", "Peak RSS +KB")]
+    for row in summary:
+        lines.append(SUMMARY_ROW_TEMPLATE.format(
+            row["resource"][:30],
+            row["pdfs"],
+            row["total"],
+            row["pages"],
+            row["pages_per_second"],
+            row["peak_rss_increase_kb"],
+        ))
+    return "\n".join(lines)
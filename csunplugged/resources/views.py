@@ -1,11 +1,19 @@
 """Views for the resource application."""
 
 from django.conf import settings
-from django.http import HttpResponse, Http404
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified, Http404
 from django.shortcuts import get_object_or_404, render
 from django.views import generic
 from resources.models import Resource
 from resources.utils.resource_pdf_cache import resource_pdf_cache
+from resources.utils.resource_pdf_etag import (
+    get_pdf_etag,
+    get_resource_key,
+    get_generator_source_hash,
+    get_etag_cache_key,
+    etag_matches_request,
+)
 from resources.utils.get_options_html import get_options_html
 from utils.group_lessons_by_age import group_lessons_by_age
 from resources.utils.get_resource_generator import get_resource_generator
@@ -81,9 +89,55 @@ def generate_resource(request, resource_slug):
         # Return cached static PDF file of resource.
         # Currently developing system for dynamically rendering
         # custom PDFs on request (https://github.com/uccser/render).
-        return resource_pdf_cache(resource.name, generator)
+        return resource_pdf_cache(resource, generator)
+    elif generator.random_data:
+        # Each render contains different data, so the PDF has no entity tag
+        (pdf_file, filename) = generator.pdf(resource.name)
+        return pdf_response(pdf_file, filename)
     else:
+        # The entity tag of a previous render is cached, so repeated
+        # requests for an unchanged PDF skip rendering it again.
+        etag_cache_key = get_etag_cache_key(
+            get_resource_key(resource.slug, generator),
+            get_generator_source_hash(generator),
+        )
+        etag = cache.get(etag_cache_key)
+        if etag and etag_matches_request(request, etag):
+            return not_modified_response(etag)
         (pdf_file, filename) = generator.pdf(resource.name)
-        response = HttpResponse(pdf_file, content_type="application/pdf")
-        response["Content-Disposition"] = RESPONSE_CONTENT_DISPOSITION.format(filename=filename)
+        etag = get_pdf_etag(pdf_file)
+        cache.set(etag_cache_key, etag, settings.RESOURCE_PDF_ETAG_CACHE_TIMEOUT)
+        if etag_matches_request(request, etag):
+            return not_modified_response(etag)
+        response = pdf_response(pdf_file, filename)
+        response["ETag"] = etag
         return response
+
+
+def pdf_response(pdf_file, filename):
+    """Return response containing a PDF file.
+
+    Args:
+        pdf_file: Contents of PDF file (bytes).
+        filename: Filename of PDF, without extension (str).
+
+    Returns:
+        HTTP response containing PDF.
+    """
+    response = HttpResponse(pdf_file, content_type="application/pdf")
+    response["Content-Disposition"] = RESPONSE_CONTENT_DISPOSITION.format(filename=filename)
+    return response
+
+
+def not_modified_response(etag):
+    """Return response for a PDF the client already has.
+
+    Args:
+        etag: Entity tag of the PDF (str).
+
+    Returns:
+        HTTP 304 response.
+    """
+    response = HttpResponseNotModified()
+    response["ETag"] = etag
+    return response
@@ -1,10 +1,41 @@
 /** JavaScript to load on each page of website */
+var glossary_definitions = {};
+
 $(document).ready(function() {
   $("#content-container, #glossary-modal").on("click", ".glossary-term", open_glossary_definition);
+  load_glossary_definitions();
   $("body").scrollspy({ target: "#scrollspy-table-of-contents", offset: 140});
   window.addEventListener("hashchange", function() { scrollBy(0, -72) })
 });
 
+function load_glossary_definitions() {
+  /**
+   * Retrieve all glossary definitions used on the page in one request.
+   */
+  var slugs = [];
+  $("#content-container .glossary-term").each(function() {
+    var slug = $(this).data("glossary-term");
+    if (slugs.indexOf(slug) == -1) {
+      slugs.push(slug);
+    }
+  });
+  if (slugs.length > 0) {
+    // Sorted so each page's request can be cached
+    slugs.sort();
+    $.ajax({
+      type: "GET",
+      url: glossary_url,
+      data: "terms=" + slugs.join(","),
+      async: true,
+      cache: true,
+      dataType: "json",
+      success: function(data) {
+        $.extend(glossary_definitions, data.terms);
+      },
+    });
+  }
+}
+
 function open_glossary_definition() {
   /**
    * Retrieve glossary definition.
@@ -15,7 +46,9 @@ function open_glossary_definition() {
   }
 
   var slug = $(this).data("glossary-term");
-  if (glossary_modal.attr("data-glossary-term") != slug) {
+  if (glossary_modal.attr("data-glossary-term") != slug && slug in glossary_definitions) {
+    update_glossary_modal(glossary_definitions[slug]);
+  } else if (glossary_modal.attr("data-glossary-term") != slug) {
     // TODO: Allow code to work for different languages
     $("#glossary-modal-term").text("Loading glossary definition...");
     $("#glossary-modal-definition").html("");
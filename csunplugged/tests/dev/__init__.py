@@ -0,0 +1 @@
+"""Module for tests of the dev application."""
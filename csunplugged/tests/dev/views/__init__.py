@@ -0,0 +1 @@
+"""Module for tests of the views in the dev application."""
@@ -0,0 +1,82 @@
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from tests.BaseTestWithDB import BaseTestWithDB
+from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
+from dev.views import IndexView
+
+
+class IndexViewTest(BaseTestWithDB):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.language = "en"
+        self.test_data = TopicsTestDataGenerator()
+
+    def setUp(self):
+        super().setUp()
+        self.difficulty = self.test_data.create_difficulty_level(1)
+        self.age_group = self.test_data.create_age_group(5, 7)
+        self.parent_area = self.test_data.create_curriculum_area(1)
+
+    def render_index(self):
+        # The dev application is only routed when DEBUG is enabled,
+        # so the view is called directly with a routed path.
+        request = RequestFactory().get("/en/topics/")
+        request.user = AnonymousUser()
+        response = IndexView.as_view()(request)
+        response.render()
+        return response
+
+    def create_topic_content(self, number):
+        topic = self.test_data.create_topic(number)
+        unit_plan = self.test_data.create_unit_plan(topic, number)
+        lesson = self.test_data.create_lesson(topic, unit_plan, number, self.age_group)
+        area = self.test_data.create_curriculum_area(number + 1, self.parent_area)
+        self.test_data.create_integration(topic, number, [lesson], [area])
+        challenge = self.test_data.create_programming_challenge(topic, number, self.difficulty)
+        self.test_data.add_challenge_lesson_relationship(challenge, lesson, 1, number)
+        self.test_data.create_programming_challenge_implementation(
+            topic,
+            self.test_data.create_programming_language(number),
+            challenge,
+        )
+        learning_outcome = self.test_data.create_learning_outcome(number)
+        learning_outcome.curriculum_areas.add(area)
+
+    def test_index_view_grouped_lessons(self):
+        self.create_topic_content(1)
+        self.create_topic_content(2)
+        response = self.render_index()
+        topics = response.context_data["topics"]
+        self.assertEqual([topic.slug for topic in topics], ["topic-1", "topic-2"])
+        for (number, topic) in enumerate(topics, start=1):
+            unit_plan = topic.units[0]
+            self.assertEqual(
+                [lesson.slug for lesson in unit_plan.grouped_lessons[self.age_group]],
+                ["lesson-{}".format(number)]
+            )
+            self.assertEqual(len(topic.integrations), 1)
+            self.assertEqual(len(topic.ordered_programming_challenges), 1)
+
+    def test_index_view_curriculum_areas(self):
+        self.create_topic_content(1)
+        self.create_topic_content(2)
+        response = self.render_index()
+        self.assertEqual(
+            [(parent.slug, [child.slug for child in children])
+                for (parent, children) in response.context_data["curriculum_areas"]],
+            [("area-1", ["area-2", "area-3"])]
+        )
+
+    def test_index_view_query_count_independent_of_content(self):
+        self.create_topic_content(1)
+        with CaptureQueriesContext(connection) as one_topic_queries:
+            self.render_index()
+        for number in range(2, 5):
+            self.create_topic_content(number)
+        with CaptureQueriesContext(connection) as many_topic_queries:
+            response = self.render_index()
+        self.assertEqual(len(response.context_data["topics"]), 4)
+        self.assertEqual(len(one_topic_queries), len(many_topic_queries))
@@ -1,8 +1,14 @@
 """Module for the testing custom Django commands."""
 
+from unittest.mock import patch
+from django.conf import settings
 from tests.BaseTestWithDB import BaseTestWithDB
 from django.core import management
-from django.test import tag
+from django.test import tag, override_settings
+from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
+from general.models import ContentHash
+from topics.models import CurriculumIntegration, GlossaryTerm, Topic
+from utils.content_version import calculate_content_revision, get_content_version, update_content_version
 
 
 @tag("management")
@@ -11,6 +17,83 @@ class ManagementCommandTest(BaseTestWithDB):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.language = "en"
+        self.test_data = TopicsTestDataGenerator()
 
     def test_updatedata_command(self):
         management.call_command("updatedata")
+
+    def test_updatedata_command_records_content_revision(self):
+        management.call_command("updatedata")
+        revision = calculate_content_revision(
+            settings.RESOURCES_CONTENT_BASE_PATH,
+            settings.TOPICS_CONTENT_BASE_PATH,
+        )
+        self.assertEqual(get_content_version(), revision)
+
+    def test_updatedata_command_incremental_empty_database(self):
+        management.call_command("updatedata", incremental=True)
+        self.assertTrue(Topic.objects.exists())
+        self.assertTrue(ContentHash.objects.filter(name="shared").exists())
+
+    def test_updatedata_command_incremental_unchanged(self):
+        management.call_command("updatedata")
+        topic_ids = set(Topic.objects.values_list("id", flat=True))
+        with self.assertNumQueries(1):
+            management.call_command("updatedata", incremental=True)
+        self.assertEqual(set(Topic.objects.values_list("id", flat=True)), topic_ids)
+
+    def test_updatedata_command_incremental_changed_topic(self):
+        management.call_command("updatedata")
+        changed_topic = Topic.objects.order_by("slug").first()
+        unchanged_topic_ids = set(Topic.objects.exclude(id=changed_topic.id).values_list("id", flat=True))
+        glossary_term_ids = set(GlossaryTerm.objects.values_list("id", flat=True))
+        ContentHash.objects.filter(name="topic:{}".format(changed_topic.slug)).update(content_hash="old")
+        update_content_version("old")
+        management.call_command("updatedata", incremental=True)
+        reloaded_topic = Topic.objects.get(slug=changed_topic.slug)
+        self.assertNotEqual(reloaded_topic.id, changed_topic.id)
+        self.assertTrue(reloaded_topic.unit_plans.exists())
+        self.assertTrue(unchanged_topic_ids.issubset(set(Topic.objects.values_list("id", flat=True))))
+        self.assertEqual(set(GlossaryTerm.objects.values_list("id", flat=True)), glossary_term_ids)
+        self.assertNotEqual(get_content_version(), "old")
+
+    def test_updatedata_command_incremental_removed_topic(self):
+        management.call_command("updatedata")
+        self.test_data.create_topic(1)
+        update_content_version("old")
+        management.call_command("updatedata", incremental=True)
+        self.assertFalse(Topic.objects.filter(slug="topic-1").exists())
+
+    def test_updatedata_command_incremental_changed_shared_content(self):
+        management.call_command("updatedata")
+        glossary_term_ids = set(GlossaryTerm.objects.values_list("id", flat=True))
+        ContentHash.objects.filter(name="shared").update(content_hash="old")
+        update_content_version("old")
+        management.call_command("updatedata", incremental=True)
+        self.assertTrue(GlossaryTerm.objects.exists())
+        self.assertFalse(GlossaryTerm.objects.filter(id__in=glossary_term_ids).exists())
+
+    def test_updatedata_command_incremental_changed_version(self):
+        management.call_command("updatedata")
+        revision = get_content_version()
+        topic_ids = set(Topic.objects.values_list("id", flat=True))
+        with patch("utils.content_version.__version__", "0.0.0-test"):
+            management.call_command("updatedata", incremental=True)
+        self.assertNotEqual(get_content_version(), revision)
+        self.assertTrue(Topic.objects.exists())
+        self.assertFalse(Topic.objects.filter(id__in=topic_ids).exists())
+
+    @override_settings(STATIC_URL="/static-new/")
+    def test_renderhtmlfields_command(self):
+        topic = self.test_data.create_topic(1)
+        integration = CurriculumIntegration.objects.create(
+            topic=topic,
+            slug="integration-1",
+            number=1,
+            name="1",
+            content="<img src='{% static 'img/logo-small.png' %}'>",
+            content_rendered="<img src='/staticfiles/img/logo-small.png'>",
+        )
+        management.call_command("renderhtmlfields")
+        integration.refresh_from_db()
+        self.assertHTMLEqual(integration.content_rendered, "<img src='/static-new/img/logo-small.png'>")
@@ -0,0 +1 @@
+"""Module for tests of the middleware in the general application."""
@@ -0,0 +1,90 @@
+from http import HTTPStatus
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils.http import http_date
+from tests.BaseTestWithDB import BaseTestWithDB
+from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
+from config.middleware.content_conditional_get import get_content_etag
+from utils.content_version import update_content_version
+
+
+class ContentConditionalGetMiddlewareTest(BaseTestWithDB):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.language = "en"
+        self.test_data = TopicsTestDataGenerator()
+
+    def tearDown(self):
+        cache.clear()
+        super().tearDown()
+
+    def test_content_conditional_get_headers(self):
+        update_content_version("abc")
+        url = reverse("topics:index")
+        response = self.client.get(url)
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        self.assertEqual(response["ETag"], get_content_etag("abc", "en", url))
+        self.assertFalse(response.has_header("Last-Modified"))
+
+    def test_content_conditional_get_no_content_version(self):
+        response = self.client.get(reverse("topics:index"))
+        self.assertFalse(response.has_header("ETag"))
+        self.assertFalse(response.has_header("Last-Modified"))
+
+    def test_content_conditional_get_if_none_match(self):
+        update_content_version()
+        url = reverse("topics:index")
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(HTTPStatus.NOT_MODIFIED, response.status_code)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_content_conditional_get_if_modified_since_ignored(self):
+        update_content_version()
+        response = self.client.get(reverse("topics:index"), HTTP_IF_MODIFIED_SINCE=http_date())
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+    def test_content_conditional_get_new_content_version(self):
+        update_content_version()
+        url = reverse("topics:index")
+        etag = self.client.get(url)["ETag"]
+        update_content_version()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_content_conditional_get_new_website_version(self):
+        update_content_version()
+        url = reverse("topics:index")
+        etag = self.client.get(url)["ETag"]
+        with patch("config.middleware.content_conditional_get.__version__", "0.0.0-test"):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_content_conditional_get_etag_per_language(self):
+        update_content_version()
+        english_etag = self.client.get("/en/topics/")["ETag"]
+        self.assertNotEqual(english_etag, self.client.get("/de/topics/")["ETag"])
+
+    def test_content_conditional_get_etag_per_query_string(self):
+        self.assertNotEqual(
+            get_content_etag("abc", "en", "/en/topics/glossary/json/?term=a"),
+            get_content_etag("abc", "en", "/en/topics/glossary/json/?term=b"),
+        )
+
+    @override_settings(CONTENT_CONDITIONAL_GET_EXCLUDED_VIEWS=["topics:index"])
+    def test_content_conditional_get_excluded_view(self):
+        update_content_version()
+        response = self.client.get(reverse("topics:index"))
+        self.assertFalse(response.has_header("ETag"))
+        self.assertFalse(response.has_header("Last-Modified"))
+
+    def test_content_conditional_get_health_check(self):
+        update_content_version()
+        response = self.client.get("/_ah/health")
+        self.assertFalse(response.has_header("ETag"))
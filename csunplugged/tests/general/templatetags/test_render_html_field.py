@@ -1,9 +1,11 @@
 from django import template
+from django.test import override_settings
 
 from tests.BaseTestWithDB import BaseTestWithDB
 from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
 
 from topics.models import CurriculumIntegration
+from config.templatetags.render_html_field import compile_html_with_static, render_html_with_static
 
 
 class RenderHTMLFieldTest(BaseTestWithDB):
@@ -108,3 +110,53 @@ class RenderHTMLFieldTest(BaseTestWithDB):
             context
         )
         self.assertHTMLEqual(rendered, "")
+
+    def test_render_html_field_compiled_once(self):
+        compile_html_with_static.cache_clear()
+        html = "<img src='{% static 'img/logo-small.png' %}'>"
+        self.assertHTMLEqual(render_html_with_static(html), "<img src='/staticfiles/img/logo-small.png'>")
+        self.assertHTMLEqual(render_html_with_static(html), "<img src='/staticfiles/img/logo-small.png'>")
+        cache_info = compile_html_with_static.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 1)
+
+    @override_settings(STATIC_URL="/static-new/")
+    def test_render_html_field_compiled_static_url_changed(self):
+        html = "<img src='{% static 'img/logo-small.png' %}'>"
+        compile_html_with_static(html)
+        self.assertHTMLEqual(render_html_with_static(html), "<img src='/static-new/img/logo-small.png'>")
+
+    def test_render_stored_html_field(self):
+        topic = self.test_data.create_topic(1)
+        integration = CurriculumIntegration.objects.create(
+            topic=topic,
+            slug="slug-2",
+            number=2,
+            name="2",
+            content="<img src='{% static 'img/logo-small.png' %}'>",
+            content_rendered="<img src='/stored/img/logo-small.png'>",
+        )
+        context = {"integration": integration}
+        rendered = self.render_template(
+            "{% load render_html_field %}\n"
+            "{% render_stored_html_field integration.content_rendered integration.content %}",
+            context
+        )
+        self.assertHTMLEqual(rendered, "<img src='/stored/img/logo-small.png'>")
+
+    def test_render_stored_html_field_not_stored(self):
+        topic = self.test_data.create_topic(1)
+        integration = CurriculumIntegration.objects.create(
+            topic=topic,
+            slug="slug-2",
+            number=2,
+            name="2",
+            content="<img src='{% static 'img/logo-small.png' %}'>",
+        )
+        context = {"integration": integration}
+        rendered = self.render_template(
+            "{% load render_html_field %}\n"
+            "{% render_stored_html_field integration.content_rendered integration.content %}",
+            context
+        )
+        self.assertHTMLEqual(rendered, "<img src='/staticfiles/img/logo-small.png'>")
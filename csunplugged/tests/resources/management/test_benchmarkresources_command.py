@@ -0,0 +1,68 @@
+"""Module for the testing custom Django benchmarkresources command."""
+
+from tests.BaseTest import BaseTest
+from django.core import management
+from django.core.management.base import CommandError
+from django.test import tag, override_settings
+import json
+import os
+import os.path
+import shutil
+
+BENCHMARK_PATH = "temp/benchmarks/"
+BASELINE_PATH = os.path.join(BENCHMARK_PATH, "baseline.json")
+
+
+@tag("management")
+@override_settings(RESOURCE_BENCHMARK_BASELINE=BASELINE_PATH)
+@override_settings(RESOURCE_GENERATORS_PACKAGE="tests.resources.management.test_generators")
+class BenchmarkResourcesCommandTest(BaseTest):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.language = "en"
+
+    def tearDown(self):
+        """Automatically called after each test."""
+        if os.path.exists(BENCHMARK_PATH):
+            shutil.rmtree(BENCHMARK_PATH)
+
+    def write_baseline(self, baseline):
+        os.makedirs(BENCHMARK_PATH, exist_ok=True)
+        with open(BASELINE_PATH, "w") as baseline_file:
+            json.dump(baseline, baseline_file)
+
+    def test_benchmarkresources_command_save_baseline(self):
+        management.call_command("benchmarkresources", "BareResourceGenerator", save_baseline=True)
+        with open(BASELINE_PATH) as baseline_file:
+            baseline = json.load(baseline_file)
+        results = baseline["BareResourceGenerator"]
+        self.assertEqual(results["combinations"], 2)
+        self.assertEqual(results["pages"], 2)
+        for stage in ["data", "thumbnail", "pdf", "pages_per_second", "peak_rss_kb"]:
+            self.assertIn(stage, results)
+
+    def test_benchmarkresources_command_save_baseline_keeps_other_generators(self):
+        self.write_baseline({"OtherResourceGenerator": {"data": 1, "thumbnail": 1, "pdf": 1}})
+        management.call_command("benchmarkresources", "BareResourceGenerator", save_baseline=True)
+        with open(BASELINE_PATH) as baseline_file:
+            baseline = json.load(baseline_file)
+        self.assertIn("OtherResourceGenerator", baseline)
+        self.assertIn("BareResourceGenerator", baseline)
+
+    def test_benchmarkresources_command_within_threshold(self):
+        self.write_baseline({"BareResourceGenerator": {"data": 1000, "thumbnail": 1000, "pdf": 1000}})
+        management.call_command("benchmarkresources", "BareResourceGenerator")
+
+    def test_benchmarkresources_command_regression(self):
+        self.write_baseline({"BareResourceGenerator": {"data": 1000, "thumbnail": 1000, "pdf": -1}})
+        with self.assertRaises(CommandError):
+            management.call_command("benchmarkresources", "BareResourceGenerator")
+
+    def test_benchmarkresources_command_no_baseline(self):
+        management.call_command("benchmarkresources", "BareResourceGenerator", combinations=1)
+        self.assertFalse(os.path.exists(BASELINE_PATH))
+
+    def test_benchmarkresources_command_invalid_combinations(self):
+        with self.assertRaises(CommandError):
+            management.call_command("benchmarkresources", "BareResourceGenerator", combinations=0)
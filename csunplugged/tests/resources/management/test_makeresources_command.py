@@ -2,18 +2,36 @@
 
 from tests.BaseTestWithDB import BaseTestWithDB
 from django.core import management
+from django.core.management.base import CommandError
 from django.test import tag, override_settings
 from tests.resources.ResourcesTestDataGenerator import ResourcesTestDataGenerator
+from unittest.mock import patch
 from PyPDF2 import PdfFileReader
+import os
 import os.path
+import csv
+import glob
+import json
 import shutil
 from resources.models import Resource
+from resources.management.commands.makeresources import render_pdf
 
 RESOURCE_PATH = "temp/resources/"
+CHECKPOINT_PATH = os.path.join(RESOURCE_PATH, "checkpoint.txt")
+REPORT_PATH = os.path.join(RESOURCE_PATH, "report")
+
+
+def render_pdf_crashing_on_letter(generator_module, query_string, resource_name):
+    """Create PDF as render_pdf, but stop the worker process for letter PDFs."""
+    if "letter" in query_string:
+        os._exit(1)
+    return render_pdf(generator_module, query_string, resource_name)
 
 
 @tag("management")
 @override_settings(RESOURCE_GENERATION_LOCATION=RESOURCE_PATH)
+@override_settings(RESOURCE_GENERATION_CHECKPOINT=CHECKPOINT_PATH)
+@override_settings(RESOURCE_GENERATION_REPORT=REPORT_PATH)
 @override_settings(RESOURCE_GENERATORS_PACKAGE="tests.resources.management.test_generators")
 class MakeResourcesCommandTest(BaseTestWithDB):
 
@@ -26,6 +44,24 @@ class MakeResourcesCommandTest(BaseTestWithDB):
         """Automatically called after each test."""
         shutil.rmtree(RESOURCE_PATH)
 
+    def get_pdf_path(self, filename):
+        """Return path of generated PDF, stored in a content hash directory."""
+        paths = glob.glob(os.path.join(RESOURCE_PATH, "*", "{}.pdf".format(filename)))
+        if paths:
+            return paths[0]
+        return os.path.join(RESOURCE_PATH, "missing", "{}.pdf".format(filename))
+
+    def read_checkpoint_keys(self):
+        """Return manifest keys recorded in the checkpoint file."""
+        with open(CHECKPOINT_PATH) as checkpoint_file:
+            return [json.loads(line)["key"] for line in checkpoint_file]
+
+    def read_manifest(self, shard_number=1):
+        """Return contents of manifest file for shard."""
+        manifest_path = os.path.join(RESOURCE_PATH, "manifest-{}.json".format(shard_number))
+        with open(manifest_path) as manifest_file:
+            return json.load(manifest_file)
+
     def test_makeresources_command_single_resource(self):
         self.test_data.create_resource(
             "resource1",
@@ -34,10 +70,10 @@ class MakeResourcesCommandTest(BaseTestWithDB):
             "BareResourceGenerator",
         )
         management.call_command("makeresources")
-        filepath = os.path.join(RESOURCE_PATH, "Resource 1 (a4).pdf")
+        filepath = self.get_pdf_path("Resource 1 (a4)")
         pdf = PdfFileReader(open(filepath, "rb"))
         self.assertEqual(pdf.getNumPages(), 1)
-        filepath = os.path.join(RESOURCE_PATH, "Resource 1 (letter).pdf")
+        filepath = self.get_pdf_path("Resource 1 (letter)")
         pdf = PdfFileReader(open(filepath, "rb"))
         self.assertEqual(pdf.getNumPages(), 1)
 
@@ -55,16 +91,16 @@ class MakeResourcesCommandTest(BaseTestWithDB):
             "BareResourceGenerator",
         )
         management.call_command("makeresources")
-        filepath = os.path.join(RESOURCE_PATH, "Resource 1 (a4).pdf")
+        filepath = self.get_pdf_path("Resource 1 (a4)")
         pdf = PdfFileReader(open(filepath, "rb"))
         self.assertEqual(pdf.getNumPages(), 1)
-        filepath = os.path.join(RESOURCE_PATH, "Resource 1 (letter).pdf")
+        filepath = self.get_pdf_path("Resource 1 (letter)")
         pdf = PdfFileReader(open(filepath, "rb"))
         self.assertEqual(pdf.getNumPages(), 1)
-        filepath = os.path.join(RESOURCE_PATH, "Resource 2 (a4).pdf")
+        filepath = self.get_pdf_path("Resource 2 (a4)")
         pdf = PdfFileReader(open(filepath, "rb"))
         self.assertEqual(pdf.getNumPages(), 1)
-        filepath = os.path.join(RESOURCE_PATH, "Resource 2 (letter).pdf")
+        filepath = self.get_pdf_path("Resource 2 (letter)")
         pdf = PdfFileReader(open(filepath, "rb"))
         self.assertEqual(pdf.getNumPages(), 1)
 
@@ -77,7 +113,7 @@ class MakeResourcesCommandTest(BaseTestWithDB):
             copies=True
         )
         management.call_command("makeresources")
-        filepath = os.path.join(RESOURCE_PATH, "Resource 1 (a4).pdf")
+        filepath = self.get_pdf_path("Resource 1 (a4)")
         pdf = PdfFileReader(open(filepath, "rb"))
         self.assertEqual(pdf.getNumPages(), 20)
 
@@ -90,7 +126,7 @@ class MakeResourcesCommandTest(BaseTestWithDB):
             copies=True
         )
         management.call_command("makeresources", "Resource 1")
-        filepath = os.path.join(RESOURCE_PATH, "Resource 1 (a4).pdf")
+        filepath = self.get_pdf_path("Resource 1 (a4)")
         pdf = PdfFileReader(open(filepath, "rb"))
         self.assertEqual(pdf.getNumPages(), 20)
 
@@ -115,7 +151,7 @@ class MakeResourcesCommandTest(BaseTestWithDB):
             copies=True
         )
         management.call_command("makeresources", "Resource 1")
-        filepath = os.path.join(RESOURCE_PATH, "Resource 1 (a4).pdf")
+        filepath = self.get_pdf_path("Resource 1 (a4)")
         pdf = PdfFileReader(open(filepath, "rb"))
         self.assertEqual(pdf.getNumPages(), 20)
 
@@ -128,3 +164,190 @@ class MakeResourcesCommandTest(BaseTestWithDB):
         )
         with self.assertRaises(TypeError):
             management.call_command("makeresources")
+
+    def test_makeresources_command_checkpoint(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        management.call_command("makeresources")
+        self.assertEqual(
+            self.read_checkpoint_keys(),
+            ["resource1?paper_size=a4", "resource1?paper_size=letter"]
+        )
+
+    def test_makeresources_command_worker_crash(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        with patch(
+            "resources.management.commands.makeresources.render_pdf",
+            render_pdf_crashing_on_letter
+        ):
+            with self.assertRaises(CommandError):
+                management.call_command("makeresources")
+        self.assertEqual(self.read_checkpoint_keys(), ["resource1?paper_size=a4"])
+
+    def test_makeresources_command_resume_skips_completed(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        management.call_command("makeresources")
+        filepath = self.get_pdf_path("Resource 1 (a4)")
+        modified_time = os.path.getmtime(filepath)
+        os.remove(self.get_pdf_path("Resource 1 (letter)"))
+        management.call_command("makeresources", resume=True)
+        self.assertEqual(os.path.getmtime(filepath), modified_time)
+        filepath = self.get_pdf_path("Resource 1 (letter)")
+        pdf = PdfFileReader(open(filepath, "rb"))
+        self.assertEqual(pdf.getNumPages(), 1)
+
+    def test_makeresources_command_without_resume_regenerates(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        os.makedirs(os.path.join(RESOURCE_PATH, "0000000000000000"))
+        with open(CHECKPOINT_PATH, "w") as checkpoint_file:
+            for key in ["resource1?paper_size=a4", "resource2?paper_size=a4"]:
+                entry = {"key": key, "path": "0000000000000000/Resource (a4).pdf", "size": 0, "etag": '""'}
+                checkpoint_file.write("{}\n".format(json.dumps(entry)))
+        open(os.path.join(RESOURCE_PATH, "0000000000000000", "Resource (a4).pdf"), "w").close()
+        management.call_command("makeresources")
+        self.assertEqual(
+            self.read_checkpoint_keys(),
+            ["resource2?paper_size=a4", "resource1?paper_size=a4", "resource1?paper_size=letter"]
+        )
+        pdf = PdfFileReader(open(self.get_pdf_path("Resource 1 (a4)"), "rb"))
+        self.assertEqual(pdf.getNumPages(), 1)
+
+    def test_makeresources_command_shards(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        self.test_data.create_resource(
+            "resource2",
+            "Resource 2",
+            "Description of resource 2",
+            "BareResourceGenerator",
+        )
+        management.call_command("makeresources", shard="1/2")
+        self.assertTrue(os.path.isfile(self.get_pdf_path("Resource 1 (a4)")))
+        self.assertFalse(os.path.isfile(self.get_pdf_path("Resource 1 (letter)")))
+        self.assertTrue(os.path.isfile(self.get_pdf_path("Resource 2 (a4)")))
+        self.assertFalse(os.path.isfile(self.get_pdf_path("Resource 2 (letter)")))
+        management.call_command("makeresources", shard="2/2", resume=True)
+        self.assertTrue(os.path.isfile(self.get_pdf_path("Resource 1 (letter)")))
+        self.assertTrue(os.path.isfile(self.get_pdf_path("Resource 2 (letter)")))
+
+    def test_makeresources_command_invalid_shard(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        with self.assertRaises(CommandError):
+            management.call_command("makeresources", shard="3/2")
+        with self.assertRaises(CommandError):
+            management.call_command("makeresources", shard="0/2")
+        with self.assertRaises(CommandError):
+            management.call_command("makeresources", shard="all")
+
+    def test_makeresources_command_timing_report(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        management.call_command("makeresources")
+        with open("{}.json".format(REPORT_PATH)) as report_file:
+            report = json.load(report_file)
+        self.assertEqual(len(report["records"]), 2)
+        self.assertEqual(report["records"][0]["filename"], "Resource 1 (a4)")
+        self.assertEqual(report["records"][0]["pages"], 1)
+        self.assertEqual(
+            report["records"][0]["size_bytes"],
+            os.path.getsize(self.get_pdf_path("Resource 1 (a4)"))
+        )
+        self.assertEqual(len(report["summary"]), 1)
+        self.assertEqual(report["summary"][0]["resource"], "Resource 1")
+        self.assertEqual(report["summary"][0]["pdfs"], 2)
+        with open("{}.csv".format(REPORT_PATH)) as report_file:
+            rows = list(csv.DictReader(report_file))
+        self.assertEqual([row["filename"] for row in rows], ["Resource 1 (a4)", "Resource 1 (letter)"])
+
+    def test_makeresources_command_timing_report_shard(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        management.call_command("makeresources", shard="2/2")
+        with open("{}-shard-2-of-2.json".format(REPORT_PATH)) as report_file:
+            report = json.load(report_file)
+        self.assertEqual([record["filename"] for record in report["records"]], ["Resource 1 (letter)"])
+
+    def test_makeresources_command_manifest(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        management.call_command("makeresources")
+        manifest = self.read_manifest()
+        self.assertEqual(manifest["shard"], 1)
+        self.assertEqual(manifest["shards"], 1)
+        self.assertEqual(
+            sorted(manifest["files"].keys()),
+            ["resource1?paper_size=a4", "resource1?paper_size=letter"]
+        )
+        entry = manifest["files"]["resource1?paper_size=a4"]
+        filepath = os.path.join(RESOURCE_PATH, entry["path"])
+        self.assertEqual(filepath, self.get_pdf_path("Resource 1 (a4)"))
+        self.assertEqual(entry["size"], os.path.getsize(filepath))
+        self.assertTrue(entry["etag"].startswith('"'))
+
+    def test_makeresources_command_manifest_shards(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        management.call_command("makeresources", shard="1/2")
+        management.call_command("makeresources", shard="2/2")
+        self.assertEqual(list(self.read_manifest(1)["files"].keys()), ["resource1?paper_size=a4"])
+        self.assertEqual(list(self.read_manifest(2)["files"].keys()), ["resource1?paper_size=letter"])
+        self.assertEqual(self.read_manifest(2)["shards"], 2)
+
+    def test_makeresources_command_manifest_resume(self):
+        self.test_data.create_resource(
+            "resource1",
+            "Resource 1",
+            "Description of resource 1",
+            "BareResourceGenerator",
+        )
+        management.call_command("makeresources")
+        os.remove(os.path.join(RESOURCE_PATH, "manifest-1.json"))
+        management.call_command("makeresources", resume=True)
+        self.assertEqual(
+            sorted(self.read_manifest()["files"].keys()),
+            ["resource1?paper_size=a4", "resource1?paper_size=letter"]
+        )
@@ -31,6 +31,13 @@ class BaseResourceGeneratorTest(BaseTestWithDB):
         pdf = PdfFileReader(BytesIO(pdf_file))
         self.assertEqual(pdf.getNumPages(), 8)
 
+    def test_pdf_render_profile(self):
+        generator = BareResourceGeneratorWithCopies(QueryDict("paper_size=a4&copies=3"))
+        generator.pdf("Test")
+        self.assertEqual(generator.render_profile["pages"], 3)
+        for stage in ["data", "resize_encode_resource_images", "render_template", "layout", "write_pdf"]:
+            self.assertGreaterEqual(generator.render_profile[stage], 0)
+
     def test_pdf_multiple_pages(self):
         generator = BareResourceGenerator()
         generator.data = MagicMock(
@@ -177,3 +184,16 @@ class BaseResourceGeneratorTest(BaseTestWithDB):
         self.assertListEqual(options_order, list(local_options))
         for option in local_options.values():
             self.assertIsInstance(option, ResourceParameter)
+
+    def test_get_options_key(self):
+        generator = BareResourceGeneratorWithCopies(QueryDict("paper_size=letter&header_text=Room+4&copies=2"))
+        self.assertEqual(generator.get_options_key(), "copies=2&header_text=Room+4&paper_size=letter")
+
+    def test_get_options_key_without_local_options(self):
+        generator = BareResourceGeneratorWithCopies(QueryDict("paper_size=letter&header_text=Room+4&copies=2"))
+        self.assertEqual(generator.get_options_key(include_local_options=False), "paper_size=letter")
+
+    def test_get_options_key_query_order(self):
+        generator_1 = BareResourceGeneratorWithCopies(QueryDict("paper_size=letter&copies=2"))
+        generator_2 = BareResourceGeneratorWithCopies(QueryDict("copies=2&paper_size=letter"))
+        self.assertEqual(generator_1.get_options_key(), generator_2.get_options_key())
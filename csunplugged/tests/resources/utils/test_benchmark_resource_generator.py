@@ -0,0 +1,58 @@
+from django.test import tag, override_settings
+from django.test import SimpleTestCase
+from resources.utils.benchmark_resource_generator import (
+    get_generator_modules,
+    get_representative_combinations,
+    find_benchmark_regressions,
+)
+from tests.resources.management import test_generators
+
+
+@tag("resource")
+@override_settings(RESOURCE_GENERATORS_PACKAGE="tests.resources.management.test_generators")
+class BenchmarkResourceGeneratorTest(SimpleTestCase):
+
+    def test_get_generator_modules(self):
+        self.assertEqual(
+            get_generator_modules(test_generators),
+            [
+                "BareResourceGenerator",
+                "BareResourceGeneratorMultiPage",
+                "BareResourceGeneratorWithCopies",
+                "BareResourceGeneratorWithNonEnumerableOptions",
+            ]
+        )
+
+    def test_get_representative_combinations_all(self):
+        self.assertEqual(
+            get_representative_combinations("BareResourceGenerator", 3),
+            [{"paper_size": "a4"}, {"paper_size": "letter"}]
+        )
+
+    def test_get_representative_combinations_limited(self):
+        self.assertEqual(
+            get_representative_combinations("BareResourceGenerator", 1),
+            [{"paper_size": "a4"}]
+        )
+
+    def test_find_benchmark_regressions_none(self):
+        results = {"Generator": {"data": 1.1, "thumbnail": 2, "pdf": 3}}
+        baseline = {"Generator": {"data": 1, "thumbnail": 2, "pdf": 3}}
+        self.assertEqual(find_benchmark_regressions(results, baseline, 0.2), [])
+
+    def test_find_benchmark_regressions_slower(self):
+        results = {"Generator": {"data": 1.5, "thumbnail": 2, "pdf": 4}}
+        baseline = {"Generator": {"data": 1, "thumbnail": 2, "pdf": 3}}
+        self.assertEqual(
+            find_benchmark_regressions(results, baseline, 0.2),
+            [("Generator", "data", 1, 1.5), ("Generator", "pdf", 3, 4)]
+        )
+
+    def test_find_benchmark_regressions_ignores_noise(self):
+        results = {"Generator": {"data": 0.002, "thumbnail": 0, "pdf": 0}}
+        baseline = {"Generator": {"data": 0.001, "thumbnail": 0, "pdf": 0}}
+        self.assertEqual(find_benchmark_regressions(results, baseline, 0.2), [])
+
+    def test_find_benchmark_regressions_missing_baseline(self):
+        results = {"Generator": {"data": 10, "thumbnail": 10, "pdf": 10}}
+        self.assertEqual(find_benchmark_regressions(results, {}, 0.2), [])
@@ -1,19 +1,37 @@
 from tests.BaseTestWithDB import BaseTestWithDB
-from django.test import tag
-from django.http import QueryDict
+from django.test import tag, override_settings
+from django.http import QueryDict, Http404
 from resources.utils.resource_pdf_cache import resource_pdf_cache
+from resources.utils.resource_pdf_manifest import loaded_manifests, write_manifest
 from tests.resources.ResourcesTestDataGenerator import ResourcesTestDataGenerator
 from resources.utils.get_resource_generator import get_resource_generator
 from http import HTTPStatus
+import os
+import shutil
+
+MANIFEST_PATH = "temp/manifest/"
 
 
 @tag("resource")
+@override_settings(RESOURCE_PDF_MANIFEST_LOCATION=MANIFEST_PATH)
 class CacheRedirectTest(BaseTestWithDB):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.test_data = ResourcesTestDataGenerator()
 
+    def setUp(self):
+        """Automatically called before each test."""
+        super().setUp()
+        os.makedirs(MANIFEST_PATH, exist_ok=True)
+        loaded_manifests.clear()
+
+    def tearDown(self):
+        """Automatically called after each test."""
+        super().tearDown()
+        shutil.rmtree(MANIFEST_PATH)
+        loaded_manifests.clear()
+
     def test_resources_cache_valid_resource(self):
         resource = self.test_data.create_resource(
             "grid",
@@ -21,11 +39,67 @@ class CacheRedirectTest(BaseTestWithDB):
             "resources/grid.html",
             "GridResourceGenerator",
         )
+        write_manifest(
+            {"grid?paper_size=a4": {"path": "0123456789abcdef/Grid (a4).pdf", "size": 1, "etag": '"0"'}},
+            MANIFEST_PATH,
+        )
         query = QueryDict("paper_size=a4")
         generator = get_resource_generator(resource.generator_module, query)
-        response = resource_pdf_cache(resource.name, generator)
+        response = resource_pdf_cache(resource, generator)
         self.assertEqual(response.status_code, HTTPStatus.FOUND)
         self.assertEqual(
             response.url,
-            "/staticfiles/resources/Grid%20(a4).pdf"
+            "/staticfiles/resources/0123456789abcdef/Grid%20(a4).pdf"
+        )
+
+    def test_resources_cache_multiple_shards(self):
+        resource = self.test_data.create_resource(
+            "grid",
+            "Grid",
+            "resources/grid.html",
+            "GridResourceGenerator",
+        )
+        write_manifest(
+            {"grid?paper_size=a4": {"path": "0123456789abcdef/Grid (a4).pdf", "size": 1, "etag": '"0"'}},
+            MANIFEST_PATH,
+            1,
+            2,
+        )
+        write_manifest(
+            {"grid?paper_size=letter": {"path": "fedcba9876543210/Grid (letter).pdf", "size": 1, "etag": '"1"'}},
+            MANIFEST_PATH,
+            2,
+            2,
+        )
+        query = QueryDict("paper_size=letter")
+        generator = get_resource_generator(resource.generator_module, query)
+        response = resource_pdf_cache(resource, generator)
+        self.assertEqual(
+            response.url,
+            "/staticfiles/resources/fedcba9876543210/Grid%20(letter).pdf"
         )
+
+    def test_resources_cache_missing_entry(self):
+        resource = self.test_data.create_resource(
+            "grid",
+            "Grid",
+            "resources/grid.html",
+            "GridResourceGenerator",
+        )
+        write_manifest(dict(), MANIFEST_PATH)
+        query = QueryDict("paper_size=a4")
+        generator = get_resource_generator(resource.generator_module, query)
+        with self.assertRaises(Http404):
+            resource_pdf_cache(resource, generator)
+
+    def test_resources_cache_missing_manifest(self):
+        resource = self.test_data.create_resource(
+            "grid",
+            "Grid",
+            "resources/grid.html",
+            "GridResourceGenerator",
+        )
+        query = QueryDict("paper_size=a4")
+        generator = get_resource_generator(resource.generator_module, query)
+        with self.assertRaises(Http404):
+            resource_pdf_cache(resource, generator)
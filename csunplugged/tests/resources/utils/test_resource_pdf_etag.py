@@ -0,0 +1,84 @@
+from unittest.mock import patch
+from django.test import tag
+from django.test import SimpleTestCase, RequestFactory
+from django.http import QueryDict
+from resources.utils.get_resource_generator import get_resource_generator
+from resources.utils.resource_pdf_etag import (
+    get_pdf_etag,
+    get_resource_key,
+    get_generator_source_hash,
+    get_etag_cache_key,
+    etag_matches_request,
+)
+from config import __version__
+
+PDF_ETAG = '"1d393b0081b632c54654eb08c345ff76b92ae4efe0768b4c0f64b9ebbe920492"'
+
+
+@tag("resource")
+class ResourcePDFETagTest(SimpleTestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_get_pdf_etag(self):
+        self.assertEqual(get_pdf_etag(b"PDF"), PDF_ETAG)
+
+    def test_get_resource_key(self):
+        generator = get_resource_generator(
+            "GridResourceGenerator",
+            QueryDict("header_text=Room+4&paper_size=a4")
+        )
+        self.assertEqual(get_resource_key("grid", generator), "grid?header_text=Room+4&paper_size=a4")
+        self.assertEqual(get_resource_key("grid", generator, include_local_options=False), "grid?paper_size=a4")
+
+    def test_get_etag_cache_key(self):
+        self.assertEqual(
+            get_etag_cache_key("grid?paper_size=a4", "abc"),
+            "resource-pdf-etag:{}:abc:grid?paper_size=a4".format(__version__)
+        )
+
+    def test_get_generator_source_hash(self):
+        grid_generator = get_resource_generator("GridResourceGenerator", QueryDict("paper_size=a4"))
+        binary_cards_generator = get_resource_generator(
+            "BinaryCardsResourceGenerator",
+            QueryDict("paper_size=a4&display_numbers=yes&black_back=no")
+        )
+        self.assertEqual(
+            get_generator_source_hash(grid_generator),
+            get_generator_source_hash(get_resource_generator("GridResourceGenerator", QueryDict("paper_size=letter")))
+        )
+        self.assertNotEqual(
+            get_generator_source_hash(grid_generator),
+            get_generator_source_hash(binary_cards_generator)
+        )
+
+    def test_get_generator_source_hash_template_changed(self):
+        generator = get_resource_generator("GridResourceGenerator", QueryDict("paper_size=a4"))
+        source_hash = get_generator_source_hash(generator)
+        with patch("resources.utils.resource_pdf_etag.PDF_STYLESHEET", "css/website.css"):
+            self.assertNotEqual(get_generator_source_hash(generator), source_hash)
+
+    def test_etag_matches_request(self):
+        request = self.factory.get("/", HTTP_IF_NONE_MATCH=PDF_ETAG)
+        self.assertTrue(etag_matches_request(request, PDF_ETAG))
+
+    def test_etag_matches_request_multiple(self):
+        request = self.factory.get("/", HTTP_IF_NONE_MATCH='"abc", {}'.format(PDF_ETAG))
+        self.assertTrue(etag_matches_request(request, PDF_ETAG))
+
+    def test_etag_matches_request_weak(self):
+        request = self.factory.get("/", HTTP_IF_NONE_MATCH="W/{}".format(PDF_ETAG))
+        self.assertTrue(etag_matches_request(request, PDF_ETAG))
+
+    def test_etag_matches_request_wildcard(self):
+        request = self.factory.get("/", HTTP_IF_NONE_MATCH="*")
+        self.assertTrue(etag_matches_request(request, PDF_ETAG))
+
+    def test_etag_matches_request_different(self):
+        request = self.factory.get("/", HTTP_IF_NONE_MATCH='"abc"')
+        self.assertFalse(etag_matches_request(request, PDF_ETAG))
+
+    def test_etag_matches_request_missing_header(self):
+        request = self.factory.get("/")
+        self.assertFalse(etag_matches_request(request, PDF_ETAG))
@@ -0,0 +1,111 @@
+from unittest import mock
+from django.test import tag, override_settings
+from django.test import SimpleTestCase
+from django.http import QueryDict
+from resources.utils.get_resource_generator import get_resource_generator
+from resources.utils.resource_pdf_manifest import (
+    get_manifest_key,
+    create_manifest_entry,
+    write_manifest,
+    load_manifest,
+    loaded_manifests,
+)
+import hashlib
+import json
+import os
+import shutil
+
+MANIFEST_PATH = "temp/manifest-tests/"
+
+
+@tag("resource")
+class ResourcePDFManifestTest(SimpleTestCase):
+
+    def setUp(self):
+        os.makedirs(MANIFEST_PATH, exist_ok=True)
+        loaded_manifests.clear()
+
+    def tearDown(self):
+        shutil.rmtree(MANIFEST_PATH)
+        loaded_manifests.clear()
+
+    def test_get_manifest_key_option_order(self):
+        generator_1 = get_resource_generator(
+            "BinaryCardsResourceGenerator",
+            QueryDict("paper_size=a4&display_numbers=yes&black_back=no")
+        )
+        generator_2 = get_resource_generator(
+            "BinaryCardsResourceGenerator",
+            QueryDict("black_back=no&paper_size=a4&display_numbers=yes")
+        )
+        key = get_manifest_key("binary-cards", generator_1)
+        self.assertEqual(key, "binary-cards?black_back=no&display_numbers=yes&paper_size=a4")
+        self.assertEqual(key, get_manifest_key("binary-cards", generator_2))
+
+    def test_get_manifest_key_excludes_local_options(self):
+        generator = get_resource_generator(
+            "GridResourceGenerator",
+            QueryDict("paper_size=a4&header_text=Example&copies=5")
+        )
+        self.assertEqual(get_manifest_key("grid", generator), "grid?paper_size=a4")
+
+    def test_create_manifest_entry(self):
+        content_hash = hashlib.sha256(b"PDF").hexdigest()
+        entry = create_manifest_entry("Grid (a4)", b"PDF")
+        self.assertEqual(entry["path"], "{}/Grid (a4).pdf".format(content_hash[:16]))
+        self.assertEqual(entry["size"], 3)
+        self.assertEqual(entry["etag"], '"{}"'.format(content_hash))
+
+    def test_write_manifest_keeps_existing_entries(self):
+        write_manifest({"a": {"path": "a.pdf"}}, MANIFEST_PATH)
+        write_manifest({"b": {"path": "b.pdf"}}, MANIFEST_PATH)
+        with open(os.path.join(MANIFEST_PATH, "manifest-1.json")) as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertEqual(sorted(manifest["files"].keys()), ["a", "b"])
+
+    def test_write_manifest_discards_entries_from_different_shard_count(self):
+        write_manifest({"a": {"path": "a.pdf"}}, MANIFEST_PATH, 1, 1)
+        write_manifest({"b": {"path": "b.pdf"}}, MANIFEST_PATH, 1, 2)
+        with open(os.path.join(MANIFEST_PATH, "manifest-1.json")) as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertEqual(list(manifest["files"].keys()), ["b"])
+
+    def test_load_manifest_merges_shards(self):
+        write_manifest({"a": {"path": "a.pdf"}}, MANIFEST_PATH, 1, 2)
+        write_manifest({"b": {"path": "b.pdf"}}, MANIFEST_PATH, 2, 2)
+        manifest = load_manifest(MANIFEST_PATH)
+        self.assertEqual(manifest, {"a": {"path": "a.pdf"}, "b": {"path": "b.pdf"}})
+
+    def test_load_manifest_missing(self):
+        with self.assertRaises(OSError):
+            load_manifest(MANIFEST_PATH)
+
+    def test_load_manifest_reloaded_after_timeout(self):
+        write_manifest({"a": {"path": "a.pdf"}}, MANIFEST_PATH)
+        load_manifest(MANIFEST_PATH)
+        write_manifest({"b": {"path": "b.pdf"}}, MANIFEST_PATH)
+        self.assertNotIn("b", load_manifest(MANIFEST_PATH))
+        with override_settings(RESOURCE_PDF_MANIFEST_CACHE_TIMEOUT=0):
+            loaded_manifests.clear()
+            load_manifest(MANIFEST_PATH)
+            self.assertIn("b", load_manifest(MANIFEST_PATH))
+
+    def test_load_manifest_missing_not_read_again(self):
+        with mock.patch(
+            "resources.utils.resource_pdf_manifest.read_manifest_file",
+            side_effect=OSError
+        ) as read_manifest_file:
+            with self.assertRaises(OSError):
+                load_manifest(MANIFEST_PATH)
+            with self.assertRaises(OSError):
+                load_manifest(MANIFEST_PATH)
+        self.assertEqual(read_manifest_file.call_count, 1)
+
+    @override_settings(RESOURCE_PDF_MANIFEST_REQUEST_TIMEOUT=2)
+    def test_load_manifest_url_timeout(self):
+        response = mock.MagicMock()
+        response.__enter__.return_value.read.return_value = b'{"shards": 1, "files": {"a": {"path": "a.pdf"}}}'
+        with mock.patch("resources.utils.resource_pdf_manifest.urlopen", return_value=response) as urlopen:
+            manifest = load_manifest("https://example.com/resources/")
+        self.assertEqual(manifest, {"a": {"path": "a.pdf"}})
+        urlopen.assert_called_once_with("https://example.com/resources/manifest-1.json", timeout=2)
@@ -0,0 +1,64 @@
+from django.test import tag
+from django.test import SimpleTestCase
+from resources.utils.resource_render_report import (
+    create_render_record,
+    summarise_render_records,
+    format_render_summary,
+)
+
+
+@tag("resource")
+class ResourceRenderReportTest(SimpleTestCase):
+
+    def test_create_render_record(self):
+        render_profile = {
+            "data": 1.5,
+            "resize_encode_resource_images": 0.25,
+            "render_template": 0.25,
+            "layout": 2,
+            "write_pdf": 1,
+            "pages": 4,
+        }
+        record = create_render_record("Grid", "Grid (a4)", render_profile, 1024, 2048)
+        self.assertEqual(record["resource"], "Grid")
+        self.assertEqual(record["filename"], "Grid (a4)")
+        self.assertEqual(record["data"], 1.5)
+        self.assertEqual(record["layout"], 2)
+        self.assertEqual(record["total"], 5)
+        self.assertEqual(record["pages"], 4)
+        self.assertEqual(record["peak_rss_increase_kb"], 1024)
+        self.assertEqual(record["size_bytes"], 2048)
+
+    def test_create_render_record_missing_stages(self):
+        record = create_render_record("Grid", "Grid (a4)", {}, 1024, 2048)
+        self.assertEqual(record["data"], 0)
+        self.assertEqual(record["total"], 0)
+        self.assertEqual(record["pages"], 0)
+
+    def test_summarise_render_records_sorted_by_total(self):
+        records = [
+            create_render_record("Grid", "Grid (a4)", {"layout": 1, "pages": 1}, 100, 10),
+            create_render_record("Arrows", "Arrows (a4)", {"layout": 3, "pages": 2}, 300, 20),
+            create_render_record("Grid", "Grid (letter)", {"layout": 1, "pages": 1}, 200, 10),
+        ]
+        summary = summarise_render_records(records)
+        self.assertEqual([row["resource"] for row in summary], ["Arrows", "Grid"])
+        self.assertEqual(summary[1]["pdfs"], 2)
+        self.assertEqual(summary[1]["total"], 2)
+        self.assertEqual(summary[1]["pages"], 2)
+        self.assertEqual(summary[1]["pages_per_second"], 1)
+        self.assertEqual(summary[1]["peak_rss_increase_kb"], 200)
+        self.assertEqual(summary[1]["size_bytes"], 20)
+
+    def test_summarise_render_records_zero_time(self):
+        records = [create_render_record("Grid", "Grid (a4)", {"pages": 1}, 100, 10)]
+        summary = summarise_render_records(records)
+        self.assertEqual(summary[0]["pages_per_second"], 0)
+
+    def test_format_render_summary(self):
+        records = [create_render_record("Grid", "Grid (a4)", {"layout": 2, "pages": 4}, 100, 10)]
+        lines = format_render_summary(summarise_render_records(records)).splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("Resource"))
+        self.assertTrue(lines[1].startswith("Grid"))
+        self.assertIn("2.00", lines[1])
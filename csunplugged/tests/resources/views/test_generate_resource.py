@@ -1,9 +1,16 @@
 from django.test import tag, override_settings
 from django.urls import reverse
+from django.core.cache import cache
+from unittest.mock import patch
 from tests.BaseTestWithDB import BaseTestWithDB
 from tests.resources.ResourcesTestDataGenerator import ResourcesTestDataGenerator
 from tests.create_query_string import query_string
+from resources.utils.resource_pdf_manifest import loaded_manifests, write_manifest
 from http import HTTPStatus
+import os
+import shutil
+
+MANIFEST_PATH = "temp/manifest/"
 
 
 @tag("resource")
@@ -14,6 +21,11 @@ class GenerateResourceTest(BaseTestWithDB):
         self.test_data = ResourcesTestDataGenerator()
         self.language = "en"
 
+    def setUp(self):
+        """Automatically called before each test."""
+        super().setUp()
+        cache.clear()
+
     def test_generate_view_valid_slug(self):
         resource = self.test_data.create_resource(
             "grid",
@@ -36,7 +48,7 @@ class GenerateResourceTest(BaseTestWithDB):
             'attachment; filename="Grid (a4).pdf"'
         )
 
-    @override_settings(DJANGO_PRODUCTION=True)
+    @override_settings(DJANGO_PRODUCTION=True, RESOURCE_PDF_MANIFEST_LOCATION=MANIFEST_PATH)
     def test_generate_view_valid_slug_production_cache(self):
         resource = self.test_data.create_resource(
             "grid",
@@ -44,6 +56,14 @@ class GenerateResourceTest(BaseTestWithDB):
             "resources/grid.html",
             "GridResourceGenerator",
         )
+        os.makedirs(MANIFEST_PATH, exist_ok=True)
+        self.addCleanup(shutil.rmtree, MANIFEST_PATH)
+        self.addCleanup(loaded_manifests.clear)
+        loaded_manifests.clear()
+        write_manifest(
+            {"grid?paper_size=a4": {"path": "0123456789abcdef/Grid (a4).pdf", "size": 1, "etag": '"0"'}},
+            MANIFEST_PATH,
+        )
         kwargs = {
             "resource_slug": resource.slug,
         }
@@ -56,7 +76,7 @@ class GenerateResourceTest(BaseTestWithDB):
         self.assertEqual(HTTPStatus.FOUND, response.status_code)
         self.assertEqual(
             response.url,
-            "/staticfiles/resources/Grid%20(a4).pdf"
+            "/staticfiles/resources/0123456789abcdef/Grid%20(a4).pdf"
         )
 
     def test_generate_view_valid_slug_missing_parameter(self):
@@ -105,3 +125,73 @@ class GenerateResourceTest(BaseTestWithDB):
         url += "?paper_size=a4&paper_size=letter"
         response = self.client.get(url)
         self.assertEqual(HTTPStatus.NOT_FOUND, response.status_code)
+
+    def test_generate_view_etag(self):
+        resource = self.test_data.create_resource(
+            "grid",
+            "Grid",
+            "resources/grid.html",
+            "GridResourceGenerator",
+        )
+        kwargs = {
+            "resource_slug": resource.slug,
+        }
+        url = reverse("resources:generate", kwargs=kwargs)
+        response = self.client.get(url + "?paper_size=a4&header_text=Room+4")
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        etag = response.get("ETag")
+        self.assertTrue(etag.startswith('"'))
+        self.assertFalse(etag.startswith("W/"))
+        # Equivalent query with different parameter order
+        response = self.client.get(url + "?header_text=Room+4&paper_size=a4", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(HTTPStatus.NOT_MODIFIED, response.status_code)
+        self.assertEqual(response.get("ETag"), etag)
+
+    def test_generate_view_etag_skips_render(self):
+        resource = self.test_data.create_resource(
+            "grid",
+            "Grid",
+            "resources/grid.html",
+            "GridResourceGenerator",
+        )
+        kwargs = {
+            "resource_slug": resource.slug,
+        }
+        url = reverse("resources:generate", kwargs=kwargs) + "?paper_size=a4"
+        etag = self.client.get(url).get("ETag")
+        with patch("resources.utils.BaseResourceGenerator.BaseResourceGenerator.pdf") as pdf:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(HTTPStatus.NOT_MODIFIED, response.status_code)
+        pdf.assert_not_called()
+
+    def test_generate_view_etag_different_options(self):
+        resource = self.test_data.create_resource(
+            "grid",
+            "Grid",
+            "resources/grid.html",
+            "GridResourceGenerator",
+        )
+        kwargs = {
+            "resource_slug": resource.slug,
+        }
+        url = reverse("resources:generate", kwargs=kwargs)
+        etag = self.client.get(url + "?paper_size=a4").get("ETag")
+        response = self.client.get(url + "?paper_size=letter", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        self.assertNotEqual(response.get("ETag"), etag)
+
+    def test_generate_view_random_data_no_etag(self):
+        resource = self.test_data.create_resource(
+            "grid",
+            "Grid",
+            "resources/grid.html",
+            "GridResourceGenerator",
+        )
+        kwargs = {
+            "resource_slug": resource.slug,
+        }
+        url = reverse("resources:generate", kwargs=kwargs) + "?paper_size=a4"
+        with patch("resources.generators.GridResourceGenerator.GridResourceGenerator.random_data", True):
+            response = self.client.get(url)
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        self.assertFalse(response.has_header("ETag"))
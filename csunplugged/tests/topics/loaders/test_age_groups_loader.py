@@ -30,6 +30,13 @@ class AgeGroupsLoaderTest(BaseTestWithDB):
             ["<AgeGroup: NumericRange(8, 10, '[)')>"]
         )
 
+    def test_age_groups_loader_check(self):
+        config_file = "basic-config.yaml"
+        group_loader = AgeGroupsLoader(structure_filename=config_file, base_path=self.base_path, check=True)
+        group_loader.load()
+        self.assertFalse(AgeGroup.objects.exists())
+        self.assertEqual(list(group_loader.registry.get_objects(AgeGroup)), ["8-10"])
+
     def test_age_groups_loader_missing_configuration_file(self):
         config_file = "missing.yaml"
         group_loader = AgeGroupsLoader(structure_filename=config_file, base_path=self.base_path)
@@ -51,6 +51,15 @@ class GlossaryTermsLoaderTest(BaseTestWithDB):
             ["<GlossaryTerm: Glossary Term 1>"]
         )
 
+    def test_rendered_definition(self):
+        folder = "glossary_static"
+        glossary_loader = GlossaryTermsLoader(base_path=self.base_path, content_path=folder)
+        glossary_loader.load()
+        glossary_term = GlossaryTerm.objects.get(slug="glossary-term-1")
+        self.assertIn("{% static", glossary_term.definition)
+        self.assertNotIn("{% static", glossary_term.definition_rendered)
+        self.assertIn("/staticfiles/img/logo-small.png", glossary_term.definition_rendered)
+
     def test_translation(self):
         folder = "glossary_translation"
 
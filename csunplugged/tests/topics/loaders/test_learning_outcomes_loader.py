@@ -7,7 +7,8 @@ from utils.errors.CouldNotFindYAMLFileError import CouldNotFindYAMLFileError
 from utils.errors.MissingRequiredModelsError import MissingRequiredModelsError
 from utils.errors.EmptyYAMLFileError import EmptyYAMLFileError
 from utils.errors.InvalidYAMLValueError import InvalidYAMLValueError
-from topics.models import LearningOutcome
+from utils.errors.ReferenceNotCheckedError import ReferenceNotCheckedError
+from topics.models import CurriculumArea, LearningOutcome
 from topics.management.commands._LearningOutcomesLoader import LearningOutcomesLoader
 
 
@@ -86,6 +87,15 @@ class LearningOutcomesLoaderTest(BaseTestWithDB):
             lo_loader.load
         )
 
+    def test_curriculum_areas_not_checked(self):
+        config_file = "curriculum-areas.yaml"
+        lo_loader = LearningOutcomesLoader(structure_filename=config_file, base_path=self.base_path, check=True)
+        lo_loader.registry.mark_failed([CurriculumArea])
+        self.assertRaises(
+            ReferenceNotCheckedError,
+            lo_loader.load
+        )
+
     def test_translation(self):
         self.test_data.create_curriculum_area(1)
         config_file = "translation.yaml"
@@ -19,11 +19,23 @@ class UnitPlanLoaderTest(BaseTestWithDB):
         self.loader_name = "unit_plan"
         self.base_path = os.path.join(self.test_data.LOADER_ASSET_PATH, self.loader_name)
 
+    def create_factory(self, lesson_numbers):
+        # The lessons loader creates the given lessons for the loaded unit plan
+        def create_lessons_loader(topic, unit_plan, **kwargs):
+            lessons_loader = Mock()
+            lessons_loader.load.side_effect = lambda: [
+                self.test_data.create_lesson(topic, unit_plan, number) for number in lesson_numbers
+            ]
+            return lessons_loader
+        factory = Mock()
+        factory.create_lessons_loader.side_effect = create_lessons_loader
+        return factory
+
     def test_basic_unit_plan_configuration(self):
         content_path, structure_filename = "unit-plan-1", "unit-plan-1.yaml"
 
         # create test objects so that lesson exist for age group
-        factory = Mock()
+        factory = self.create_factory(["1"])
         topic = self.test_data.create_topic("1")
         unit_plan = self.test_data.create_unit_plan(topic, "test")
         self.test_data.create_lesson(topic, unit_plan, "1")
@@ -88,6 +100,25 @@ class UnitPlanLoaderTest(BaseTestWithDB):
             up_loader.load,
         )
 
+    def test_unit_plan_lesson_in_other_unit_plan(self):
+        content_path, structure_filename = "unit-plan-1", "unit-plan-1.yaml"
+        factory = Mock()
+        topic = self.test_data.create_topic("1")
+        unit_plan = self.test_data.create_unit_plan(topic, "test")
+        self.test_data.create_lesson(topic, unit_plan, "1")
+        self.test_data.create_age_group(8, 10)
+        up_loader = UnitPlanLoader(
+            factory,
+            topic,
+            structure_filename=structure_filename,
+            base_path=self.base_path,
+            content_path=content_path
+        )
+        self.assertRaises(
+            KeyNotFoundError,
+            up_loader.load,
+        )
+
     def test_unit_plan_loader_missing_content_text(self):
         content_path, structure_filename = "missing-content", "missing-content.yaml"
 
@@ -164,7 +195,7 @@ class UnitPlanLoaderTest(BaseTestWithDB):
     def test_unit_plan_loader_valid_computational_thinking_content(self):
         content_path, structure_filename = "ct-links", "ct-links.yaml"
 
-        factory = Mock()
+        factory = self.create_factory(["1"])
         topic = self.test_data.create_topic("1")
         unit_plan = self.test_data.create_unit_plan(topic, "test")
         self.test_data.create_lesson(topic, unit_plan, "1")
@@ -187,7 +218,7 @@ class UnitPlanLoaderTest(BaseTestWithDB):
     def test_unit_plan_loader_missing_computational_thinking_content(self):
         content_path, structure_filename = "unit-plan-1", "unit-plan-1.yaml"
 
-        factory = Mock()
+        factory = self.create_factory(["1"])
         topic = self.test_data.create_topic("1")
         unit_plan = self.test_data.create_unit_plan(topic, "test")
         self.test_data.create_lesson(topic, unit_plan, "1")
@@ -236,7 +267,7 @@ class UnitPlanLoaderTest(BaseTestWithDB):
     def test_unit_plan_missing_lesson_number(self):
         content_path, structure_filename = "unit-plan-1", "missing-lesson-number.yaml"
 
-        factory = Mock()
+        factory = self.create_factory(["1"])
         topic = self.test_data.create_topic("1")
         unit_plan = self.test_data.create_unit_plan(topic, "test")
         self.test_data.create_lesson(topic, unit_plan, "1")
@@ -259,7 +290,7 @@ class UnitPlanLoaderTest(BaseTestWithDB):
         content_path, structure_filename = "translation", "translation.yaml"
 
         # create test objects so that lesson exist for age group
-        factory = Mock()
+        factory = self.create_factory(["1"])
         topic = self.test_data.create_topic("1")
         unit_plan = self.test_data.create_unit_plan(topic, "test")
         self.test_data.create_lesson(topic, unit_plan, "1")
@@ -290,7 +321,7 @@ class UnitPlanLoaderTest(BaseTestWithDB):
         content_path, structure_filename = "translation", "translation-missing-ct-links.yaml"
 
         # create test objects so that lesson exist for age group
-        factory = Mock()
+        factory = self.create_factory(["1"])
         topic = self.test_data.create_topic("1")
         unit_plan = self.test_data.create_unit_plan(topic, "test")
         self.test_data.create_lesson(topic, unit_plan, "1")
@@ -1,10 +1,17 @@
 """Module for the testing custom Django loadtopics commands."""
 
 import os.path
+from io import StringIO
 from unittest import mock
 from tests.BaseTestWithDB import BaseTestWithDB
 from django.core import management
+from django.core.management.base import CommandError
 from django.test import tag, override_settings
+from utils.check_required_files import find_image_files
+from utils.content_version import get_content_version, update_content_version
+from utils.errors.CouldNotFindImagesError import CouldNotFindImagesError
+from utils.errors.CouldNotFindYAMLFileError import CouldNotFindYAMLFileError
+from utils.errors.ReferenceNotCheckedError import ReferenceNotCheckedError
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
 
 TOPICS_PATH = "tests/topics/management/assets/"
@@ -17,6 +24,14 @@ class LoadTopicsCommandTest(BaseTestWithDB):
         super().__init__(*args, **kwargs)
         self.language = "en"
 
+    def test_loadtopics_invalid_processes(self):
+        self.assertRaises(
+            CommandError,
+            management.call_command,
+            "loadtopics",
+            processes=0,
+        )
+
     # Test calls to curriculum areas loader
 
     @mock.patch(
@@ -435,3 +450,132 @@ class LoadTopicsCommandTest(BaseTestWithDB):
             management.call_command,
             "loadtopics"
         )
+
+    # Test loading only given topics
+
+    @mock.patch(
+        "topics.management.commands._AgeGroupsLoader.AgeGroupsLoader.load",
+        return_value=True
+    )
+    @mock.patch(
+        "topics.management.commands._TopicLoader.TopicLoader.load",
+        return_value=True
+    )
+    @override_settings(
+        TOPICS_CONTENT_BASE_PATH=os.path.join(TOPICS_PATH, "topics-valid")
+    )
+    def test_loadtopics_topic_option(self, topic_loader, age_loader):
+        management.call_command("loadtopics", topics=["binary-numbers"])
+        self.assertTrue(topic_loader.called)
+        self.assertFalse(age_loader.called)
+
+    @mock.patch(
+        "topics.management.commands._AgeGroupsLoader.AgeGroupsLoader.load",
+        return_value=True
+    )
+    @mock.patch(
+        "topics.management.commands._TopicLoader.TopicLoader.load",
+        return_value=True
+    )
+    @override_settings(
+        TOPICS_CONTENT_BASE_PATH=os.path.join(TOPICS_PATH, "topics-valid")
+    )
+    def test_loadtopics_topic_option_invalid(self, topic_loader, age_loader):
+        self.assertRaises(
+            CommandError,
+            management.call_command,
+            "loadtopics",
+            topics=["invalid-topic"],
+        )
+        self.assertFalse(topic_loader.called)
+
+    # Test reporting missing images
+
+    @mock.patch(
+        "topics.management.commands._AgeGroupsLoader.AgeGroupsLoader.load",
+        return_value=True
+    )
+    @mock.patch(
+        "topics.management.commands._TopicLoader.TopicLoader.load",
+        side_effect=lambda: find_image_files({"img/invalid-image.jaypheg"}, "md file path")
+    )
+    @override_settings(
+        TOPICS_CONTENT_BASE_PATH=os.path.join(TOPICS_PATH, "topics-valid")
+    )
+    def test_loadtopics_missing_images(self, topic_loader, age_loader):
+        previous_version = update_content_version()
+        with self.assertRaises(CouldNotFindImagesError) as error:
+            management.call_command("loadtopics")
+        self.assertEqual(
+            error.exception.missing_images,
+            [("img/invalid-image.jaypheg", "md file path")]
+        )
+        self.assertNotEqual(get_content_version(), previous_version)
+
+    # Test checking content
+
+    @mock.patch(
+        "resources.management.commands._ResourcesLoader.ResourcesLoader.load",
+        return_value=True
+    )
+    @mock.patch(
+        "topics.management.commands._AgeGroupsLoader.AgeGroupsLoader.load",
+        return_value=True
+    )
+    @mock.patch(
+        "topics.management.commands._TopicLoader.TopicLoader.load",
+        return_value=True
+    )
+    @override_settings(
+        TOPICS_CONTENT_BASE_PATH=os.path.join(TOPICS_PATH, "topics-valid")
+    )
+    def test_loadtopics_check_valid(self, topic_loader, age_loader, resources_loader):
+        management.call_command("loadtopics", check=True, topics=["binary-numbers"])
+        self.assertTrue(resources_loader.called)
+        self.assertTrue(age_loader.called)
+        self.assertTrue(topic_loader.called)
+
+    @mock.patch(
+        "resources.management.commands._ResourcesLoader.ResourcesLoader.load",
+        return_value=True
+    )
+    @mock.patch(
+        "topics.management.commands._AgeGroupsLoader.AgeGroupsLoader.load",
+        side_effect=CouldNotFindYAMLFileError("age-groups.yaml")
+    )
+    @mock.patch(
+        "topics.management.commands._TopicLoader.TopicLoader.load",
+        side_effect=CouldNotFindYAMLFileError("binary-numbers.yaml")
+    )
+    @override_settings(
+        TOPICS_CONTENT_BASE_PATH=os.path.join(TOPICS_PATH, "topics-valid")
+    )
+    def test_loadtopics_check_errors(self, topic_loader, age_loader, resources_loader):
+        stderr = StringIO()
+        with self.assertRaises(CommandError):
+            management.call_command("loadtopics", check=True, stderr=stderr)
+        self.assertTrue(topic_loader.called)
+        self.assertIn("age-groups.yaml", stderr.getvalue())
+        self.assertIn("binary-numbers.yaml", stderr.getvalue())
+
+    @mock.patch(
+        "resources.management.commands._ResourcesLoader.ResourcesLoader.load",
+        side_effect=FileNotFoundError("Thumbnail image could not be found.")
+    )
+    @mock.patch(
+        "topics.management.commands._AgeGroupsLoader.AgeGroupsLoader.load",
+        return_value=True
+    )
+    @mock.patch(
+        "topics.management.commands._TopicLoader.TopicLoader.load",
+        side_effect=ReferenceNotCheckedError("binary-numbers.yaml", "resource-1", "Resources")
+    )
+    @override_settings(
+        TOPICS_CONTENT_BASE_PATH=os.path.join(TOPICS_PATH, "topics-valid")
+    )
+    def test_loadtopics_check_references_not_checked(self, topic_loader, age_loader, resources_loader):
+        stderr = StringIO()
+        with self.assertRaisesMessage(CommandError, "Found 1 error(s) in content."):
+            management.call_command("loadtopics", check=True, stderr=stderr)
+        self.assertIn("not fully checked", stderr.getvalue())
+        self.assertIn("resource-1", stderr.getvalue())
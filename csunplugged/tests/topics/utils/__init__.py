@@ -0,0 +1 @@
+"""Module for tests of functions in the topics application."""
@@ -0,0 +1,56 @@
+from tests.BaseTestWithDB import BaseTestWithDB
+from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
+from topics.models import Topic, UnitPlan
+from topics.utils.add_lesson_ages_to_objects import add_lesson_ages_to_objects
+
+
+class AddLessonAgesToObjectsTest(BaseTestWithDB):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_data = TopicsTestDataGenerator()
+
+    def test_add_lesson_ages_to_objects_topics(self):
+        topic_1 = self.test_data.create_topic(1)
+        topic_2 = self.test_data.create_topic(2)
+        unit_plan_1 = self.test_data.create_unit_plan(topic_1, 1)
+        unit_plan_2 = self.test_data.create_unit_plan(topic_2, 2)
+        age_group_1 = self.test_data.create_age_group(5, 7)
+        age_group_2 = self.test_data.create_age_group(8, 10)
+        self.test_data.create_lesson(topic_1, unit_plan_1, 1, age_group_1)
+        self.test_data.create_lesson(topic_1, unit_plan_1, 2, age_group_2)
+        self.test_data.create_lesson(topic_2, unit_plan_2, 3, age_group_2)
+        topics = add_lesson_ages_to_objects(Topic.objects.order_by("slug"))
+        self.assertEqual((topics[0].min_age, topics[0].max_age), (5, 10))
+        self.assertEqual((topics[1].min_age, topics[1].max_age), (8, 10))
+
+    def test_add_lesson_ages_to_objects_unit_plans(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan_1 = self.test_data.create_unit_plan(topic, 1)
+        unit_plan_2 = self.test_data.create_unit_plan(topic, 2)
+        age_group_1 = self.test_data.create_age_group(5, 7)
+        age_group_2 = self.test_data.create_age_group(8, 10)
+        self.test_data.create_lesson(topic, unit_plan_1, 1, [age_group_1, age_group_2])
+        self.test_data.create_lesson(topic, unit_plan_2, 2, age_group_1)
+        unit_plans = add_lesson_ages_to_objects(list(UnitPlan.objects.order_by("slug")))
+        self.assertEqual((unit_plans[0].min_age, unit_plans[0].max_age), (5, 10))
+        self.assertEqual((unit_plans[1].min_age, unit_plans[1].max_age), (5, 7))
+
+    def test_add_lesson_ages_to_objects_no_lessons(self):
+        self.test_data.create_topic(1)
+        topics = add_lesson_ages_to_objects(list(Topic.objects.all()))
+        self.assertEqual((topics[0].min_age, topics[0].max_age), (None, None))
+
+    def test_add_lesson_ages_to_objects_empty(self):
+        self.assertEqual(add_lesson_ages_to_objects([]), [])
+
+    def test_add_lesson_ages_to_objects_query_count(self):
+        age_group = self.test_data.create_age_group(5, 7)
+        for number in range(1, 6):
+            topic = self.test_data.create_topic(number)
+            unit_plan = self.test_data.create_unit_plan(topic, number)
+            self.test_data.create_lesson(topic, unit_plan, number, age_group)
+        topics = Topic.objects.all()
+        # One query for the topics, and one for all lesson ages
+        with self.assertNumQueries(2):
+            add_lesson_ages_to_objects(topics)
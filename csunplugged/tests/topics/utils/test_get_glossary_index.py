@@ -0,0 +1,70 @@
+from django.core.cache import cache
+from django.utils.translation import activate
+from tests.BaseTestWithDB import BaseTestWithDB
+from topics.models import GlossaryTerm
+from topics.utils.get_glossary_index import get_glossary_index
+from utils.content_version import update_content_version
+
+
+class GetGlossaryIndexTest(BaseTestWithDB):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.language = "en"
+
+    def tearDown(self):
+        cache.clear()
+        super().tearDown()
+
+    def create_term(self, slug, term):
+        glossary_term = GlossaryTerm(
+            slug=slug,
+            term=term,
+            definition="<p>{} definition.</p>".format(term),
+            definition_rendered="<p>{} rendered definition.</p>".format(term),
+            languages=["en"]
+        )
+        glossary_term.save()
+        return glossary_term
+
+    def test_get_glossary_index(self):
+        self.create_term("algorithm", "Algorithms")
+        self.assertEqual(
+            get_glossary_index(),
+            {
+                "algorithm": {
+                    "slug": "algorithm",
+                    "translated": True,
+                    "term": "Algorithms",
+                    "definition": "<p>Algorithms rendered definition.</p>",
+                }
+            }
+        )
+
+    def test_get_glossary_index_no_content_version(self):
+        self.create_term("algorithm", "Algorithms")
+        get_glossary_index()
+        self.create_term("pixel", "Pixel")
+        self.assertEqual(sorted(get_glossary_index().keys()), ["algorithm", "pixel"])
+
+    def test_get_glossary_index_cached_for_content_version(self):
+        self.create_term("algorithm", "Algorithms")
+        update_content_version()
+        get_glossary_index()
+        self.create_term("pixel", "Pixel")
+        self.assertEqual(sorted(get_glossary_index().keys()), ["algorithm"])
+
+    def test_get_glossary_index_rebuilt_for_new_content_version(self):
+        self.create_term("algorithm", "Algorithms")
+        update_content_version()
+        get_glossary_index()
+        self.create_term("pixel", "Pixel")
+        update_content_version()
+        self.assertEqual(sorted(get_glossary_index().keys()), ["algorithm", "pixel"])
+
+    def test_get_glossary_index_per_language(self):
+        self.create_term("algorithm", "Algorithms")
+        update_content_version()
+        self.assertTrue(get_glossary_index()["algorithm"]["translated"])
+        activate("xx-lr")
+        self.assertFalse(get_glossary_index()["algorithm"]["translated"])
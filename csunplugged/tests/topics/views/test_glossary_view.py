@@ -169,3 +169,46 @@ class GlossaryViewTest(BaseTestWithDB):
         url = reverse("topics:glossary_json")
         response = self.client.get(url, {"word": "pixel"})
         self.assertEqual(HTTPStatus.NOT_FOUND, response.status_code)
+
+    def test_glossary_json_with_multiple_terms(self):
+        GlossaryTerm(
+            slug="algorithm",
+            term="Algorithms",
+            definition="<p>Algorithms definition.</p>",
+            languages=["en"]
+        ).save()
+        GlossaryTerm(
+            slug="pixel",
+            term="Pixel",
+            definition="<p>Pixel definition.</p>",
+            languages=["en"]
+        ).save()
+
+        url = reverse("topics:glossary_json")
+        response = self.client.get(url, {"terms": "algorithm,pixel,missing"})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        self.assertJSONEqual(
+            str(response.content, encoding="utf8"),
+            {
+                "terms": {
+                    "algorithm": {
+                        "definition": "<p>Algorithms definition.</p>",
+                        "slug": "algorithm",
+                        "term": "Algorithms",
+                        "translated": True
+                    },
+                    "pixel": {
+                        "definition": "<p>Pixel definition.</p>",
+                        "slug": "pixel",
+                        "term": "Pixel",
+                        "translated": True
+                    },
+                }
+            }
+        )
+
+    def test_glossary_json_with_multiple_terms_none_found(self):
+        url = reverse("topics:glossary_json")
+        response = self.client.get(url, {"terms": "missing"})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        self.assertJSONEqual(str(response.content, encoding="utf8"), {"terms": {}})
@@ -1,6 +1,8 @@
 from http import HTTPStatus
 from tests.BaseTestWithDB import BaseTestWithDB
 from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
 
 
@@ -96,3 +98,22 @@ class IndexViewTest(BaseTestWithDB):
         topic = response.context["topics"][0]
         self.assertEqual(topic.min_age, 10)
         self.assertEqual(topic.max_age, 99)
+
+    def test_index_query_count_independent_of_topics(self):
+        age_group = self.test_data.create_age_group(5, 7)
+        url = reverse("topics:index")
+
+        def create_topic_with_lesson(number):
+            topic = self.test_data.create_topic(number)
+            unit_plan = self.test_data.create_unit_plan(topic, number)
+            self.test_data.create_lesson(topic, unit_plan, number, age_group)
+
+        create_topic_with_lesson(1)
+        with CaptureQueriesContext(connection) as one_topic_queries:
+            self.client.get(url)
+        for number in range(2, 6):
+            create_topic_with_lesson(number)
+        with CaptureQueriesContext(connection) as many_topic_queries:
+            response = self.client.get(url)
+        self.assertEqual(len(response.context["topics"]), 5)
+        self.assertEqual(len(one_topic_queries), len(many_topic_queries))
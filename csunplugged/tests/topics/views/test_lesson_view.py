@@ -1,5 +1,7 @@
 from http import HTTPStatus
 from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from tests.BaseTestWithDB import BaseTestWithDB
 from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
 from tests.resources.ResourcesTestDataGenerator import ResourcesTestDataGenerator
@@ -410,3 +412,53 @@ class LessonViewTest(BaseTestWithDB):
             response.context["generated_resources"],
             []
         )
+
+    def test_lesson_view_query_count_independent_of_related_objects(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan = self.test_data.create_unit_plan(topic, 1)
+        age_group_1 = self.test_data.create_age_group(5, 7)
+        lesson = self.test_data.create_lesson(
+            topic,
+            unit_plan,
+            1,
+            age_group_1
+        )
+        parent_area = self.test_data.create_curriculum_area(1)
+        url = reverse(
+            "topics:lesson",
+            kwargs={
+                "topic_slug": "topic-1",
+                "unit_plan_slug": "unit-plan-1",
+                "lesson_slug": "lesson-1",
+            }
+        )
+
+        def add_related_objects(number):
+            area = self.test_data.create_curriculum_area(number + 1, parent_area)
+            learning_outcome = self.test_data.create_learning_outcome(number)
+            learning_outcome.curriculum_areas.add(area)
+            lesson.learning_outcomes.add(learning_outcome)
+            lesson.classroom_resources.add(self.test_data.create_classroom_resource(number))
+            resource = self.resource_test_data.create_resource(
+                "resource-{}".format(number),
+                "Resource {}".format(number),
+                "resources/grid.html",
+                "GridResourceGenerator",
+            )
+            self.test_data.add_lesson_resource_relationship(lesson, resource, number)
+
+        add_related_objects(1)
+        with CaptureQueriesContext(connection) as few_objects_queries:
+            self.client.get(url)
+        for number in range(2, 5):
+            add_related_objects(number)
+            LessonNumber(
+                age_group=self.test_data.create_age_group(number * 3, number * 3 + 2),
+                lesson=lesson,
+                number=number,
+            ).save()
+        with CaptureQueriesContext(connection) as many_objects_queries:
+            response = self.client.get(url)
+        self.assertEqual(len(response.context["lesson_ages"]), 4)
+        self.assertEqual(len(response.context["generated_resources"]), 4)
+        self.assertEqual(len(few_objects_queries), len(many_objects_queries))
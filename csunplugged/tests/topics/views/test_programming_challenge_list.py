@@ -1,5 +1,7 @@
 from http import HTTPStatus
 from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from tests.BaseTestWithDB import BaseTestWithDB
 from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
 
@@ -289,3 +291,68 @@ class ProgrammingChallengeListTest(BaseTestWithDB):
                 "<ProgrammingChallenge: Challenge 1.1: 1>",
             ]
         )
+
+    def test_programming_challenge_list_challenges_context_numbers(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan = self.test_data.create_unit_plan(topic, 1)
+        age_group = self.test_data.create_age_group(5, 7)
+        lesson = self.test_data.create_lesson(topic, unit_plan, 1, age_group)
+        difficulty = self.test_data.create_difficulty_level(1)
+        challenge1 = self.test_data.create_programming_challenge(topic, 1, difficulty)
+        challenge2 = self.test_data.create_programming_challenge(
+            topic,
+            2,
+            difficulty,
+            challenge_set_number=2,
+        )
+        self.test_data.add_challenge_lesson_relationship(challenge2, lesson, 1, 2)
+        self.test_data.add_challenge_lesson_relationship(challenge1, lesson, 1, 1)
+        kwargs = {
+            "topic_slug": topic.slug,
+            "unit_plan_slug": unit_plan.slug,
+            "lesson_slug": lesson.slug,
+        }
+        url = reverse("topics:programming_challenges_list", kwargs=kwargs)
+        response = self.client.get(url)
+        self.assertEqual(
+            [(challenge.slug, challenge.challenge_set_number, challenge.challenge_number)
+                for challenge in response.context["programming_challenges"]],
+            [("challenge-1", 1, 1), ("challenge-2", 1, 2)]
+        )
+
+    def test_programming_challenge_list_query_count_independent_of_challenges(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan = self.test_data.create_unit_plan(topic, 1)
+        age_group = self.test_data.create_age_group(5, 7)
+        lesson = self.test_data.create_lesson(topic, unit_plan, 1, age_group)
+        difficulty = self.test_data.create_difficulty_level(1)
+        kwargs = {
+            "topic_slug": topic.slug,
+            "unit_plan_slug": unit_plan.slug,
+            "lesson_slug": lesson.slug,
+        }
+        url = reverse("topics:programming_challenges_list", kwargs=kwargs)
+
+        def add_challenge(number):
+            challenge = self.test_data.create_programming_challenge(
+                topic,
+                number,
+                difficulty,
+                challenge_number=number,
+            )
+            self.test_data.add_challenge_lesson_relationship(challenge, lesson, 1, number)
+            self.test_data.create_programming_challenge_implementation(
+                topic,
+                self.test_data.create_programming_language(number),
+                challenge,
+            )
+
+        add_challenge(1)
+        with CaptureQueriesContext(connection) as one_challenge_queries:
+            self.client.get(url)
+        for number in range(2, 5):
+            add_challenge(number)
+        with CaptureQueriesContext(connection) as many_challenge_queries:
+            response = self.client.get(url)
+        self.assertEqual(len(response.context["programming_challenges"]), 4)
+        self.assertEqual(len(one_challenge_queries), len(many_challenge_queries))
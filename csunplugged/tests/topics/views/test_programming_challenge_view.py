@@ -1,5 +1,7 @@
 from http import HTTPStatus
 from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from tests.BaseTestWithDB import BaseTestWithDB
 from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
 
@@ -230,3 +232,62 @@ class ProgrammingChallengeViewTest(BaseTestWithDB):
                 "<ProgrammingChallengeImplementation: Language 3 for challenge 1.1, Challenge 1.1: 1>",
             ]
         )
+
+    def test_programming_challenge_view_lessons_context_numbers(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan = self.test_data.create_unit_plan(topic, 1)
+        age_group = self.test_data.create_age_group(5, 7)
+        lesson1 = self.test_data.create_lesson(topic, unit_plan, 1, age_group)
+        lesson2 = self.test_data.create_lesson(topic, unit_plan, 2, age_group)
+        difficulty = self.test_data.create_difficulty_level(1)
+        challenge = self.test_data.create_programming_challenge(topic, 1, difficulty)
+        self.test_data.add_challenge_lesson_relationship(challenge, lesson1, 2, 3)
+        self.test_data.add_challenge_lesson_relationship(challenge, lesson2, 4, 5)
+        kwargs = {
+            "topic_slug": topic.slug,
+            "programming_challenge_slug": challenge.slug,
+        }
+        url = reverse("topics:programming_challenge", kwargs=kwargs)
+        response = self.client.get(url)
+        self.assertEqual(
+            [(lesson.slug, lesson.challenge_set_number, lesson.challenge_number)
+                for lesson in response.context["lessons"]],
+            [("lesson-1", 2, 3), ("lesson-2", 4, 5)]
+        )
+
+    def test_programming_challenge_view_query_count_independent_of_lessons(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan = self.test_data.create_unit_plan(topic, 1)
+        age_group = self.test_data.create_age_group(5, 7)
+        difficulty = self.test_data.create_difficulty_level(1)
+        challenge = self.test_data.create_programming_challenge(topic, 1, difficulty)
+        parent_area = self.test_data.create_curriculum_area(1)
+        kwargs = {
+            "topic_slug": topic.slug,
+            "programming_challenge_slug": challenge.slug,
+        }
+        url = reverse("topics:programming_challenge", kwargs=kwargs)
+
+        def add_related_objects(number):
+            lesson = self.test_data.create_lesson(topic, unit_plan, number, age_group)
+            self.test_data.add_challenge_lesson_relationship(challenge, lesson, 1, number)
+            self.test_data.create_programming_challenge_implementation(
+                topic,
+                self.test_data.create_programming_language(number),
+                challenge,
+            )
+            learning_outcome = self.test_data.create_learning_outcome(number)
+            learning_outcome.curriculum_areas.add(
+                self.test_data.create_curriculum_area(number + 1, parent_area)
+            )
+            challenge.learning_outcomes.add(learning_outcome)
+
+        add_related_objects(1)
+        with CaptureQueriesContext(connection) as few_objects_queries:
+            self.client.get(url)
+        for number in range(2, 5):
+            add_related_objects(number)
+        with CaptureQueriesContext(connection) as many_objects_queries:
+            response = self.client.get(url)
+        self.assertEqual(len(response.context["lessons"]), 4)
+        self.assertEqual(len(few_objects_queries), len(many_objects_queries))
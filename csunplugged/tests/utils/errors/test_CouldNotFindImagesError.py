@@ -0,0 +1,48 @@
+"""Test class for CouldNotFindImagesError error."""
+
+from django.test import SimpleTestCase
+from utils.errors.CouldNotFindImagesError import CouldNotFindImagesError
+
+
+class CouldNotFindImagesErrorTest(SimpleTestCase):
+    """Test class for CouldNotFindImagesError error.
+
+    Note: Tests to check if these were raised appropriately
+          are located where this exception is used.
+    """
+
+    def test_attributes(self):
+        missing_images = [("image path", "reference file path")]
+        exception = CouldNotFindImagesError(missing_images)
+        self.assertEqual(exception.missing_images, missing_images)
+
+    def test_string_single_image(self):
+        exception = CouldNotFindImagesError([("image path", "reference file path")])
+        expected_string = (
+            "\n****************************ERROR****************************\n"
+            "File: image path\n"
+            "Referenced in: reference file path\n\n"
+            "Could not find 1 image.\n\n"
+            "  - Did you spell the name of the file correctly?\n"
+            "  - Does the file exist?\n"
+            "  - Is the file saved in the correct directory?\n"
+        )
+        self.assertEqual(exception.__str__(), expected_string)
+
+    def test_string_multiple_images(self):
+        exception = CouldNotFindImagesError([
+            ("image path 1", "reference file path 1"),
+            ("image path 2", "reference file path 2"),
+        ])
+        expected_string = (
+            "\n****************************ERROR****************************\n"
+            "File: image path 1\n"
+            "Referenced in: reference file path 1\n"
+            "File: image path 2\n"
+            "Referenced in: reference file path 2\n\n"
+            "Could not find 2 images.\n\n"
+            "  - Did you spell the name of the file correctly?\n"
+            "  - Does the file exist?\n"
+            "  - Is the file saved in the correct directory?\n"
+        )
+        self.assertEqual(exception.__str__(), expected_string)
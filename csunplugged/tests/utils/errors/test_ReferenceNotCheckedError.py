@@ -0,0 +1,28 @@
+"""Test class for ReferenceNotCheckedError error."""
+
+from django.test import SimpleTestCase
+from utils.errors.ReferenceNotCheckedError import ReferenceNotCheckedError
+
+
+class ReferenceNotCheckedErrorTest(SimpleTestCase):
+    """Test class for ReferenceNotCheckedError error.
+
+    Note: Tests to check if these were raised appropriately
+          are located where this exception is used.
+    """
+
+    def test_attributes(self):
+        exception = ReferenceNotCheckedError("config file path", "key", "field")
+        self.assertEqual(exception.config_file_path, "config file path")
+        self.assertEqual(exception.key, "key")
+        self.assertEqual(exception.field, "field")
+
+    def test_string(self):
+        exception = ReferenceNotCheckedError("config file path", "key", "field")
+        expected_string = (
+            "\n****************************ERROR****************************\n"
+            "File: config file path\n\n"
+            "Key: key\n"
+            '"key" could not be checked, as the field could not be loaded\n'
+        )
+        self.assertEqual(exception.__str__(), expected_string)
@@ -0,0 +1,98 @@
+"""Test class for SlugRegistry module."""
+
+from tests.BaseTestWithDB import BaseTestWithDB
+from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
+from topics.models import CurriculumArea, LearningOutcome, Lesson, Topic, UnitPlan
+from utils.SlugRegistry import SlugRegistry
+
+
+class SlugRegistryTest(BaseTestWithDB):
+    """Test class for SlugRegistry module."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_data = TopicsTestDataGenerator()
+
+    def test_get_objects(self):
+        outcome_1 = self.test_data.create_learning_outcome(1)
+        outcome_2 = self.test_data.create_learning_outcome(2)
+        registry = SlugRegistry()
+        self.assertEqual(
+            registry.get_objects(LearningOutcome),
+            {"outcome-1": outcome_1, "outcome-2": outcome_2}
+        )
+
+    def test_get_objects_read_once(self):
+        self.test_data.create_learning_outcome(1)
+        registry = SlugRegistry()
+        with self.assertNumQueries(1):
+            registry.get_objects(LearningOutcome)
+            registry.get_objects(LearningOutcome)
+            registry.get(LearningOutcome, "outcome-1")
+
+    def test_get_missing_object(self):
+        registry = SlugRegistry()
+        self.assertIsNone(registry.get(LearningOutcome, "outcome-1"))
+
+    def test_get_objects_key_field(self):
+        area = self.test_data.create_curriculum_area(1)
+        registry = SlugRegistry()
+        self.assertEqual(registry.get_objects(CurriculumArea, key_field="number"), {area.number: area})
+
+    def test_add_after_objects_read(self):
+        registry = SlugRegistry()
+        registry.get_objects(LearningOutcome)
+        outcome = self.test_data.create_learning_outcome(1)
+        with self.assertNumQueries(0):
+            registry.add([outcome])
+            self.assertEqual(registry.get(LearningOutcome, "outcome-1"), outcome)
+
+    def test_add_before_objects_read(self):
+        registry = SlugRegistry()
+        outcome = self.test_data.create_learning_outcome(1)
+        registry.add([outcome])
+        self.assertEqual(registry.get_objects(LearningOutcome), {"outcome-1": outcome})
+
+    def test_filter(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan_1 = self.test_data.create_unit_plan(topic, 1)
+        unit_plan_2 = self.test_data.create_unit_plan(topic, 2)
+        lesson_1 = self.test_data.create_lesson(topic, unit_plan_1, 1)
+        self.test_data.create_lesson(topic, unit_plan_2, 2)
+        registry = SlugRegistry()
+        self.assertEqual(list(registry.filter(Lesson, unit_plan=unit_plan_1)), [lesson_1])
+        self.assertEqual(list(registry.filter(Lesson, slug__in=["lesson-1", "lesson-3"])), [lesson_1])
+
+    def test_without_database(self):
+        self.test_data.create_learning_outcome(1)
+        registry = SlugRegistry(read_database=False)
+        with self.assertNumQueries(0):
+            self.assertEqual(registry.get_objects(LearningOutcome), {})
+
+    def test_without_database_add(self):
+        registry = SlugRegistry(read_database=False)
+        outcome_1 = LearningOutcome(slug="outcome-1")
+        registry.add([outcome_1])
+        self.assertEqual(registry.get_objects(LearningOutcome), {"outcome-1": outcome_1})
+        outcome_2 = LearningOutcome(slug="outcome-2")
+        registry.add([outcome_2])
+        self.assertEqual(registry.get(LearningOutcome, "outcome-2"), outcome_2)
+
+    def test_without_database_filter(self):
+        registry = SlugRegistry(read_database=False)
+        topic = Topic(slug="topic-1")
+        unit_plan_1 = UnitPlan(topic=topic, slug="unit-plan-1")
+        unit_plan_2 = UnitPlan(topic=topic, slug="unit-plan-2")
+        lesson_1 = Lesson(topic=topic, unit_plan=unit_plan_1, slug="lesson-1")
+        lesson_2 = Lesson(topic=topic, unit_plan=unit_plan_2, slug="lesson-2")
+        registry.add([unit_plan_1, unit_plan_2, lesson_1, lesson_2])
+        with self.assertNumQueries(0):
+            self.assertEqual(registry.filter(UnitPlan, topic=topic), [unit_plan_1, unit_plan_2])
+            self.assertEqual(registry.filter(Lesson, unit_plan=unit_plan_2), [lesson_2])
+            self.assertEqual(registry.filter(Lesson, slug__in={"lesson-1"}), [lesson_1])
+
+    def test_mark_failed(self):
+        registry = SlugRegistry(read_database=False)
+        registry.mark_failed([LearningOutcome])
+        self.assertTrue(registry.has_failed(LearningOutcome))
+        self.assertFalse(registry.has_failed(CurriculumArea))
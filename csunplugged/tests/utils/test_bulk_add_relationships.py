@@ -0,0 +1,40 @@
+"""Test class for bulk_add_relationships module."""
+
+from tests.BaseTestWithDB import BaseTestWithDB
+from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
+from topics.models import Lesson
+from utils.bulk_add_relationships import bulk_add_relationships
+
+
+class BulkAddRelationshipsTest(BaseTestWithDB):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_data = TopicsTestDataGenerator()
+
+    def test_bulk_add_relationships(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan = self.test_data.create_unit_plan(topic, 1)
+        lesson_1 = self.test_data.create_lesson(topic, unit_plan, 1)
+        lesson_2 = self.test_data.create_lesson(topic, unit_plan, 2)
+        outcome_1 = self.test_data.create_learning_outcome(1)
+        outcome_2 = self.test_data.create_learning_outcome(2)
+        with self.assertNumQueries(1):
+            bulk_add_relationships(
+                Lesson.learning_outcomes,
+                [(lesson_1, outcome_1), (lesson_1, outcome_2), (lesson_2, outcome_2)]
+            )
+        self.assertEqual(list(lesson_1.learning_outcomes.order_by("slug")), [outcome_1, outcome_2])
+        self.assertEqual(list(lesson_2.learning_outcomes.all()), [outcome_2])
+
+    def test_bulk_add_relationships_duplicate_pairs(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan = self.test_data.create_unit_plan(topic, 1)
+        lesson = self.test_data.create_lesson(topic, unit_plan, 1)
+        outcome = self.test_data.create_learning_outcome(1)
+        bulk_add_relationships(Lesson.learning_outcomes, [(lesson, outcome), (lesson, outcome)])
+        self.assertEqual(list(lesson.learning_outcomes.all()), [outcome])
+
+    def test_bulk_add_relationships_no_pairs(self):
+        with self.assertNumQueries(0):
+            bulk_add_relationships(Lesson.learning_outcomes, [])
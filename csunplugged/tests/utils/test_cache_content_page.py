@@ -0,0 +1,66 @@
+from http import HTTPStatus
+from django.core.cache import cache, caches
+from django.test import override_settings
+from django.urls import reverse
+from django.utils.translation import activate
+from tests.BaseTestWithDB import BaseTestWithDB
+from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
+from utils.content_version import update_content_version
+
+
+@override_settings(CONTENT_VERSION_CACHE_TIMEOUT=60)
+class CacheContentPageTest(BaseTestWithDB):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.language = "en"
+        self.test_data = TopicsTestDataGenerator()
+
+    def tearDown(self):
+        cache.clear()
+        caches["content_pages"].clear()
+        super().tearDown()
+
+    def test_cache_content_page_cached_response(self):
+        self.test_data.create_topic(1)
+        update_content_version()
+        url = reverse("topics:index")
+        response = self.client.get(url)
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(url)
+        self.assertEqual(response.content, cached_response.content)
+
+    def test_cache_content_page_new_content_version(self):
+        topic = self.test_data.create_topic(1)
+        update_content_version()
+        url = reverse("topics:topic", kwargs={"topic_slug": topic.slug})
+        self.client.get(url)
+        topic.name = "Renamed topic"
+        topic.save()
+        self.assertNotContains(self.client.get(url), "Renamed topic")
+        update_content_version()
+        self.assertContains(self.client.get(url), "Renamed topic")
+
+    def test_cache_content_page_no_content_version(self):
+        topic = self.test_data.create_topic(1)
+        url = reverse("topics:topic", kwargs={"topic_slug": topic.slug})
+        self.client.get(url)
+        topic.name = "Renamed topic"
+        topic.save()
+        self.assertContains(self.client.get(url), "Renamed topic")
+
+    def test_cache_content_page_not_found_not_cached(self):
+        update_content_version()
+        url = reverse("topics:topic", kwargs={"topic_slug": "topic-1"})
+        self.assertEqual(HTTPStatus.NOT_FOUND, self.client.get(url).status_code)
+        self.test_data.create_topic(1)
+        self.assertEqual(HTTPStatus.OK, self.client.get(url).status_code)
+
+    def test_cache_content_page_per_language(self):
+        self.test_data.create_topic(1)
+        update_content_version()
+        english_response = self.client.get(reverse("topics:index"))
+        activate("de")
+        response = self.client.get(reverse("topics:index"))
+        self.assertNotEqual(english_response.content, response.content)
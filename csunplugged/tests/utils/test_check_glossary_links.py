@@ -2,8 +2,11 @@
 
 from tests.BaseTestWithDB import BaseTestWithDB
 from utils.check_glossary_links import check_converter_glossary_links
+from utils.SlugRegistry import SlugRegistry
 from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
 from utils.errors.CouldNotFindGlossaryTermError import CouldNotFindGlossaryTermError
+from utils.errors.ReferenceNotCheckedError import ReferenceNotCheckedError
+from topics.models import GlossaryTerm
 
 
 class CheckGlossaryLinksTest(BaseTestWithDB):
@@ -45,3 +48,46 @@ class CheckGlossaryLinksTest(BaseTestWithDB):
             terms_to_find,
             "md file path"
         )
+
+    def test_multiple_terms_single_query(self):
+        self.test_data.create_glossary_term(1)
+        self.test_data.create_glossary_term(2)
+        terms_to_find = {
+            "term-1": [],
+            "term-2": [],
+        }
+        with self.assertNumQueries(1):
+            check_converter_glossary_links(terms_to_find, "md file path")
+
+    def test_no_terms(self):
+        with self.assertNumQueries(0):
+            check_converter_glossary_links({}, "md file path")
+
+    def test_registry_terms_read_once(self):
+        self.test_data.create_glossary_term(1)
+        self.test_data.create_glossary_term(2)
+        registry = SlugRegistry()
+        with self.assertNumQueries(1):
+            check_converter_glossary_links({"term-1": []}, "md file path", registry)
+            check_converter_glossary_links({"term-2": []}, "md file path", registry)
+
+    def test_registry_missing_term(self):
+        self.test_data.create_glossary_term(1)
+        self.assertRaises(
+            CouldNotFindGlossaryTermError,
+            check_converter_glossary_links,
+            {"term-2": []},
+            "md file path",
+            SlugRegistry()
+        )
+
+    def test_registry_failed_terms(self):
+        registry = SlugRegistry(read_database=False)
+        registry.mark_failed([GlossaryTerm])
+        self.assertRaises(
+            ReferenceNotCheckedError,
+            check_converter_glossary_links,
+            {"term-1": []},
+            "md file path",
+            registry
+        )
@@ -0,0 +1,120 @@
+import os.path
+import tempfile
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import override_settings
+from tests.BaseTestWithDB import BaseTestWithDB
+from general.models import ContentVersion
+from utils.content_version import (
+    calculate_content_revision,
+    calculate_content_hashes,
+    get_content_hashes,
+    save_content_hashes,
+    get_content_version,
+    get_content_version_details,
+    update_content_version,
+)
+
+
+class ContentVersionTest(BaseTestWithDB):
+
+    def tearDown(self):
+        cache.clear()
+        super().tearDown()
+
+    def test_get_content_version_no_content(self):
+        self.assertIsNone(get_content_version())
+
+    def test_update_content_version(self):
+        version = update_content_version()
+        self.assertEqual(get_content_version(), version)
+
+    def test_update_content_version_given_version(self):
+        update_content_version("abc")
+        self.assertEqual(get_content_version(), "abc")
+
+    def test_update_content_version_unique(self):
+        self.assertNotEqual(update_content_version(), update_content_version())
+        self.assertEqual(ContentVersion.objects.count(), 1)
+
+    @override_settings(CONTENT_VERSION_CACHE_TIMEOUT=60)
+    def test_get_content_version_cached(self):
+        version = update_content_version()
+        get_content_version()
+        with self.assertNumQueries(0):
+            self.assertEqual(get_content_version(), version)
+
+    def test_get_content_version_details(self):
+        version = update_content_version()
+        (details_version, updated) = get_content_version_details()
+        self.assertEqual(details_version, version)
+        self.assertEqual(updated, ContentVersion.objects.get().updated)
+
+    def test_get_content_version_details_no_content(self):
+        self.assertEqual(get_content_version_details(), (None, None))
+
+    def test_calculate_content_revision(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.write_file(directory, "a.md", "Content")
+            revision = calculate_content_revision(directory)
+            self.assertEqual(revision, calculate_content_revision(directory))
+            self.write_file(directory, "a.md", "Changed content")
+            self.assertNotEqual(revision, calculate_content_revision(directory))
+
+    def test_calculate_content_revision_renamed_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.write_file(directory, "a.md", "Content")
+            revision = calculate_content_revision(directory)
+            os.rename(os.path.join(directory, "a.md"), os.path.join(directory, "b.md"))
+            self.assertNotEqual(revision, calculate_content_revision(directory))
+
+    def test_calculate_content_revision_changed_version(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.write_file(directory, "a.md", "Content")
+            revision = calculate_content_revision(directory)
+            with patch("utils.content_version.__version__", "0.0.0-test"):
+                self.assertNotEqual(revision, calculate_content_revision(directory))
+
+    def test_calculate_content_hashes(self):
+        structure = {"topics": ["topic-1", "topic-2"], "age-groups": "age-groups.yaml"}
+        with tempfile.TemporaryDirectory() as directory:
+            self.write_file(directory, "topics/structure/structure.yaml", "")
+            self.write_file(directory, "topics/structure/age-groups.yaml", "Ages")
+            self.write_file(directory, "topics/structure/topic-1/topic-1.yaml", "Structure 1")
+            self.write_file(directory, "topics/en/topic-1/topic-1.md", "Topic 1")
+            self.write_file(directory, "topics/en/topic-2/topic-2.md", "Topic 2")
+            self.write_file(directory, "resources/resource.md", "Resource")
+            resources_path = os.path.join(directory, "resources")
+            topics_path = os.path.join(directory, "topics")
+            content_hashes = calculate_content_hashes(resources_path, topics_path, structure)
+            self.assertEqual(sorted(content_hashes), ["shared", "topic:topic-1", "topic:topic-2"])
+
+            self.write_file(directory, "topics/en/topic-1/topic-1.md", "Changed topic 1")
+            changed_hashes = calculate_content_hashes(resources_path, topics_path, structure)
+            self.assertEqual(changed_hashes["shared"], content_hashes["shared"])
+            self.assertNotEqual(changed_hashes["topic:topic-1"], content_hashes["topic:topic-1"])
+            self.assertEqual(changed_hashes["topic:topic-2"], content_hashes["topic:topic-2"])
+
+            self.write_file(directory, "resources/resource.md", "Changed resource")
+            changed_hashes = calculate_content_hashes(resources_path, topics_path, structure)
+            self.assertNotEqual(changed_hashes["shared"], content_hashes["shared"])
+
+    def test_calculate_content_hashes_topics_list_not_shared(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.write_file(directory, "structure/structure.yaml", "")
+            hashes_1 = calculate_content_hashes(directory, directory, {"topics": ["topic-1"]})
+            hashes_2 = calculate_content_hashes(directory, directory, {"topics": ["topic-1", "topic-2"]})
+            self.assertEqual(hashes_1["shared"], hashes_2["shared"])
+            hashes_3 = calculate_content_hashes(directory, directory, {"topics": [], "age-groups": "a.yaml"})
+            self.assertNotEqual(hashes_1["shared"], hashes_3["shared"])
+
+    def test_save_content_hashes(self):
+        save_content_hashes({"shared": "a", "topic:topic-1": "b"})
+        save_content_hashes({"shared": "c"})
+        self.assertEqual(get_content_hashes(), {"shared": "c"})
+
+    def write_file(self, directory, filename, contents):
+        path = os.path.join(directory, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as content_file:
+            content_file.write(contents)
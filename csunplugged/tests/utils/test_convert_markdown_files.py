@@ -0,0 +1,110 @@
+"""Test class for convert_markdown_files module."""
+
+import os.path
+import tempfile
+from django.test import SimpleTestCase
+from utils import convert_markdown_files
+from tests.utils.BareBaseLoader import BareBaseLoader
+
+
+class ConvertMarkdownFilesTest(SimpleTestCase):
+    """Test class for convert_markdown_files module."""
+
+    def tearDown(self):
+        convert_markdown_files.stop_worker_pool()
+        convert_markdown_files.converted_markdown.clear()
+
+    def write_file(self, directory, filename, contents):
+        path = os.path.join(directory, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="UTF-8") as md_file:
+            md_file.write(contents)
+        return path
+
+    def test_find_markdown_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path_1 = self.write_file(directory, "en/b.md", "# B")
+            path_2 = self.write_file(directory, "en/a/a.md", "# A")
+            self.write_file(directory, "en/a.yaml", "a: b")
+            self.assertEqual(
+                convert_markdown_files.find_markdown_files([os.path.join(directory, "en")]),
+                sorted([path_1, path_2])
+            )
+
+    def test_convert_markdown_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path_1 = self.write_file(directory, "1.md", "# Heading 1\n\nContent 1")
+            path_2 = self.write_file(directory, "2.md", "# Heading 2\n\nContent 2")
+            count = convert_markdown_files.convert_markdown_files([path_1, path_2], 2)
+        self.assertEqual(count, 2)
+        result = convert_markdown_files.get_converted_markdown("# Heading 1\n\nContent 1", True)
+        expected_result = BareBaseLoader().convert_md_content("# Heading 1\n\nContent 1")
+        self.assertEqual(result.title, expected_result.title)
+        self.assertEqual(result.html_string, expected_result.html_string)
+
+    def test_convert_markdown_files_remove_title_setting(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write_file(directory, "1.md", "# Heading 1\n\nContent 1")
+            convert_markdown_files.convert_markdown_files([path], 2)
+        self.assertIsNotNone(convert_markdown_files.get_converted_markdown("# Heading 1\n\nContent 1", True))
+        self.assertIsNone(convert_markdown_files.get_converted_markdown("# Heading 1\n\nContent 1", False))
+
+    def test_convert_markdown_files_already_converted(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write_file(directory, "1.md", "# Heading 1\n\nContent 1")
+            convert_markdown_files.convert_markdown_files([path], 2)
+            self.assertEqual(convert_markdown_files.convert_markdown_files([path], 2), 0)
+
+    def test_convert_md_file_uses_converted_markdown(self):
+        loader = BareBaseLoader()
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write_file(directory, "1.md", "# Heading 1\n\nContent 1")
+            convert_markdown_files.convert_markdown_files([path], 2)
+            result = loader.convert_md_file(path, "config.yaml")
+        self.assertIs(
+            result,
+            convert_markdown_files.get_converted_markdown("# Heading 1\n\nContent 1", True)
+        )
+
+    def test_convert_markdown_files_worker_pool(self):
+        convert_markdown_files.start_worker_pool(2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write_file(directory, "1.md", "# Heading 1\n\nContent 1")
+            self.assertEqual(convert_markdown_files.convert_markdown_files([path], 2), 1)
+        self.assertIsNotNone(convert_markdown_files.worker_pool)
+
+    def test_convert_markdown_translations(self):
+        convert_markdown_files.start_worker_pool(2)
+        with tempfile.TemporaryDirectory() as directory:
+            path_1 = self.write_file(directory, "en/1.md", "# Heading\n\nContent")
+            path_2 = self.write_file(directory, "de/1.md", "# Überschrift\n\nInhalt")
+            count = convert_markdown_files.convert_markdown_translations([path_1, path_2], remove_title=False)
+        self.assertEqual(count, 2)
+        result = convert_markdown_files.get_converted_markdown("# Überschrift\n\nInhalt", False)
+        self.assertEqual(result.title, "Überschrift")
+
+    def test_convert_markdown_translations_missing_files(self):
+        convert_markdown_files.start_worker_pool(2)
+        with tempfile.TemporaryDirectory() as directory:
+            path_1 = self.write_file(directory, "en/1.md", "# Heading\n\nContent")
+            path_2 = self.write_file(directory, "de/1.md", "# Überschrift\n\nInhalt")
+            path_3 = os.path.join(directory, "fr/1.md")
+            count = convert_markdown_files.convert_markdown_translations([path_1, path_2, path_3])
+        self.assertEqual(count, 2)
+
+    def test_convert_markdown_translations_single_file(self):
+        convert_markdown_files.start_worker_pool(2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write_file(directory, "en/1.md", "# Heading\n\nContent")
+            self.assertEqual(convert_markdown_files.convert_markdown_translations([path]), 0)
+
+    def test_convert_markdown_translations_no_worker_pool(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path_1 = self.write_file(directory, "en/1.md", "# Heading\n\nContent")
+            path_2 = self.write_file(directory, "de/1.md", "# Überschrift\n\nInhalt")
+            self.assertEqual(convert_markdown_files.convert_markdown_translations([path_1, path_2]), 0)
+
+    def test_stop_worker_pool(self):
+        convert_markdown_files.start_worker_pool(2)
+        convert_markdown_files.stop_worker_pool()
+        self.assertIsNone(convert_markdown_files.worker_pool)
@@ -20,3 +20,34 @@ class FindImageFilesTest(SimpleTestCase):
             images,
             "md file path"
         )
+
+    def test_find_image_files_image_checks(self):
+        check_required_files.start_image_checks()
+        try:
+            check_required_files.find_image_files({"img/logo.png"}, "md file path 1")
+            check_required_files.find_image_files({"img/invalid-image.jaypheg"}, "md file path 2")
+            check_required_files.find_image_files({"img/missing.png"}, "md file path 3")
+        finally:
+            missing_images = check_required_files.finish_image_checks()
+        self.assertEqual(
+            missing_images,
+            [
+                ("img/invalid-image.jaypheg", "md file path 2"),
+                ("img/missing.png", "md file path 3"),
+            ]
+        )
+
+    def test_find_image_files_after_image_checks(self):
+        check_required_files.start_image_checks()
+        check_required_files.finish_image_checks()
+        self.assertRaises(
+            CouldNotFindImageError,
+            check_required_files.find_image_files,
+            {"img/invalid-image.jaypheg"},
+            "md file path"
+        )
+
+    def test_get_static_file_paths(self):
+        static_file_paths = check_required_files.get_static_file_paths()
+        self.assertIn("img/logo.png", static_file_paths)
+        self.assertNotIn("img/invalid-image.jaypheg", static_file_paths)
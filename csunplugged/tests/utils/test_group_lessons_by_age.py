@@ -0,0 +1,54 @@
+from tests.BaseTestWithDB import BaseTestWithDB
+from tests.topics.TopicsTestDataGenerator import TopicsTestDataGenerator
+from topics.models import Lesson
+from utils.group_lessons_by_age import group_lessons_by_age
+
+
+class GroupLessonsByAgeTest(BaseTestWithDB):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_data = TopicsTestDataGenerator()
+
+    def test_group_lessons_by_age_order(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan = self.test_data.create_unit_plan(topic, 1)
+        age_group_1 = self.test_data.create_age_group(5, 7)
+        age_group_2 = self.test_data.create_age_group(8, 10)
+        lesson_1 = self.test_data.create_lesson(topic, unit_plan, 1, age_group_2)
+        lesson_2 = self.test_data.create_lesson(topic, unit_plan, 2, age_group_1)
+        lesson_3 = self.test_data.create_lesson(topic, unit_plan, 3, [age_group_1, age_group_2])
+        grouped_lessons = group_lessons_by_age(Lesson.objects.all())
+        self.assertEqual(list(grouped_lessons.keys()), [age_group_1, age_group_2])
+        self.assertEqual(grouped_lessons[age_group_1], [lesson_2, lesson_3])
+        self.assertEqual(grouped_lessons[age_group_2], [lesson_1, lesson_3])
+        self.assertEqual([lesson.number for lesson in grouped_lessons[age_group_2]], [1, 3])
+
+    def test_group_lessons_by_age_subset(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan_1 = self.test_data.create_unit_plan(topic, 1)
+        unit_plan_2 = self.test_data.create_unit_plan(topic, 2)
+        age_group = self.test_data.create_age_group(5, 7)
+        lesson_1 = self.test_data.create_lesson(topic, unit_plan_1, 1, age_group)
+        self.test_data.create_lesson(topic, unit_plan_2, 2, age_group)
+        grouped_lessons = group_lessons_by_age(unit_plan_1.lessons.all())
+        self.assertEqual(grouped_lessons[age_group], [lesson_1])
+
+    def test_group_lessons_by_age_no_lessons(self):
+        self.assertEqual(len(group_lessons_by_age(Lesson.objects.all())), 0)
+
+    def test_group_lessons_by_age_query_count(self):
+        topic = self.test_data.create_topic(1)
+        unit_plan = self.test_data.create_unit_plan(topic, 1)
+        age_group_1 = self.test_data.create_age_group(5, 7)
+        age_group_2 = self.test_data.create_age_group(8, 10)
+        for number in range(1, 6):
+            self.test_data.create_lesson(topic, unit_plan, number, [age_group_1, age_group_2])
+        # Lesson numbers with lessons and age groups, then programming challenges
+        with self.assertNumQueries(2):
+            grouped_lessons = group_lessons_by_age(unit_plan.lessons.all())
+            for lessons in grouped_lessons.values():
+                for lesson in lessons:
+                    lesson.topic.slug
+                    lesson.unit_plan.slug
+                    lesson.has_programming_challenges()
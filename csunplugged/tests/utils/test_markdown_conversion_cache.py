@@ -0,0 +1,70 @@
+"""Test class for markdown_conversion_cache module."""
+
+import os
+import tempfile
+from django.test import SimpleTestCase
+from utils import markdown_conversion_cache
+from tests.utils.BareBaseLoader import BareBaseLoader
+
+
+class MarkdownConversionCacheTest(SimpleTestCase):
+    """Test class for markdown_conversion_cache module."""
+
+    def setUp(self):
+        self.cache_directory = tempfile.TemporaryDirectory()
+        self.settings_override = self.settings(MARKDOWN_CONVERSION_CACHE_LOCATION=self.cache_directory.name)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.cache_directory.cleanup()
+
+    def test_get_templates_hash_changes_with_templates(self):
+        self.assertNotEqual(
+            markdown_conversion_cache.get_templates_hash({"image": "<img>"}),
+            markdown_conversion_cache.get_templates_hash({"image": "<img >"})
+        )
+
+    def test_get_conversion_key_same_settings(self):
+        self.assertEqual(
+            markdown_conversion_cache.get_conversion_key("# Heading", "hash", {"b", "a"}),
+            markdown_conversion_cache.get_conversion_key("# Heading", "hash", {"a", "b"})
+        )
+
+    def test_get_conversion_key_changes_with_settings(self):
+        key = markdown_conversion_cache.get_conversion_key("# Heading", "hash", {"a"})
+        self.assertNotEqual(key, markdown_conversion_cache.get_conversion_key("# Heading 2", "hash", {"a"}))
+        self.assertNotEqual(key, markdown_conversion_cache.get_conversion_key("# Heading", "hash 2", {"a"}))
+        self.assertNotEqual(key, markdown_conversion_cache.get_conversion_key("# Heading", "hash", {"a", "b"}))
+
+    def test_read_cached_conversion_missing(self):
+        self.assertIsNone(markdown_conversion_cache.read_cached_conversion("missing"))
+
+    def test_read_cached_conversion_incomplete_file(self):
+        with open(os.path.join(self.cache_directory.name, "broken.pickle"), "wb") as cache_file:
+            cache_file.write(b"\x80")
+        self.assertIsNone(markdown_conversion_cache.read_cached_conversion("broken"))
+
+    def test_cache_disabled(self):
+        with self.settings(MARKDOWN_CONVERSION_CACHE_LOCATION=None):
+            BareBaseLoader().convert_md_content("# Heading\n\nContent")
+        self.assertEqual(os.listdir(self.cache_directory.name), [])
+
+    def test_convert_md_content_stores_conversion(self):
+        content = "# Heading\n\n## Subheading\n\nContent"
+        result = BareBaseLoader().convert_md_content(content)
+        cached_result = BareBaseLoader().convert_md_content(content)
+        self.assertIsNot(result, cached_result)
+        self.assertEqual(len(os.listdir(self.cache_directory.name)), 1)
+        self.assertEqual(cached_result.html_string, result.html_string)
+        self.assertEqual(cached_result.title, result.title)
+        self.assertEqual(cached_result.heading_tree, result.heading_tree)
+        self.assertEqual(cached_result.required_files, result.required_files)
+        self.assertEqual(cached_result.required_glossary_terms, result.required_glossary_terms)
+
+    def test_convert_md_content_remove_title_setting(self):
+        content = "# Heading\n\nContent"
+        BareBaseLoader().convert_md_content(content, remove_title=True)
+        result = BareBaseLoader().convert_md_content(content, remove_title=False)
+        self.assertIn("Heading", result.html_string)
+        self.assertEqual(len(os.listdir(self.cache_directory.name)), 2)
@@ -0,0 +1,62 @@
+"""Test class for markdown_converters module."""
+
+from django.test import SimpleTestCase
+from utils import markdown_converters
+
+TEST_TEMPLATES_PATH = "tests/utils/assets/valid-templates-multiple/"
+
+
+class MarkdownConvertersTest(SimpleTestCase):
+    """Test class for markdown_converters module."""
+
+    def test_load_template_files(self):
+        self.assertEqual(
+            markdown_converters.load_template_files(TEST_TEMPLATES_PATH),
+            {
+                "image": '<img src="{{ file_path }}">\n',
+                "panel": '<div class="panel"></div>\n'
+            }
+        )
+
+    def test_get_template_files_loaded_once(self):
+        with self.settings(CUSTOM_VERTO_TEMPLATES=TEST_TEMPLATES_PATH):
+            (templates, templates_hash) = markdown_converters.get_template_files()
+            self.assertIs(markdown_converters.get_template_files()[0], templates)
+        self.assertNotEqual(markdown_converters.get_template_files()[1], templates_hash)
+
+    def test_get_markdown_processors(self):
+        self.assertIn("remove-title", markdown_converters.get_markdown_processors(True))
+        self.assertNotIn("remove-title", markdown_converters.get_markdown_processors(False))
+
+    def test_get_markdown_converter_shared(self):
+        processors = markdown_converters.get_markdown_processors(True)
+        converter = markdown_converters.get_markdown_converter(processors)
+        self.assertIs(markdown_converters.get_markdown_converter(set(processors)), converter)
+        self.assertIsNot(
+            markdown_converters.get_markdown_converter(markdown_converters.get_markdown_processors(False)),
+            converter
+        )
+
+    def test_convert_markdown_content_remove_title(self):
+        content = "# Heading\n\nContent"
+        result = markdown_converters.convert_markdown_content(
+            content,
+            markdown_converters.get_markdown_processors(True)
+        )
+        self.assertEqual(result.title, "Heading")
+        self.assertNotIn("Heading", result.html_string)
+        result = markdown_converters.convert_markdown_content(
+            content,
+            markdown_converters.get_markdown_processors(False)
+        )
+        self.assertIn("Heading", result.html_string)
+
+    def test_convert_markdown_content_results_not_shared(self):
+        processors = markdown_converters.get_markdown_processors(True)
+        result = markdown_converters.convert_markdown_content(
+            "# Heading\n\n{glossary-link term=\"algorithm\"}Algorithms{glossary-link end}",
+            processors
+        )
+        other_result = markdown_converters.convert_markdown_content("# Heading\n\nContent", processors)
+        self.assertIn("algorithm", result.required_glossary_terms)
+        self.assertNotIn("algorithm", other_result.required_glossary_terms)
@@ -0,0 +1,67 @@
+"""Test class for parse_yaml_file module."""
+
+import os
+import tempfile
+import yaml
+from django.test import SimpleTestCase
+from utils import parse_yaml_file
+
+
+class ParseYAMLFileTest(SimpleTestCase):
+    """Test class for parse_yaml_file module."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.yaml_file_path = os.path.join(self.directory.name, "file.yaml")
+        self.write_yaml_file("slug:\n  name: Name\n")
+
+    def tearDown(self):
+        parse_yaml_file.parsed_yaml_files.clear()
+        self.directory.cleanup()
+
+    def write_yaml_file(self, contents, modified_time=None):
+        with open(self.yaml_file_path, "w") as yaml_file:
+            yaml_file.write(contents)
+        if modified_time is not None:
+            os.utime(self.yaml_file_path, ns=(modified_time, modified_time))
+
+    def test_parse_yaml_file(self):
+        self.assertEqual(
+            parse_yaml_file.parse_yaml_file(self.yaml_file_path),
+            {"slug": {"name": "Name"}}
+        )
+
+    def test_parse_yaml_file_returns_parsed_contents(self):
+        self.assertIs(
+            parse_yaml_file.parse_yaml_file(self.yaml_file_path),
+            parse_yaml_file.parse_yaml_file(self.yaml_file_path)
+        )
+
+    def test_parse_yaml_file_parsed_once(self):
+        parse_yaml_file.parse_yaml_file(self.yaml_file_path)
+        parse_yaml_file.parse_yaml_file(self.yaml_file_path)
+        self.assertEqual(len(parse_yaml_file.parsed_yaml_files), 1)
+
+    def test_parse_yaml_file_modified(self):
+        self.write_yaml_file("slug:\n  name: Name\n", modified_time=1000000000)
+        parse_yaml_file.parse_yaml_file(self.yaml_file_path)
+        self.write_yaml_file("slug:\n  name: New name\n", modified_time=2000000000)
+        self.assertEqual(
+            parse_yaml_file.parse_yaml_file(self.yaml_file_path),
+            {"slug": {"name": "New name"}}
+        )
+
+    def test_parse_yaml_file_missing(self):
+        self.assertRaises(
+            FileNotFoundError,
+            parse_yaml_file.parse_yaml_file,
+            os.path.join(self.directory.name, "missing.yaml")
+        )
+
+    def test_parse_yaml_file_unsafe_tag(self):
+        self.write_yaml_file("slug: !!python/object/apply:os.getcwd []\n")
+        self.assertRaises(
+            yaml.YAMLError,
+            parse_yaml_file.parse_yaml_file,
+            self.yaml_file_path
+        )
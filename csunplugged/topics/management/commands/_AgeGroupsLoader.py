@@ -1,6 +1,6 @@
 """Custom loader for loading age group."""
 
-from django.db import transaction
+from utils.BaseLoader import atomic_load
 from utils.TranslatableModelLoader import TranslatableModelLoader
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
 
@@ -10,7 +10,9 @@ from topics.models import AgeGroup
 class AgeGroupsLoader(TranslatableModelLoader):
     """Loader for age group content."""
 
-    @transaction.atomic
+    loaded_models = [AgeGroup]
+
+    @atomic_load
     def load(self):
         """Load the content for age groups.
 
@@ -23,6 +25,7 @@ class AgeGroupsLoader(TranslatableModelLoader):
         # Use same name as structure file for translations
         age_groups_translations = self.get_yaml_translations(self.structure_filename)
 
+        age_groups = []
         for (age_group_slug, age_group_data) in age_groups_structure.items():
             if age_group_data is None:
                 raise MissingRequiredFieldError(
@@ -56,8 +59,9 @@ class AgeGroupsLoader(TranslatableModelLoader):
             )
             self.populate_translations(age_group, translations)
             self.mark_translation_availability(age_group, required_fields=["description"])
-            age_group.save()
+            age_groups.append(age_group)
 
             self.log("Added age group: {}".format(age_group.__str__()))
 
+        self.save_objects(AgeGroup, age_groups)
         self.log("All age groups loaded!\n")
@@ -1,7 +1,6 @@
 """Custom loader for loading curriculum areas."""
 
-from django.db import transaction
-
+from utils.BaseLoader import atomic_load
 from utils.TranslatableModelLoader import TranslatableModelLoader
 
 from topics.models import ClassroomResource
@@ -10,7 +9,9 @@ from topics.models import ClassroomResource
 class ClassroomResourcesLoader(TranslatableModelLoader):
     """Loader for curriculum area content."""
 
-    @transaction.atomic
+    loaded_models = [ClassroomResource]
+
+    @atomic_load
     def load(self):
         """Load the content for classroom resource.
 
@@ -25,6 +26,7 @@ class ClassroomResourcesLoader(TranslatableModelLoader):
 
         )
 
+        new_resources = []
         for classroom_resource_slug in classroom_resources:
             translations = classroom_resources_translations.get(classroom_resource_slug, dict())
             new_resource = ClassroomResource(
@@ -32,8 +34,9 @@ class ClassroomResourcesLoader(TranslatableModelLoader):
             )
             self.populate_translations(new_resource, translations)
             self.mark_translation_availability(new_resource, required_fields=["description"])
-            new_resource.save()
+            new_resources.append(new_resource)
 
             self.log("Added classroom resource: {}".format(new_resource.__str__()))
 
+        self.save_objects(ClassroomResource, new_resources)
         self.log("All classroom resources loaded!\n")
@@ -1,6 +1,6 @@
 """Custom loader for loading curriculum areas."""
 
-from django.db import transaction
+from utils.BaseLoader import atomic_load
 from utils.TranslatableModelLoader import TranslatableModelLoader
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
 
@@ -10,7 +10,9 @@ from topics.models import CurriculumArea
 class CurriculumAreasLoader(TranslatableModelLoader):
     """Loader for curriculum area content."""
 
-    @transaction.atomic
+    loaded_models = [CurriculumArea]
+
+    @atomic_load
     def load(self):
         """Load the content for curriculum areas.
 
@@ -60,7 +62,7 @@ class CurriculumAreasLoader(TranslatableModelLoader):
             self.populate_translations(new_area, translations)
             self.mark_translation_availability(new_area, required_fields=["name"])
 
-            new_area.save()
+            self.save_object(new_area)
 
             self.log("Added curriculum area: {}".format(new_area.__str__()))
 
@@ -85,7 +87,7 @@ class CurriculumAreasLoader(TranslatableModelLoader):
                     self.populate_translations(new_child, translations)
                     self.mark_translation_availability(new_child, required_fields=["name"])
 
-                    new_child.save()
+                    self.save_object(new_child)
 
                     self.log("Added child curriculum area: {}".format(new_child.__str__()), 1)
 
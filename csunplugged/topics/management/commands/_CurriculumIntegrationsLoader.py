@@ -1,10 +1,9 @@
 """Custom loader for loading curriculum integrations."""
 
-from django.core.exceptions import ObjectDoesNotExist
 from utils.TranslatableModelLoader import TranslatableModelLoader
 from utils.errors.KeyNotFoundError import KeyNotFoundError
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
-from topics.models import CurriculumArea, UnitPlan, Lesson
+from topics.models import CurriculumArea, CurriculumIntegration, Lesson, UnitPlan
 
 
 class CurriculumIntegrationsLoader(TranslatableModelLoader):
@@ -29,6 +28,17 @@ class CurriculumIntegrationsLoader(TranslatableModelLoader):
         """
         structure = self.load_yaml_file(self.structure_file_path)
 
+        # Objects that curriculum integrations can refer to
+        curriculum_areas = self.registry.get_objects(CurriculumArea)
+        unit_plan_slugs = set()
+        lesson_objects = dict()
+        for unit_plan in self.registry.filter(UnitPlan, topic=self.topic):
+            unit_plan_slugs.add(unit_plan.slug)
+            for lesson in self.registry.filter(Lesson, unit_plan=unit_plan):
+                lesson_objects[(unit_plan.slug, lesson.slug)] = lesson
+        curriculum_area_relationships = []
+        prerequisite_lesson_relationships = []
+
         for (integration_slug, integration_data) in structure.items():
             if integration_data is None:
                 raise MissingRequiredFieldError(
@@ -54,27 +64,24 @@ class CurriculumIntegrationsLoader(TranslatableModelLoader):
                     "Curriculum Integration"
                 )
 
-            integration = self.topic.curriculum_integrations.create(
+            integration = CurriculumIntegration(
+                topic=self.topic,
                 slug=integration_slug,
                 number=integration_number,
             )
             self.populate_translations(integration, integration_translations)
             self.mark_translation_availability(integration, required_fields=["name", "content"])
-            integration.save()
+            self.save_object(integration)
 
             # Add curriculum areas
             for curriculum_area_slug in integration_curriculum_areas:
-                try:
-                    curriculum_area = CurriculumArea.objects.get(
-                        slug=curriculum_area_slug
-                    )
-                    integration.curriculum_areas.add(curriculum_area)
-                except ObjectDoesNotExist:
-                    raise KeyNotFoundError(
-                        self.structure_file_path,
+                if curriculum_area_slug not in curriculum_areas:
+                    raise self.key_not_found_error(
+                        CurriculumArea,
                         curriculum_area_slug,
                         "Curriculum Areas"
                     )
+                curriculum_area_relationships.append((integration, curriculum_areas[curriculum_area_slug]))
 
             # Add prerequisite lessons
             if "prerequisite-lessons" in integration_data:
@@ -87,30 +94,23 @@ class CurriculumIntegrationsLoader(TranslatableModelLoader):
                                 ["unit-plan"],
                                 "Prerequisite Lesson"
                             )
-                        try:
-                            UnitPlan.objects.get(
-                                topic__slug=self.topic.slug,
-                                slug=unit_plan_slug
-                            )
-                        except ObjectDoesNotExist:
+                        if unit_plan_slug not in unit_plan_slugs:
                             raise KeyNotFoundError(
                                 self.structure_file_path,
                                 unit_plan_slug,
                                 "Unit Plans"
                             )
                         for lesson_slug in lessons:
-                            try:
-                                lesson = Lesson.objects.get(
-                                    topic__slug=self.topic.slug,
-                                    unit_plan__slug=unit_plan_slug,
-                                    slug=lesson_slug,
-                                )
-                                integration.prerequisite_lessons.add(lesson)
-                            except ObjectDoesNotExist:
+                            lesson = lesson_objects.get((unit_plan_slug, lesson_slug))
+                            if lesson is None:
                                 raise KeyNotFoundError(
                                     self.structure_file_path,
                                     lesson_slug,
                                     "Lessons"
                                 )
+                            prerequisite_lesson_relationships.append((integration, lesson))
 
             self.log("Added curriculum integration: {}".format(integration.name), 1)
+
+        self.add_relationships(CurriculumIntegration.curriculum_areas, curriculum_area_relationships)
+        self.add_relationships(CurriculumIntegration.prerequisite_lessons, prerequisite_lesson_relationships)
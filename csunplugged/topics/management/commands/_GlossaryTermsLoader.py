@@ -1,19 +1,21 @@
 """Custom loader for loading glossary terms."""
 
 from os import listdir
-from django.db import transaction
 
 from utils.language_utils import get_default_language
 from topics.models import GlossaryTerm
+from utils.BaseLoader import atomic_load
 from utils.TranslatableModelLoader import TranslatableModelLoader
 
 
 class GlossaryTermsLoader(TranslatableModelLoader):
     """Custom loader for loading glossary terms."""
 
+    loaded_models = [GlossaryTerm]
+
     FILE_EXTENSION = ".md"
 
-    @transaction.atomic
+    @atomic_load
     def load(self):
         """Load the glossary content into the database."""
         glossary_slugs = set()
@@ -23,6 +25,7 @@ class GlossaryTermsLoader(TranslatableModelLoader):
                 glossary_slug = filename[:-len(self.FILE_EXTENSION)]
                 glossary_slugs.add(glossary_slug)
 
+        glossary_terms = []
         for glossary_slug in glossary_slugs:
             term_translations = self.get_blank_translation_dictionary()
 
@@ -38,8 +41,9 @@ class GlossaryTermsLoader(TranslatableModelLoader):
             )
             self.populate_translations(glossary_term, term_translations)
             self.mark_translation_availability(glossary_term, required_fields=["term", "definition"])
-            glossary_term.save()
+            glossary_terms.append(glossary_term)
 
             self.log("Added glossary term: {}".format(glossary_term.__str__()))
 
+        self.save_objects(GlossaryTerm, glossary_terms)
         self.log("All glossary terms loaded!\n")
@@ -1,9 +1,7 @@
 """Custom loader for loading learning outcomes."""
 
-from django.db import transaction
-from django.core.exceptions import ObjectDoesNotExist
+from utils.BaseLoader import atomic_load
 from utils.TranslatableModelLoader import TranslatableModelLoader
-from utils.errors.KeyNotFoundError import KeyNotFoundError
 from topics.models import (
     LearningOutcome,
     CurriculumArea,
@@ -13,7 +11,9 @@ from topics.models import (
 class LearningOutcomesLoader(TranslatableModelLoader):
     """Custom loader for loading learning outcomes."""
 
-    @transaction.atomic
+    loaded_models = [LearningOutcome]
+
+    @atomic_load
     def load(self):
         """Load the content for learning outcomes.
 
@@ -28,35 +28,38 @@ class LearningOutcomesLoader(TranslatableModelLoader):
             required_slugs=learning_outcomes.keys()
         )
 
+        curriculum_areas = self.registry.get_objects(CurriculumArea)
+        outcomes = []
+        outcome_curriculum_areas = []
+
         for (outcome_slug, outcome_data) in learning_outcomes.items():
             translations = self.get_blank_translation_dictionary()
             translations.update(learning_outcomes_translations.get(outcome_slug, dict()))
 
-            # Create outcome objects and save to db
+            # Create outcome objects, saved to db once all are created
             outcome = LearningOutcome(
                 slug=outcome_slug,
             )
             self.populate_translations(outcome, translations)
             self.mark_translation_availability(outcome, required_fields=["text"])
 
-            outcome.save()
+            outcomes.append(outcome)
 
             # Add curriculum areas
             curriculum_area_slugs = outcome_data.get("curriculum-areas", [])
 
             for curriculum_area_slug in curriculum_area_slugs:
-                try:
-                    curriculum_area = CurriculumArea.objects.get(
-                        slug=curriculum_area_slug
-                    )
-                    outcome.curriculum_areas.add(curriculum_area)
-                except ObjectDoesNotExist:
-                    raise KeyNotFoundError(
-                        self.structure_file_path,
+                if curriculum_area_slug not in curriculum_areas:
+                    raise self.key_not_found_error(
+                        CurriculumArea,
                         curriculum_area_slug,
                         "Curriculum Areas"
                     )
+                outcome_curriculum_areas.append((outcome, curriculum_areas[curriculum_area_slug]))
 
             self.log("Added learning outcome: {}".format(outcome.__str__()))
 
+        self.save_objects(LearningOutcome, outcomes)
+        self.add_relationships(LearningOutcome.curriculum_areas, outcome_curriculum_areas)
+
         self.log("All learning outcomes loaded!\n")
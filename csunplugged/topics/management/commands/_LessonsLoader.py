@@ -1,6 +1,5 @@
 """Custom loader for loading lessons."""
 
-from django.core.exceptions import ObjectDoesNotExist
 from utils.TranslatableModelLoader import TranslatableModelLoader
 from utils.convert_heading_tree_to_dict import convert_heading_tree_to_dict
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
@@ -9,6 +8,7 @@ from utils.errors.InvalidYAMLValueError import InvalidYAMLValueError
 
 
 from topics.models import (
+    Lesson,
     ProgrammingChallenge,
     ProgrammingChallengeNumber,
     LearningOutcome,
@@ -43,6 +43,23 @@ class LessonsLoader(TranslatableModelLoader):
         """
         lessons_structure = self.load_yaml_file(self.structure_file_path)
 
+        # Objects that lessons can refer to, keyed by slug
+        programming_challenges = {
+            programming_challenge.slug: programming_challenge
+            for programming_challenge in self.registry.filter(ProgrammingChallenge, topic=self.topic)
+        }
+        learning_outcomes = self.registry.get_objects(LearningOutcome)
+        classroom_resources = self.registry.get_objects(ClassroomResource)
+        resources = self.registry.get_objects(Resource)
+
+        # Lessons and their relationships are saved together once all
+        # lessons are read, as relationships require the lesson's ID
+        lessons = []
+        lesson_programming_challenges = []
+        lesson_learning_outcomes = []
+        lesson_classroom_resources = []
+        lesson_resource_descriptions = []
+
         for (lesson_slug, lesson_structure) in lessons_structure.items():
 
             if lesson_structure is None:
@@ -88,14 +105,15 @@ class LessonsLoader(TranslatableModelLoader):
             else:
                 lesson_duration = None
 
-            lesson = self.topic.lessons.create(
+            lesson = Lesson(
+                topic=self.topic,
                 unit_plan=self.unit_plan,
                 slug=lesson_slug,
                 duration=lesson_duration,
             )
             self.populate_translations(lesson, lesson_translations)
             self.mark_translation_availability(lesson, required_fields=["name", "content"])
-            lesson.save()
+            lessons.append(lesson)
 
             # Add programming challenges
             if "programming-challenges" in lesson_structure:
@@ -103,13 +121,7 @@ class LessonsLoader(TranslatableModelLoader):
                 if programming_challenge_slugs is not None:
                     # Check all slugs are valid
                     for programming_challenge_slug in programming_challenge_slugs:
-                        try:
-                            ProgrammingChallenge.objects.get(
-                                slug=programming_challenge_slug,
-                                topic=self.topic
-                            )
-
-                        except ObjectDoesNotExist:
+                        if programming_challenge_slug not in programming_challenges:
                             raise KeyNotFoundError(
                                 self.structure_file_path,
                                 programming_challenge_slug,
@@ -121,10 +133,10 @@ class LessonsLoader(TranslatableModelLoader):
                     # They will be stored as 1.1, 2.1, and 2.2 respectively.
 
                     # Order challenges for numbering.
-                    programming_challenges = ProgrammingChallenge.objects.filter(
-                        slug__in=programming_challenge_slugs,
-                        topic=self.topic
-                    ).order_by("challenge_set_number", "challenge_number")
+                    lesson_challenges = sorted(
+                        set(programming_challenges[slug] for slug in programming_challenge_slugs),
+                        key=lambda challenge: (challenge.challenge_set_number, challenge.challenge_number)
+                    )
 
                     # Setup variables for numbering.
                     display_set_number = 0
@@ -134,7 +146,7 @@ class LessonsLoader(TranslatableModelLoader):
 
                     # For each challenge, increment number variables if original
                     # numbers are different.
-                    for programming_challenge in programming_challenges:
+                    for programming_challenge in lesson_challenges:
                         if programming_challenge.challenge_set_number > last_set_number:
                             display_set_number += 1
                             display_number = 0
@@ -144,15 +156,11 @@ class LessonsLoader(TranslatableModelLoader):
                         last_set_number = programming_challenge.challenge_set_number
                         last_number = programming_challenge.challenge_number
 
-                        # Create and save relationship between lesson and
-                        # challenge that contains challenge number.
-                        relationship = ProgrammingChallengeNumber(
-                            programming_challenge=programming_challenge,
-                            lesson=lesson,
-                            challenge_set_number=display_set_number,
-                            challenge_number=display_number,
+                        # Relationship between lesson and challenge that
+                        # contains challenge number.
+                        lesson_programming_challenges.append(
+                            (lesson, programming_challenge, display_set_number, display_number)
                         )
-                        relationship.save()
 
             # Add learning outcomes
             if "learning-outcomes" in lesson_structure:
@@ -166,63 +174,72 @@ class LessonsLoader(TranslatableModelLoader):
                     )
                 else:
                     for learning_outcome_slug in learning_outcome_slugs:
-                        try:
-                            learning_outcome = LearningOutcome.objects.get(
-                                slug=learning_outcome_slug
-                            )
-                            lesson.learning_outcomes.add(learning_outcome)
-                        except ObjectDoesNotExist:
-                            raise KeyNotFoundError(
-                                self.structure_file_path,
+                        if learning_outcome_slug not in learning_outcomes:
+                            raise self.key_not_found_error(
+                                LearningOutcome,
                                 learning_outcome_slug,
                                 "Learning Outcomes"
                             )
+                        lesson_learning_outcomes.append((lesson, learning_outcomes[learning_outcome_slug]))
 
             # Add classroom resources
             if "classroom-resources" in lesson_structure:
                 classroom_resources_slugs = lesson_structure["classroom-resources"]
                 if classroom_resources_slugs is not None:
                     for classroom_resources_slug in classroom_resources_slugs:
-                        try:
-                            classroom_resource = ClassroomResource.objects.get(
-                                slug=classroom_resources_slug
-                            )
-                            lesson.classroom_resources.add(classroom_resource)
-                        except ObjectDoesNotExist:
-                            raise KeyNotFoundError(
-                                self.structure_file_path,
+                        if classroom_resources_slug not in classroom_resources:
+                            raise self.key_not_found_error(
+                                ClassroomResource,
                                 classroom_resources_slug,
                                 "Classroom Resources"
                             )
+                        lesson_classroom_resources.append((lesson, classroom_resources[classroom_resources_slug]))
 
             # Add generated resources
             if "generated-resources" in lesson_structure:
-                resources = lesson_structure["generated-resources"]
-                if resources is not None:
+                generated_resources = lesson_structure["generated-resources"]
+                if generated_resources is not None:
                     relationship_strings_filename = "{}-resource-descriptions.yaml".format(lesson_slug)
                     relationship_translations = self.get_yaml_translations(
                         relationship_strings_filename,
                     )
-                    for resource_slug in resources:
+                    for resource_slug in generated_resources:
                         relationship_translation = relationship_translations.get(resource_slug, dict())
-                        try:
-                            resource = Resource.objects.get(
-                                slug=resource_slug
-                            )
-                        except ObjectDoesNotExist:
-                            raise KeyNotFoundError(
-                                self.structure_file_path,
+                        if resource_slug not in resources:
+                            raise self.key_not_found_error(
+                                Resource,
                                 resource_slug,
                                 "Resources"
                             )
 
                         relationship = ResourceDescription(
-                            resource=resource,
-                            lesson=lesson,
+                            resource=resources[resource_slug],
                         )
                         self.populate_translations(relationship, relationship_translation)
                         self.mark_translation_availability(relationship, required_fields=["description"])
-
-                        relationship.save()
+                        lesson_resource_descriptions.append((lesson, relationship))
 
             self.log("Added lesson: {}".format(lesson.__str__()), 2)
+
+        self.save_objects(Lesson, lessons)
+        self.save_objects(
+            ProgrammingChallengeNumber,
+            [
+                ProgrammingChallengeNumber(
+                    programming_challenge=programming_challenge,
+                    lesson=lesson,
+                    challenge_set_number=challenge_set_number,
+                    challenge_number=challenge_number,
+                )
+                for (lesson, programming_challenge, challenge_set_number, challenge_number)
+                in lesson_programming_challenges
+            ]
+        )
+        self.add_relationships(Lesson.learning_outcomes, lesson_learning_outcomes)
+        self.add_relationships(Lesson.classroom_resources, lesson_classroom_resources)
+        for (lesson, relationship) in lesson_resource_descriptions:
+            relationship.lesson = lesson
+        self.save_objects(
+            ResourceDescription,
+            [relationship for (lesson, relationship) in lesson_resource_descriptions]
+        )
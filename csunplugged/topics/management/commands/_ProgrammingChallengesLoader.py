@@ -1,14 +1,13 @@
 """Custom loader for loading programming challenges."""
 
 import os.path
-from django.core.exceptions import ObjectDoesNotExist
-from utils.errors.KeyNotFoundError import KeyNotFoundError
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
 from utils.TranslatableModelLoader import TranslatableModelLoader
 
 
 from topics.models import (
     LearningOutcome,
+    ProgrammingChallenge,
     ProgrammingChallengeDifficulty,
     ProgrammingChallengeLanguage,
     ProgrammingChallengeImplementation,
@@ -38,6 +37,15 @@ class ProgrammingChallengesLoader(TranslatableModelLoader):
         """
         programming_challenges_structure = self.load_yaml_file(self.structure_file_path)
 
+        # Objects that programming challenges can refer to
+        difficulties = self.registry.get_objects(ProgrammingChallengeDifficulty, key_field="level")
+        prog_languages = self.registry.get_objects(ProgrammingChallengeLanguage)
+        learning_outcome_objects = self.registry.get_objects(LearningOutcome)
+
+        # Saved together once all challenges are read
+        implementations = []
+        challenge_learning_outcomes = []
+
         for (challenge_slug, challenge_structure) in programming_challenges_structure.items():
 
             if challenge_structure is None:
@@ -81,18 +89,16 @@ class ProgrammingChallengesLoader(TranslatableModelLoader):
                 for language, content in extra_challenge_translations.items():
                     challenge_translations[language]["extra_challenge"] = content.html_string
 
-            try:
-                difficulty_level = ProgrammingChallengeDifficulty.objects.get(
-                    level=challenge_difficulty
-                )
-            except ObjectDoesNotExist:
-                raise KeyNotFoundError(
-                    self.structure_file_path,
+            difficulty_level = difficulties.get(challenge_difficulty)
+            if difficulty_level is None:
+                raise self.key_not_found_error(
+                    ProgrammingChallengeDifficulty,
                     challenge_difficulty,
                     "Programming Challenge Difficulty"
                 )
 
-            programming_challenge = self.topic.programming_challenges.create(
+            programming_challenge = ProgrammingChallenge(
+                topic=self.topic,
                 slug=challenge_slug,
                 challenge_set_number=challenge_set_number,
                 challenge_number=challenge_number,
@@ -101,7 +107,7 @@ class ProgrammingChallengesLoader(TranslatableModelLoader):
             self.populate_translations(programming_challenge, challenge_translations)
             self.mark_translation_availability(programming_challenge, required_fields=["name", "content"])
 
-            programming_challenge.save()
+            self.save_object(programming_challenge)
 
             LOG_TEMPLATE = "Added programming challenge: {}"
             self.log(LOG_TEMPLATE.format(programming_challenge.name), 1)
@@ -114,13 +120,10 @@ class ProgrammingChallengesLoader(TranslatableModelLoader):
                             "programming-languages", "difficulty-level"],
                         "Programming Challenge"
                     )
-                try:
-                    prog_language_object = ProgrammingChallengeLanguage.objects.get(
-                        slug=prog_language
-                    )
-                except ObjectDoesNotExist:
-                    raise KeyNotFoundError(
-                        self.structure_file_path,
+                prog_language_object = prog_languages.get(prog_language)
+                if prog_language_object is None:
+                    raise self.key_not_found_error(
+                        ProgrammingChallengeLanguage,
                         prog_language,
                         "Programming Challenge Language"
                     )
@@ -163,7 +166,7 @@ class ProgrammingChallengesLoader(TranslatableModelLoader):
                 self.populate_translations(implementation, implementation_translations)
                 self.mark_translation_availability(implementation, required_fields=["solution", "expected_result"])
 
-                implementation.save()
+                implementations.append(implementation)
 
                 LOG_TEMPLATE = "Added language implementation: {}"
                 self.log(LOG_TEMPLATE.format(implementation.language), 2)
@@ -172,13 +175,14 @@ class ProgrammingChallengesLoader(TranslatableModelLoader):
                 learning_outcomes = challenge_structure["learning-outcomes"]
                 if learning_outcomes is not None:
                     for learning_outcome_slug in learning_outcomes:
-                        try:
-                            learning_outcome = LearningOutcome.objects.get(
-                                slug=learning_outcome_slug
-                            )
-                            programming_challenge.learning_outcomes.add(learning_outcome)
-                        except ObjectDoesNotExist:
-                            raise KeyNotFoundError(
-                                self.structure_file_path,
+                        if learning_outcome_slug not in learning_outcome_objects:
+                            raise self.key_not_found_error(
+                                LearningOutcome,
                                 learning_outcome_slug,
                                 "Learning Outcome")
+                        challenge_learning_outcomes.append(
+                            (programming_challenge, learning_outcome_objects[learning_outcome_slug])
+                        )
+
+        self.save_objects(ProgrammingChallengeImplementation, implementations)
+        self.add_relationships(ProgrammingChallenge.learning_outcomes, challenge_learning_outcomes)
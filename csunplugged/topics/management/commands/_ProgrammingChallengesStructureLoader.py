@@ -1,8 +1,8 @@
 """Custom loader for loading structure of programming challenges."""
 
 import os
-from django.db import transaction
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
+from utils.BaseLoader import atomic_load
 from utils.TranslatableModelLoader import TranslatableModelLoader
 from topics.models import ProgrammingChallengeLanguage, ProgrammingChallengeDifficulty
 
@@ -10,7 +10,9 @@ from topics.models import ProgrammingChallengeLanguage, ProgrammingChallengeDiff
 class ProgrammingChallengesStructureLoader(TranslatableModelLoader):
     """Custom loader for loading structure of programming challenges."""
 
-    @transaction.atomic
+    loaded_models = [ProgrammingChallengeDifficulty, ProgrammingChallengeLanguage]
+
+    @atomic_load
     def load(self):
         """Load the content for structure of programming challenges.
 
@@ -72,7 +74,7 @@ class ProgrammingChallengesStructureLoader(TranslatableModelLoader):
             translations = prog_languages_translations.get(prog_language, dict())
             self.populate_translations(new_prog_language, translations)
             self.mark_translation_availability(new_prog_language, required_fields=["name"])
-            new_prog_language.save()
+            self.save_object(new_prog_language)
 
             self.log("Added programming language: {}".format(new_prog_language.__str__()))
 
@@ -95,7 +97,7 @@ class ProgrammingChallengesStructureLoader(TranslatableModelLoader):
             translations = difficulties_translations.get(difficulty_slug, dict())
             self.populate_translations(new_difficulty, translations)
             self.mark_translation_availability(new_difficulty, required_fields=["name"])
-            new_difficulty.save()
+            self.save_object(new_difficulty)
 
             self.log("Added programming difficulty level: {}".format(new_difficulty.__str__()))
 
@@ -1,7 +1,7 @@
 """Custom loader for loading a topic."""
 
 import os.path
-from django.db import transaction
+from utils.BaseLoader import atomic_load
 from utils.TranslatableModelLoader import TranslatableModelLoader
 from utils.check_required_files import find_image_files
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
@@ -22,7 +22,7 @@ class TopicLoader(TranslatableModelLoader):
         self.factory = factory
         self.topic_slug = self.content_path
 
-    @transaction.atomic
+    @atomic_load
     def load(self):
         """Load the content for a topic.
 
@@ -72,7 +72,7 @@ class TopicLoader(TranslatableModelLoader):
 
         self.populate_translations(topic, topic_translations)
         self.mark_translation_availability(topic, required_fields=["name", "content"])
-        topic.save()
+        self.save_object(topic)
 
         self.log("Added Topic: {}".format(topic.name))
 
@@ -1,7 +1,6 @@
 """Custom loader for loading unit plans."""
 
 import os.path
-from django.core.exceptions import ObjectDoesNotExist
 from utils.TranslatableModelLoader import TranslatableModelLoader
 from utils.convert_heading_tree_to_dict import convert_heading_tree_to_dict
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
@@ -12,6 +11,7 @@ from topics.models import (
     Lesson,
     LessonNumber,
     AgeGroup,
+    UnitPlan,
 )
 
 
@@ -61,7 +61,8 @@ class UnitPlanLoader(TranslatableModelLoader):
             for language, content in ct_links_translations.items():
                 unit_plan_translations[language]["computational_thinking_links"] = content.html_string
 
-        unit_plan = self.topic.unit_plans.create(
+        unit_plan = UnitPlan(
+            topic=self.topic,
             slug=self.unit_plan_slug,
             languages=list(content_translations.keys()),
         )
@@ -69,7 +70,7 @@ class UnitPlanLoader(TranslatableModelLoader):
         self.populate_translations(unit_plan, unit_plan_translations)
         self.mark_translation_availability(unit_plan, required_fields=["name", "content"])
 
-        unit_plan.save()
+        self.save_object(unit_plan)
 
         self.log("Added unit plan: {}".format(unit_plan.name), 1)
 
@@ -104,15 +105,17 @@ class UnitPlanLoader(TranslatableModelLoader):
                 "Unit Plan"
             )
 
+        # Objects that lesson numbers can refer to, keyed by slug
+        age_group_objects = self.registry.get_objects(AgeGroup)
+        lessons = {lesson.slug: lesson for lesson in self.registry.filter(Lesson, unit_plan=unit_plan)}
+
+        lesson_numbers = []
         for (age_group_slug, age_group_data) in age_groups.items():
 
-            try:
-                age_group = AgeGroup.objects.get(
-                    slug=age_group_slug
-                )
-            except ObjectDoesNotExist:
-                raise KeyNotFoundError(
-                    self.structure_file_path,
+            age_group = age_group_objects.get(age_group_slug)
+            if age_group is None:
+                raise self.key_not_found_error(
+                    AgeGroup,
                     age_group_slug,
                     "Age Range"
                 )
@@ -125,11 +128,8 @@ class UnitPlanLoader(TranslatableModelLoader):
                 )
 
             for (lesson_slug, lesson_data) in age_group_data.items():
-                try:
-                    lesson = Lesson.objects.get(
-                        slug=lesson_slug
-                    )
-                except ObjectDoesNotExist:
+                lesson = lessons.get(lesson_slug)
+                if lesson is None:
                     raise KeyNotFoundError(
                         self.structure_file_path,
                         lesson_slug,
@@ -145,9 +145,11 @@ class UnitPlanLoader(TranslatableModelLoader):
                 else:
                     lesson_number = lesson_data.get("number", None)
 
-                relationship = LessonNumber(
-                    age_group=age_group,
-                    lesson=lesson,
-                    number=lesson_number,
+                lesson_numbers.append(
+                    LessonNumber(
+                        age_group=age_group,
+                        lesson=lesson,
+                        number=lesson_number,
+                    )
                 )
-                relationship.save()
+        self.save_objects(LessonNumber, lesson_numbers)
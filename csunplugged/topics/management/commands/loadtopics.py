@@ -1,10 +1,26 @@
 """Module for the custom Django loadtopics command."""
 
+import os
 import os.path
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
+from django.utils.translation import to_locale
 from utils.BaseLoader import BaseLoader
 from utils.LoaderFactory import LoaderFactory
+from utils.check_required_files import start_image_checks, finish_image_checks
+from utils.content_version import update_content_version
+from utils.convert_markdown_files import (
+    converted_markdown,
+    convert_markdown_files,
+    find_markdown_files,
+    start_worker_pool,
+    stop_worker_pool,
+)
+from utils.language_utils import get_available_languages
+from utils.parse_yaml_file import parsed_yaml_files
+from utils.errors.Error import Error
+from utils.errors.ReferenceNotCheckedError import ReferenceNotCheckedError
+from utils.errors.CouldNotFindImagesError import CouldNotFindImagesError
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
 
 
@@ -13,14 +29,59 @@ class Command(BaseCommand):
 
     help = "Converts Markdown files listed in structure file and stores"
 
+    def add_arguments(self, parser):
+        """Add optional parameters to loadtopics command."""
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of processes for converting Markdown files, 1 converts files while loading",
+        )
+        parser.add_argument(
+            "--topic",
+            action="append",
+            dest="topics",
+            metavar="SLUG",
+            help="Only load the given topic (can be repeated), without loading content shared by topics",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            dest="check",
+            help="Check content for errors without using the database, reporting all errors found",
+        )
+
     def handle(self, *args, **options):
         """Automatically called when the loadresources command is given.
 
+        Markdown files are first converted across a pool of processes,
+        and then the content is loaded into the database in order.
+
+        If topics are given, only those topics are loaded. Content shared
+        by topics (such as glossary terms) must already be loaded, and the
+        given topics must not be.
+
+        If checking content, all content (including resources and content
+        shared by topics) is read without using the database, and errors
+        found in each loader are reported together.
+
         Raise:
             MissingRequiredFieldError: when no object can be found with the matching
                 attribute.
+            CouldNotFindImagesError: when images referenced by content cannot be found.
+            CommandError: when an option value is invalid, or errors are found
+                when checking content.
         """
-        factory = LoaderFactory()
+        if options["processes"] < 1:
+            raise CommandError("--processes must be at least 1.")
+
+        factory = LoaderFactory(check=options["check"])
+        # Errors found in content, if checking content
+        self.errors = [] if options["check"] else None
+        # References to content that failed to load, if checking content
+        self.unchecked_references = []
+        # Shared content is always checked, as it is not read from the database
+        load_shared_content = options["check"] or not options["topics"]
 
         # Get structure and content files
         base_loader = BaseLoader()
@@ -34,25 +95,145 @@ class Command(BaseCommand):
 
         structure_file = base_loader.load_yaml_file(structure_file_path)
 
+        if structure_file.get("topics", None) is None or not isinstance(structure_file["topics"], list):
+            raise MissingRequiredFieldError(
+                structure_file_path,
+                ["topics"],
+                "Application Structure"
+            )
+
+        if options["topics"]:
+            for topic in options["topics"]:
+                if topic not in structure_file["topics"]:
+                    raise CommandError("Topic {} is not listed in {}.".format(topic, structure_file_path))
+            topics = [topic for topic in structure_file["topics"] if topic in options["topics"]]
+        else:
+            topics = structure_file["topics"]
+
+        # Missing images are reported together once all content is loaded
+        start_image_checks()
+        try:
+            if options["processes"] > 1:
+                # Worker processes are kept while loading, to convert the
+                # translations of files not converted in advance in parallel
+                start_worker_pool(options["processes"])
+                language_directories = [
+                    os.path.join(base_path, to_locale(language)) for language in get_available_languages()
+                ]
+                if load_shared_content:
+                    md_directories = language_directories
+                else:
+                    md_directories = [
+                        os.path.join(directory, topic) for directory in language_directories for topic in topics
+                    ]
+                if options["check"]:
+                    md_directories += [
+                        os.path.join(settings.RESOURCES_CONTENT_BASE_PATH, to_locale(language))
+                        for language in get_available_languages()
+                    ]
+                count = convert_markdown_files(find_markdown_files(md_directories), options["processes"])
+                print("Converted {} Markdown files with {} processes".format(count, options["processes"]))
+
+            if options["check"]:
+                # Resources are referenced by lessons
+                self.run_loader(factory.create_resources_loader(
+                    base_path=settings.RESOURCES_CONTENT_BASE_PATH,
+                    structure_filename="resources.yaml",
+                ))
+
+            if load_shared_content:
+                self.load_shared_content(factory, base_path, structure_file, structure_file_path)
+
+            for topic in topics:
+                topic_path = topic
+                topic_structure_file = "{}.yaml".format(topic)
+                self.run_loader(factory.create_topic_loader(
+                    base_path=base_path,
+                    content_path=topic_path,
+                    structure_filename=topic_structure_file
+                ))
+        finally:
+            stop_worker_pool()
+            missing_images = finish_image_checks()
+            converted_markdown.clear()
+            parsed_yaml_files.clear()
+
+        if options["check"]:
+            if missing_images:
+                self.errors.append(CouldNotFindImagesError(missing_images))
+            for error in self.errors:
+                self.stderr.write(str(error))
+            if self.unchecked_references:
+                self.stderr.write(
+                    "\nThe following content was not fully checked, as it references content with errors:"
+                )
+                for reference in self.unchecked_references:
+                    self.stderr.write(str(reference))
+            if self.errors:
+                raise CommandError("Found {} error(s) in content.".format(len(self.errors)))
+            print("No errors found in content")
+            return
+        # Each loader has already committed its content, so pages of the
+        # previous content must no longer be served, even if images are missing
+        update_content_version()
+        if missing_images:
+            raise CouldNotFindImagesError(missing_images)
+
+    def run_loader(self, loader):
+        """Run the load method of a loader.
+
+        If checking content, errors found in the content are collected
+        rather than raised, so the remaining content can be checked.
+        When a loader fails, objects it creates may be missing, so keys
+        referencing them are reported separately from errors.
+
+        Args:
+            loader: Loader object (BaseLoader).
+        """
+        if self.errors is None:
+            loader.load()
+            return
+        try:
+            loader.load()
+        except ReferenceNotCheckedError as reference:
+            self.unchecked_references.append(reference)
+            loader.registry.mark_failed(loader.loaded_models)
+        except (Error, FileNotFoundError) as error:
+            self.errors.append(error)
+            loader.registry.mark_failed(loader.loaded_models)
+
+    def load_shared_content(self, factory, base_path, structure_file, structure_file_path):
+        """Load content that is shared by all topics.
+
+        Args:
+            factory: LoaderFactory object for creating loaders (LoaderFactory).
+            base_path: Path to topics content directory (str).
+            structure_file: Contents of structure file (dict).
+            structure_file_path: Path to structure file (str).
+
+        Raise:
+            MissingRequiredFieldError: when no object can be found with the matching
+                attribute.
+        """
         if "curriculum-areas" in structure_file:
             curriculum_areas_structure_file_path = structure_file["curriculum-areas"]
             if curriculum_areas_structure_file_path is not None:
                 curriculum_areas_path, structure_filename = os.path.split(curriculum_areas_structure_file_path)
-                factory.create_curriculum_areas_loader(
+                self.run_loader(factory.create_curriculum_areas_loader(
                     base_path=base_path,
                     content_path=curriculum_areas_path,
                     structure_filename=structure_filename
-                ).load()
+                ))
 
         if "learning-outcomes" in structure_file:
             learning_outcomes_structure_file_path = structure_file["learning-outcomes"]
             if learning_outcomes_structure_file_path is not None:
                 learning_outcomes_path, structure_filename = os.path.split(learning_outcomes_structure_file_path)
-                factory.create_learning_outcomes_loader(
+                self.run_loader(factory.create_learning_outcomes_loader(
                     base_path=base_path,
                     content_path=learning_outcomes_path,
                     structure_filename=structure_filename
-                ).load()
+                ))
 
         if "programming-challenges-structure" in structure_file:
             programming_challenges_structure_file_path = structure_file["programming-challenges-structure"]
@@ -60,11 +241,11 @@ class Command(BaseCommand):
                 programming_challenges_path, structure_filename = os.path.split(
                     programming_challenges_structure_file_path
                 )
-                factory.create_programming_challenges_structure_loader(
+                self.run_loader(factory.create_programming_challenges_structure_loader(
                     base_path=base_path,
                     content_path=programming_challenges_path,
                     structure_filename=structure_filename
-                ).load()
+                ))
 
         if "classroom-resources" in structure_file:
             classroom_resources_structure_file_path = structure_file["classroom-resources"]
@@ -72,19 +253,19 @@ class Command(BaseCommand):
                 classroom_resources_path, structure_filename = os.path.split(
                     classroom_resources_structure_file_path
                 )
-                factory.create_classroom_resources_loader(
+                self.run_loader(factory.create_classroom_resources_loader(
                     base_path=base_path,
                     content_path=classroom_resources_path,
                     structure_filename=structure_filename
-                ).load()
+                ))
 
         if "glossary-folder" in structure_file:
             glossary_folder_path = structure_file["glossary-folder"]
             if glossary_folder_path is not None:
-                factory.create_glossary_terms_loader(
+                self.run_loader(factory.create_glossary_terms_loader(
                     base_path=base_path,
                     content_path=glossary_folder_path,
-                ).load()
+                ))
 
         age_groups_structure_file_path = structure_file.get("age-groups", None)
         if age_groups_structure_file_path is None:
@@ -95,24 +276,8 @@ class Command(BaseCommand):
             )
         else:
             age_groups_path, structure_filename = os.path.split(age_groups_structure_file_path)
-            factory.create_age_groups_loader(
+            self.run_loader(factory.create_age_groups_loader(
                 content_path=age_groups_path,
                 base_path=base_path,
                 structure_filename=structure_filename
-            ).load()
-
-        if structure_file.get("topics", None) is None or not isinstance(structure_file["topics"], list):
-            raise MissingRequiredFieldError(
-                structure_file_path,
-                ["topics"],
-                "Application Structure"
-            )
-        else:
-            for topic in structure_file["topics"]:
-                topic_path = topic
-                topic_structure_file = "{}.yaml".format(topic)
-                factory.create_topic_loader(
-                    base_path=base_path,
-                    content_path=topic_path,
-                    structure_filename=topic_structure_file
-                ).load()
+            ))
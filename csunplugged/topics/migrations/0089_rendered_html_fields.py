@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.5 on 2026-10-19 09:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('topics', '0088_auto_20171126_2001'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='curriculumintegration',
+            name='content_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='curriculumintegration',
+            name='content_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='curriculumintegration',
+            name='content_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='curriculumintegration',
+            name='content_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='glossaryterm',
+            name='definition_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='glossaryterm',
+            name='definition_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='glossaryterm',
+            name='definition_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='glossaryterm',
+            name='definition_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='computational_thinking_links_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='computational_thinking_links_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='computational_thinking_links_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='computational_thinking_links_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='content_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='content_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='content_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='content_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='programming_challenges_description_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='programming_challenges_description_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='programming_challenges_description_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='programming_challenges_description_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallenge',
+            name='content_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='programmingchallenge',
+            name='content_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallenge',
+            name='content_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallenge',
+            name='content_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallenge',
+            name='extra_challenge_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='programmingchallenge',
+            name='extra_challenge_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallenge',
+            name='extra_challenge_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallenge',
+            name='extra_challenge_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='expected_result_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='expected_result_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='expected_result_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='expected_result_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='hints_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='hints_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='hints_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='hints_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='solution_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='solution_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='solution_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='programmingchallengeimplementation',
+            name='solution_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='content_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='content_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='content_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='content_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='other_resources_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='other_resources_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='other_resources_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='other_resources_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='unitplan',
+            name='computational_thinking_links_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='unitplan',
+            name='computational_thinking_links_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='unitplan',
+            name='computational_thinking_links_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='unitplan',
+            name='computational_thinking_links_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='unitplan',
+            name='content_rendered',
+            field=models.TextField(default=''),
+        ),
+        migrations.AddField(
+            model_name='unitplan',
+            name='content_rendered_en',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='unitplan',
+            name='content_rendered_xx_lr',
+            field=models.TextField(default='', null=True),
+        ),
+        migrations.AddField(
+            model_name='unitplan',
+            name='content_rendered_yy_rl',
+            field=models.TextField(default='', null=True),
+        ),
+    ]
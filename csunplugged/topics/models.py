@@ -9,10 +9,13 @@ from utils.TranslatableModel import TranslatableModel
 class GlossaryTerm(TranslatableModel):
     """Model for glossary term in database."""
 
+    rendered_html_fields = ("definition",)
+
     #  Auto-incrementing 'id' field is automatically set by Django
     slug = models.SlugField(unique=True)
     term = models.CharField(max_length=200, unique=True)
     definition = models.TextField()
+    definition_rendered = models.TextField(default="")
 
     def __str__(self):
         """Text representation of GlossaryTerm object.
@@ -97,11 +100,15 @@ class ClassroomResource(TranslatableModel):
 class Topic(TranslatableModel):
     """Model for topic in database."""
 
+    rendered_html_fields = ("content", "other_resources")
+
     #  Auto-incrementing 'id' field is automatically set by Django
     slug = models.SlugField(unique=True)
     name = models.CharField(max_length=100, default="")
     content = models.TextField(default="")
+    content_rendered = models.TextField(default="")
     other_resources = models.TextField(default="")
+    other_resources_rendered = models.TextField(default="")
     icon = models.CharField(max_length=100, null=True)
 
     def __str__(self):
@@ -116,6 +123,8 @@ class Topic(TranslatableModel):
 class UnitPlan(TranslatableModel):
     """Model for unit plan in database."""
 
+    rendered_html_fields = ("content", "computational_thinking_links")
+
     #  Auto-incrementing 'id' field is automatically set by Django
     topic = models.ForeignKey(
         Topic,
@@ -125,7 +134,9 @@ class UnitPlan(TranslatableModel):
     slug = models.SlugField()
     name = models.CharField(max_length=100, default="")
     content = models.TextField(default="")
+    content_rendered = models.TextField(default="")
     computational_thinking_links = models.TextField(default="")
+    computational_thinking_links_rendered = models.TextField(default="")
     heading_tree = JSONField(default=dict)
 
     def __str__(self):
@@ -156,6 +167,8 @@ class ProgrammingChallengeDifficulty(TranslatableModel):
 class ProgrammingChallenge(TranslatableModel):
     """Model for programming challenge in database."""
 
+    rendered_html_fields = ("content", "extra_challenge")
+
     #  Auto-incrementing 'id' field is automatically set by Django
     topic = models.ForeignKey(
         Topic,
@@ -167,7 +180,9 @@ class ProgrammingChallenge(TranslatableModel):
     challenge_set_number = models.PositiveSmallIntegerField()
     challenge_number = models.PositiveSmallIntegerField()
     content = models.TextField(default="")
+    content_rendered = models.TextField(default="")
     extra_challenge = models.TextField(default="")
+    extra_challenge_rendered = models.TextField(default="")
     learning_outcomes = models.ManyToManyField(
         LearningOutcome,
         related_name="programming_challenges"
@@ -181,9 +196,15 @@ class ProgrammingChallenge(TranslatableModel):
     def ordered_implementations(self):
         """Return an ordered QuerySet of implementations.
 
+        If the implementations were prefetched with
+        ordered_implementations_prefetch(), these are returned
+        without querying the database.
+
         Returns:
-            Ordered QuerySet.
+            Ordered QuerySet, or list of prefetched implementations.
         """
+        if hasattr(self, "prefetched_implementations"):
+            return self.prefetched_implementations
         return self.implementations.all().order_by("language__number").select_related()
 
     def __str__(self):
@@ -216,6 +237,8 @@ class ProgrammingChallengeLanguage(TranslatableModel):
 class ProgrammingChallengeImplementation(TranslatableModel):
     """Model for programming challenge language implementation in database."""
 
+    rendered_html_fields = ("expected_result", "hints", "solution")
+
     #  Auto-incrementing 'id' field is automatically set by Django
     topic = models.ForeignKey(
         Topic,
@@ -233,8 +256,11 @@ class ProgrammingChallengeImplementation(TranslatableModel):
         related_name="implementations"
     )
     expected_result = models.TextField(default="")
+    expected_result_rendered = models.TextField(default="")
     hints = models.TextField(default="")
+    hints_rendered = models.TextField(default="")
     solution = models.TextField(default="")
+    solution_rendered = models.TextField(default="")
 
     def __str__(self):
         """Text representation of ProgrammingChallengeImplementation.
@@ -275,6 +301,8 @@ class AgeGroup(TranslatableModel):
 class Lesson(TranslatableModel):
     """Model for lesson in database."""
 
+    rendered_html_fields = ("content", "computational_thinking_links", "programming_challenges_description")
+
     #  Auto-incrementing 'id' field is automatically set by Django
     topic = models.ForeignKey(
         Topic,
@@ -290,7 +318,9 @@ class Lesson(TranslatableModel):
     name = models.CharField(max_length=100, default="")
     duration = models.PositiveSmallIntegerField(null=True)
     content = models.TextField(default="")
+    content_rendered = models.TextField(default="")
     computational_thinking_links = models.TextField(default="")
+    computational_thinking_links_rendered = models.TextField(default="")
     heading_tree = JSONField(default=list)
     age_group = models.ManyToManyField(
         AgeGroup,
@@ -303,6 +333,7 @@ class Lesson(TranslatableModel):
         related_name="lessons"
     )
     programming_challenges_description = models.TextField(default="")
+    programming_challenges_description_rendered = models.TextField(default="")
     learning_outcomes = models.ManyToManyField(
         LearningOutcome,
         related_name="lessons"
@@ -328,21 +359,27 @@ class Lesson(TranslatableModel):
     def retrieve_related_programming_challenges(self):
         """Retrieve the lesson's programming challenges and update numbers.
 
+        The challenges, their difficulties and their ordered implementations
+        are retrieved with a fixed number of queries.
+
         Returns:
-            QuerySet of programming challenges with updated numbers.
+            List of programming challenges with updated numbers.
         """
-        programming_challenges = self.programming_challenges.order_by(
-            "challenge_set_number",
-            "challenge_number",
-            "name",
+        challenge_numbers = ProgrammingChallengeNumber.objects.filter(lesson=self).select_related(
+            "programming_challenge__difficulty"
+        ).prefetch_related(
+            ordered_implementations_prefetch("programming_challenge__implementations")
+        ).order_by(
+            "programming_challenge__challenge_set_number",
+            "programming_challenge__challenge_number",
+            "programming_challenge__name",
         )
-        for programming_challenge in programming_challenges:
-            challenge_numbers = ProgrammingChallengeNumber.objects.get(
-                lesson=self,
-                programming_challenge=programming_challenge
-            )
-            programming_challenge.challenge_set_number = challenge_numbers.challenge_set_number
-            programming_challenge.challenge_number = challenge_numbers.challenge_number
+        programming_challenges = []
+        for relationship in challenge_numbers:
+            programming_challenge = relationship.programming_challenge
+            programming_challenge.challenge_set_number = relationship.challenge_set_number
+            programming_challenge.challenge_number = relationship.challenge_number
+            programming_challenges.append(programming_challenge)
         return programming_challenges
 
     def __str__(self):
@@ -381,6 +418,8 @@ class ProgrammingChallengeNumber(models.Model):
 class CurriculumIntegration(TranslatableModel):
     """Model for curriculum integration in database."""
 
+    rendered_html_fields = ("content",)
+
     #  Auto-incrementing 'id' field is automatically set by Django
     topic = models.ForeignKey(
         Topic,
@@ -391,6 +430,7 @@ class CurriculumIntegration(TranslatableModel):
     number = models.PositiveSmallIntegerField()
     name = models.CharField(max_length=200, default="")
     content = models.TextField(default="")
+    content_rendered = models.TextField(default="")
     curriculum_areas = models.ManyToManyField(
         CurriculumArea,
         related_name="curriculum_integrations",
@@ -425,3 +465,22 @@ class ResourceDescription(TranslatableModel):
     resource = models.ForeignKey(Resource, on_delete=models.CASCADE)
     lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE)
     description = models.CharField(max_length=300, default="")
+
+
+def ordered_implementations_prefetch(lookup="implementations"):
+    """Return prefetch of programming challenge implementations ordered by language.
+
+    The implementations are stored on each challenge for use by
+    ProgrammingChallenge.ordered_implementations().
+
+    Args:
+        lookup: Lookup from the queried model to the implementations (str).
+
+    Returns:
+        Prefetch object.
+    """
+    return models.Prefetch(
+        lookup,
+        queryset=ProgrammingChallengeImplementation.objects.select_related("language").order_by("language__number"),
+        to_attr="prefetched_implementations",
+    )
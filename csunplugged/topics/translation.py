@@ -25,73 +25,110 @@ from topics.models import (
 class TopicTranslationOptions(TranslationOptions):
     """Translation options for Topic model."""
 
-    fields = ("name", "content", "other_resources")
+    fields = ("name", "content", "content_rendered", "other_resources", "other_resources_rendered")
     fallback_undefined = {
         "content": None,
-        "other_resources": None
+        "content_rendered": None,
+        "other_resources": None,
+        "other_resources_rendered": None,
     }
 
 
 class UnitPlanTranslationOptions(TranslationOptions):
     """Translation options for UnitPlan model."""
 
-    fields = ("name", "content", "computational_thinking_links", "heading_tree")
+    fields = (
+        "name",
+        "content",
+        "content_rendered",
+        "computational_thinking_links",
+        "computational_thinking_links_rendered",
+        "heading_tree",
+    )
     fallback_undefined = {
         "content": None,
+        "content_rendered": None,
         "computational_thinking_links": None,
-        "heading_tree": None
+        "computational_thinking_links_rendered": None,
+        "heading_tree": None,
     }
 
 
 class ProgrammingChallengeTranslationOptions(TranslationOptions):
     """Translation options for ProgrammingChallenge model."""
 
-    fields = ("name", "content", "extra_challenge")
+    fields = ("name", "content", "content_rendered", "extra_challenge", "extra_challenge_rendered")
     fallback_undefined = {
         "content": None,
+        "content_rendered": None,
         "extra_challenge": None,
+        "extra_challenge_rendered": None,
     }
 
 
 class ProgrammingChallengeImplementationTranslationOptions(TranslationOptions):
     """Translation options for ProgrammingChallengeImplementation model."""
 
-    fields = ("expected_result", "hints", "solution")
+    fields = (
+        "expected_result",
+        "expected_result_rendered",
+        "hints",
+        "hints_rendered",
+        "solution",
+        "solution_rendered",
+    )
     fallback_undefined = {
         "expected_result": None,
+        "expected_result_rendered": None,
         "hints": None,
-        "solution": None
+        "hints_rendered": None,
+        "solution": None,
+        "solution_rendered": None,
     }
 
 
 class LessonTranslationOptions(TranslationOptions):
     """Translation options for Lesson model."""
 
-    fields = ("name", "content", "computational_thinking_links", "programming_challenges_description", "heading_tree")
+    fields = (
+        "name",
+        "content",
+        "content_rendered",
+        "computational_thinking_links",
+        "computational_thinking_links_rendered",
+        "programming_challenges_description",
+        "programming_challenges_description_rendered",
+        "heading_tree",
+    )
     fallback_undefined = {
         "content": None,
+        "content_rendered": None,
         "computational_thinking_links": None,
+        "computational_thinking_links_rendered": None,
         "programming_challenges_description": None,
-        "heading_tree": None
+        "programming_challenges_description_rendered": None,
+        "heading_tree": None,
     }
 
 
 class CurriculumIntegrationTranslationOptions(TranslationOptions):
     """Translation options for CurriculumIntegration model."""
 
-    fields = ("name", "content")
+    fields = ("name", "content", "content_rendered")
     fallback_undefined = {
         "content": None,
+        "content_rendered": None,
     }
 
 
 class GlossaryTermTranslationOptions(TranslationOptions):
     """Translation options for GlossaryTerm model."""
 
-    fields = ("term", "definition")
+    fields = ("term", "definition", "definition_rendered")
     fallback_undefined = {
         "term": None,
-        "definition": None
+        "definition": None,
+        "definition_rendered": None,
     }
 
 
@@ -1,20 +1,32 @@
 """Add lesson min and max ages to given list of objects."""
 
-from topics.models import AgeGroup
+from django.db.models import F, Func, IntegerField, Max, Min
+
+LESSON_AGES_FIELD = "lessons__age_group__ages"
 
 
 def add_lesson_ages_to_objects(objects):
     """Add lesson min and max ages to given list of objects.
 
+    The ages for all objects are calculated with a single aggregate
+    query. Objects without any lessons have ages of None.
+
     Args:
-        objects: List of objects of lessons.
+        objects: List or QuerySet of objects of lessons, all of the same model.
 
     Returns:
         Modified list of objects.
     """
-    age_groups = AgeGroup.objects.distinct()
+    if not objects:
+        return objects
+    model = type(objects[0])
+    lesson_ages = model.objects.filter(
+        pk__in=[item.pk for item in objects]
+    ).order_by().values_list("pk").annotate(
+        min_age=Min(Func(F(LESSON_AGES_FIELD), function="LOWER", output_field=IntegerField())),
+        max_age=Max(Func(F(LESSON_AGES_FIELD), function="UPPER", output_field=IntegerField())),
+    )
+    lesson_ages = {pk: (min_age, max_age) for (pk, min_age, max_age) in lesson_ages}
     for item in objects:
-        item_age_groups = list(age_groups.filter(lessons__id__in=item.lessons.all()))
-        item.min_age = item_age_groups[0].ages.lower
-        item.max_age = item_age_groups[-1].ages.upper
+        (item.min_age, item.max_age) = lesson_ages.get(item.pk, (None, None))
     return objects
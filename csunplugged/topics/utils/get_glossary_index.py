@@ -0,0 +1,57 @@
+"""Return an in-memory index of glossary terms for a language."""
+
+from django.utils.translation import get_language
+from config.templatetags.render_html_field import render_stored_html_field
+from topics.models import GlossaryTerm
+from utils.content_version import get_content_version
+
+# Glossary indexes for the current content version, keyed by language
+glossary_indexes = dict()
+glossary_indexes_version = None
+
+
+def get_glossary_index():
+    """Return glossary term data for the active language, keyed by slug.
+
+    The index is built once per process for each language, and rebuilt
+    when the content version changes. When no content version has been
+    recorded, the index is built for every call.
+
+    Returns:
+        Dictionary of glossary term data, each containing the slug,
+        whether a translation is available, the term, and the rendered
+        definition HTML (dict).
+    """
+    global glossary_indexes_version
+    content_version = get_content_version()
+    if content_version is None:
+        return build_glossary_index()
+    if content_version != glossary_indexes_version:
+        glossary_indexes.clear()
+        glossary_indexes_version = content_version
+    language = get_language()
+    index = glossary_indexes.get(language)
+    if index is None:
+        index = build_glossary_index()
+        glossary_indexes[language] = index
+    return index
+
+
+def build_glossary_index():
+    """Return glossary term data for the active language from the database.
+
+    Returns:
+        Dictionary of glossary term data, keyed by slug (dict).
+    """
+    index = dict()
+    for glossary_term in GlossaryTerm.objects.all():
+        index[glossary_term.slug] = {
+            "slug": glossary_term.slug,
+            "translated": glossary_term.translation_available,
+            "term": glossary_term.term,
+            "definition": str(render_stored_html_field(
+                glossary_term.definition_rendered,
+                glossary_term.definition
+            )),
+        }
+    return index
@@ -1,16 +1,17 @@
 """Views for the topics application."""
 
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.shortcuts import get_object_or_404
 from django.views import generic
 from django.http import JsonResponse, Http404
-from config.templatetags.render_html_field import render_html_with_static
 from topics.utils.add_lesson_ages_to_objects import add_lesson_ages_to_objects
+from topics.utils.get_glossary_index import get_glossary_index
 from utils.group_lessons_by_age import group_lessons_by_age
 from django.utils.translation import get_language
 from .models import (
     Topic,
     CurriculumIntegration,
+    CurriculumArea,
     UnitPlan,
     Lesson,
     LessonNumber,
@@ -172,34 +173,39 @@ class LessonView(generic.DetailView):
         context = super(LessonView, self).get_context_data(**kwargs)
         # Loading objects under consistent context names for breadcrumbs
         context["lesson_ages"] = []
-        for age_group in self.object.age_group.order_by("ages"):
-            number = LessonNumber.objects.get(lesson=self.object, age_group=age_group).number
+        lesson_numbers = LessonNumber.objects.filter(lesson=self.object).select_related(
+            "age_group"
+        ).order_by("age_group__ages")
+        for lesson_number in lesson_numbers:
             context["lesson_ages"].append(
                 {
-                    "lower": age_group.ages.lower,
-                    "upper": age_group.ages.upper,
-                    "number": number,
+                    "lower": lesson_number.age_group.ages.lower,
+                    "upper": lesson_number.age_group.ages.upper,
+                    "number": lesson_number.number,
                 }
             )
         context["topic"] = self.object.topic
         context["unit_plan"] = self.object.unit_plan
         # Add all the connected programming challenges
         context["programming_challenges"] = self.object.programming_challenges.exists()
-        # Add all the connected learning outcomes
-        context["learning_outcomes"] = self.object.learning_outcomes(manager="translated_objects") \
-                                           .all().select_related()
-        context["classroom_resources"] = self.object.classroom_resources(manager="translated_objects") \
-                                             .all().select_related()
+        # Add all the connected learning outcomes, with their curriculum areas
+        # (and parent areas, used in the area names) fetched in one query
+        context["learning_outcomes"] = self.object.learning_outcomes(manager="translated_objects").prefetch_related(
+            Prefetch("curriculum_areas", queryset=CurriculumArea.objects.select_related("parent"))
+        )
+        context["classroom_resources"] = self.object.classroom_resources(manager="translated_objects").all()
         # Add all the connected generated resources
-        related_resources = self.object.generated_resources.order_by("name")
+        resource_descriptions = ResourceDescription.objects.filter(lesson=self.object).select_related(
+            "resource"
+        ).order_by("resource__name")
         generated_resources = []
-        for related_resource in related_resources:
+        for resource_description in resource_descriptions:
+            related_resource = resource_description.resource
             generated_resource = dict()
             generated_resource["slug"] = related_resource.slug
             generated_resource["name"] = related_resource.name
             generated_resource["thumbnail"] = related_resource.thumbnail_static_path
-            relationship = ResourceDescription.objects.get(resource=related_resource, lesson=self.object)
-            generated_resource["description"] = relationship.description
+            generated_resource["description"] = resource_description.description
             generated_resources.append(generated_resource)
         context["generated_resources"] = generated_resources
 
@@ -258,17 +264,20 @@ class ProgrammingChallengeView(generic.DetailView):
         """
         # Call the base implementation first to get a context
         context = super(ProgrammingChallengeView, self).get_context_data(**kwargs)
-        context["lessons"] = self.object.lessons.all()
-        for lesson in context["lessons"]:
-            challenge_numbers = ProgrammingChallengeNumber.objects.get(
-                lesson=lesson,
-                programming_challenge=self.object
-            )
-            lesson.challenge_set_number = challenge_numbers.challenge_set_number
-            lesson.challenge_number = challenge_numbers.challenge_number
+        challenge_numbers = ProgrammingChallengeNumber.objects.filter(
+            programming_challenge=self.object
+        ).select_related("lesson__unit_plan").prefetch_related("lesson__age_group").order_by("lesson_id")
+        context["lessons"] = []
+        for relationship in challenge_numbers:
+            lesson = relationship.lesson
+            lesson.challenge_set_number = relationship.challenge_set_number
+            lesson.challenge_number = relationship.challenge_number
+            context["lessons"].append(lesson)
         context["topic"] = self.object.topic
         # Add all the connected learning outcomes
-        context["learning_outcomes"] = self.object.learning_outcomes(manager="translated_objects").all()
+        context["learning_outcomes"] = self.object.learning_outcomes(manager="translated_objects").prefetch_related(
+            Prefetch("curriculum_areas", queryset=CurriculumArea.objects.select_related("parent"))
+        )
         context["implementations"] = self.object.ordered_implementations()
         return context
 
@@ -399,30 +408,35 @@ class GlossaryList(generic.ListView):
 
 
 def glossary_json(request, **kwargs):
-    """Provide JSON data for glossary term.
+    """Provide JSON data for glossary terms.
+
+    A single term is requested with the 'term' parameter. Many terms
+    are requested with the 'terms' parameter, containing comma separated
+    slugs, and are returned in a dictionary keyed by slug. Slugs of terms
+    that do not exist are left out of the dictionary.
 
     Args:
         request: The HTTP request.
 
     Returns:
-        JSON response is sent containing data for the requested term.
+        JSON response is sent containing data for the requested terms.
 
     Raises:
         404 error if term not found.
     """
     # If term parameter, then return JSON
     if "term" in request.GET:
-        glossary_slug = request.GET.get("term")
-        glossary_item = get_object_or_404(
-            GlossaryTerm,
-            slug=glossary_slug
-        )
-        data = {
-            "slug": glossary_slug,
-            "translated": glossary_item.translation_available,
-            "term": glossary_item.term,
-            "definition": render_html_with_static(glossary_item.definition)
-        }
-        return JsonResponse(data)
+        glossary_item = get_glossary_index().get(request.GET.get("term"))
+        if glossary_item is None:
+            raise Http404("Glossary term not found.")
+        return JsonResponse(glossary_item)
+    elif "terms" in request.GET:
+        glossary_index = get_glossary_index()
+        data = dict()
+        for glossary_slug in request.GET.get("terms").split(","):
+            glossary_item = glossary_index.get(glossary_slug)
+            if glossary_item is not None:
+                data[glossary_slug] = glossary_item
+        return JsonResponse({"terms": data})
     else:
         raise Http404("Term parameter not specified.")
@@ -1,18 +1,29 @@
 """Base loader used to create custom loaders for content."""
 
 import yaml
-import mdx_math
 import abc
 import sys
-import re
+import functools
 import os.path
-from os import listdir
-from verto import Verto
+from django.db import transaction
 from verto.errors.StyleError import StyleError
-from django.conf import settings
 from django.utils.translation import to_locale
 from .check_required_files import check_converter_required_files
 from .check_glossary_links import check_converter_glossary_links
+from .SlugRegistry import SlugRegistry
+from .bulk_add_relationships import bulk_add_relationships
+from .parse_yaml_file import parse_yaml_file
+from .convert_markdown_files import get_converted_markdown
+from .markdown_conversion_cache import (
+    get_conversion_key,
+    read_cached_conversion,
+    write_cached_conversion,
+)
+from .markdown_converters import (
+    get_template_files,
+    get_markdown_processors,
+    convert_markdown_content,
+)
 from utils.errors.CouldNotFindMarkdownFileError import CouldNotFindMarkdownFileError
 from utils.errors.MarkdownStyleError import MarkdownStyleError
 from utils.errors.EmptyMarkdownFileError import EmptyMarkdownFileError
@@ -20,12 +31,38 @@ from utils.errors.EmptyYAMLFileError import EmptyYAMLFileError
 from utils.errors.InvalidYAMLFileError import InvalidYAMLFileError
 from utils.errors.NoHeadingFoundInMarkdownFileError import NoHeadingFoundInMarkdownFileError
 from utils.errors.CouldNotFindYAMLFileError import CouldNotFindYAMLFileError
+from utils.errors.KeyNotFoundError import KeyNotFoundError
+from utils.errors.ReferenceNotCheckedError import ReferenceNotCheckedError
+
+
+def atomic_load(load):
+    """Run a loader's load method in a database transaction.
+
+    No transaction is started when the loader is only checking content.
+
+    Args:
+        load: Load method of a loader class (function).
+
+    Returns:
+        Wrapped load method (function).
+    """
+    @functools.wraps(load)
+    def wrapper(self, *args, **kwargs):
+        if self.check:
+            return load(self, *args, **kwargs)
+        with transaction.atomic():
+            return load(self, *args, **kwargs)
+    return wrapper
 
 
 class BaseLoader():
     """Base loader class for individual loaders."""
 
-    def __init__(self, base_path="", structure_dir="structure", content_path="", structure_filename=""):
+    # Models of objects created by the loader, that are referenced by other loaders
+    loaded_models = []
+
+    def __init__(self, base_path="", structure_dir="structure", content_path="", structure_filename="",
+                 registry=None, check=False):
         """Create a BaseLoader object.
 
         Args:
@@ -33,12 +70,19 @@ class BaseLoader():
             structure_dir: name of directory under base_path storing structure files (str).
             content_path: path within locale/structure dir to content directory, eg. "binary-numbers/unit-plan" (str).
             structure_filename: name of yaml file, eg. "unit-plan.yaml" (str).
+            registry: registry of objects shared by loaders of a load, a new
+                registry is created if not given (SlugRegistry).
+            check: if True, content is checked without using the database, and
+                created objects are only added to the registry (bool).
         """
         self.base_path = base_path
         self.structure_dir = structure_dir
         self.content_path = content_path
         self.structure_filename = structure_filename
-        self.setup_md_to_html_converter()
+        self.check = check
+        if registry is None:
+            registry = SlugRegistry(read_database=not check)
+        self.registry = registry
 
     def get_localised_file(self, language, filename):
         """Get full path to localised version of given file.
@@ -85,22 +129,6 @@ class BaseLoader():
             self.structure_filename
         )
 
-    def setup_md_to_html_converter(self):
-        """Create Markdown converter.
-
-        The converter is created with custom processors, html templates,
-        and extensions.
-        """
-        templates = self.load_template_files()
-        extensions = [
-            "markdown.extensions.fenced_code",
-            "markdown.extensions.codehilite",
-            "markdown.extensions.sane_lists",
-            "markdown.extensions.tables",
-            mdx_math.MathExtension()
-        ]
-        self.converter = Verto(html_templates=templates, extensions=extensions)
-
     def convert_md_file(self, md_file_path, config_file_path, heading_required=True, remove_title=True):
         """Return the Verto object for a given Markdown file.
 
@@ -123,20 +151,17 @@ class BaseLoader():
         """
         try:
             # Check file exists
-            content = open(md_file_path, encoding="UTF-8").read()
+            with open(md_file_path, encoding="UTF-8") as md_file:
+                content = md_file.read()
         except FileNotFoundError:
             raise CouldNotFindMarkdownFileError(md_file_path, config_file_path)
 
-        custom_processors = self.converter.processor_defaults()
-        if remove_title:
-            custom_processors.add("remove-title")
-        self.converter.update_processors(custom_processors)
-
-        result = None
-        try:
-            result = self.converter.convert(content)
-        except StyleError as e:
-            raise MarkdownStyleError(md_file_path, e) from e
+        result = get_converted_markdown(content, remove_title)
+        if result is None:
+            try:
+                result = self.convert_md_content(content, remove_title)
+            except StyleError as e:
+                raise MarkdownStyleError(md_file_path, e) from e
 
         if heading_required:
             if result.title is None:
@@ -145,7 +170,30 @@ class BaseLoader():
         if len(result.html_string) == 0:
             raise EmptyMarkdownFileError(md_file_path)
         check_converter_required_files(result.required_files, md_file_path)
-        check_converter_glossary_links(result.required_glossary_terms, md_file_path)
+        check_converter_glossary_links(result.required_glossary_terms, md_file_path, self.registry)
+        return result
+
+    def convert_md_content(self, content, remove_title=True):
+        """Return the Verto object for the given Markdown content.
+
+        Conversions are stored on disk, so unchanged content is only
+        converted again if the converter's settings change. Content is
+        converted by a converter shared by all loaders.
+
+        Args:
+            content: Markdown content to convert (str).
+            remove_title: Boolean if the content's first heading should be removed (bool).
+
+        Returns:
+            VertoResult object
+        """
+        processors = get_markdown_processors(remove_title)
+        (templates, templates_hash) = get_template_files()
+        key = get_conversion_key(content, templates_hash, processors)
+        result = read_cached_conversion(key)
+        if result is None:
+            result = convert_markdown_content(content, processors)
+            write_cached_conversion(key, result)
         return result
 
     def log(self, message, indent_amount=0):
@@ -162,6 +210,9 @@ class BaseLoader():
     def load_yaml_file(self, yaml_file_path):
         """Load and read given YAML file.
 
+        The contents are shared with other loaders reading the same file,
+        so they must not be changed.
+
         Args:
             file_path: location of yaml file to read (str).
 
@@ -174,12 +225,9 @@ class BaseLoader():
             EmptyYAMLFileError: when a give config file is empty.
         """
         try:
-            yaml_file = open(yaml_file_path, encoding="UTF-8").read()
+            yaml_contents = parse_yaml_file(yaml_file_path)
         except FileNotFoundError:
             raise CouldNotFindYAMLFileError(yaml_file_path)
-
-        try:
-            yaml_contents = yaml.load(yaml_file)
         except yaml.YAMLError:
             raise InvalidYAMLFileError(yaml_file_path)
 
@@ -191,20 +239,70 @@ class BaseLoader():
 
         return yaml_contents
 
+    def save_object(self, model_object):
+        """Save a new object and add it to the registry.
+
+        When checking content, the object is only added to the registry.
+
+        Args:
+            model_object: Object to save (Model).
+        """
+        if not self.check:
+            model_object.save()
+        self.registry.add([model_object])
+
+    def save_objects(self, model, model_objects):
+        """Save new objects of a model together and add them to the registry.
+
+        When checking content, the objects are only added to the registry.
+
+        Args:
+            model: Model class of objects (Model).
+            model_objects: List of objects to save (list).
+        """
+        if not self.check:
+            model.objects.bulk_create(model_objects)
+        self.registry.add(model_objects)
+
+    def add_relationships(self, relationship, pairs):
+        """Add relationships between saved objects.
+
+        When checking content, no relationships are added.
+
+        Args:
+            relationship: Many to many relationship descriptor of the source model,
+                for example Lesson.learning_outcomes.
+            pairs: Iterable of tuples of source and target objects (iterable).
+        """
+        if not self.check:
+            bulk_add_relationships(relationship, pairs)
+
+    def key_not_found_error(self, model, key, field):
+        """Return the error for a key that did not match any object of a model.
+
+        If the loader of the model failed while checking content, the key
+        may have been valid, so it is reported as not checked instead.
+
+        Args:
+            model: Model class of objects the key refers to (Model).
+            key: Key that did not match any object (str).
+            field: Name of the objects the key refers to (str).
+
+        Returns:
+            KeyNotFoundError, or ReferenceNotCheckedError if the loader
+            of the model failed.
+        """
+        if self.registry.has_failed(model):
+            return ReferenceNotCheckedError(self.structure_file_path, key, field)
+        return KeyNotFoundError(self.structure_file_path, key, field)
+
     def load_template_files(self):
         """Load custom HTML templates for converter.
 
         Returns:
             templates: dictionary of html templates
         """
-        templates = dict()
-        template_path = settings.CUSTOM_VERTO_TEMPLATES
-        for file in listdir(template_path):
-            template_file = re.search(r"(.*?).html$", file)
-            if template_file:
-                template_name = template_file.groups()[0]
-                templates[template_name] = open(template_path + file).read()
-        return templates
+        return get_template_files()[0]
 
     @abc.abstractmethod
     def load(self):
@@ -12,55 +12,68 @@ from topics.management.commands._TopicLoader import TopicLoader
 from topics.management.commands._UnitPlanLoader import UnitPlanLoader
 from topics.management.commands._ClassroomResourcesLoader import ClassroomResourcesLoader
 from resources.management.commands._ResourcesLoader import ResourcesLoader
+from utils.SlugRegistry import SlugRegistry
 
 
 class LoaderFactory:
-    """Factory for creating loader objects."""
+    """Factory for creating loader objects.
+
+    All loaders created by a factory share a registry of loaded objects.
+    """
+
+    def __init__(self, check=False):
+        """Create a LoaderFactory object.
+
+        Args:
+            check: if True, loaders check content without using the database (bool).
+        """
+        self.check = check
+        self.registry = SlugRegistry(read_database=not check)
 
     def create_age_groups_loader(self, **kwargs):
         """Create age group loader."""
-        return AgeGroupsLoader(**kwargs)
+        return AgeGroupsLoader(registry=self.registry, check=self.check, **kwargs)
 
     def create_curriculum_areas_loader(self, **kwargs):
         """Create curriculum area loader."""
-        return CurriculumAreasLoader(**kwargs)
+        return CurriculumAreasLoader(registry=self.registry, check=self.check, **kwargs)
 
     def create_curriculum_integrations_loader(self, topic, **kwargs):
         """Create curriculum integrations loader."""
-        return CurriculumIntegrationsLoader(topic, **kwargs)
+        return CurriculumIntegrationsLoader(topic, registry=self.registry, check=self.check, **kwargs)
 
     def create_glossary_terms_loader(self, **kwargs):
         """Create glossary terms loader."""
-        return GlossaryTermsLoader(**kwargs)
+        return GlossaryTermsLoader(registry=self.registry, check=self.check, **kwargs)
 
     def create_learning_outcomes_loader(self, **kwargs):
         """Create learning outcomes loader."""
-        return LearningOutcomesLoader(**kwargs)
+        return LearningOutcomesLoader(registry=self.registry, check=self.check, **kwargs)
 
     def create_lessons_loader(self, topic, unit_plan, **kwargs):
         """Create lessons loader."""
-        return LessonsLoader(topic, unit_plan, **kwargs)
+        return LessonsLoader(topic, unit_plan, registry=self.registry, check=self.check, **kwargs)
 
     def create_classroom_resources_loader(self, **kwargs):
         """Create lessons loader."""
-        return ClassroomResourcesLoader(**kwargs)
+        return ClassroomResourcesLoader(registry=self.registry, check=self.check, **kwargs)
 
     def create_programming_challenges_loader(self, topic, **kwargs):
         """Create programming challenges loader."""
-        return ProgrammingChallengesLoader(topic, **kwargs)
+        return ProgrammingChallengesLoader(topic, registry=self.registry, check=self.check, **kwargs)
 
     def create_programming_challenges_structure_loader(self, **kwargs):
         """Create programming challenges structure loader."""
-        return ProgrammingChallengesStructureLoader(**kwargs)
+        return ProgrammingChallengesStructureLoader(registry=self.registry, check=self.check, **kwargs)
 
     def create_topic_loader(self, **kwargs):
         """Create topic loader."""
-        return TopicLoader(self, **kwargs)
+        return TopicLoader(self, registry=self.registry, check=self.check, **kwargs)
 
     def create_unit_plan_loader(self, topic, **kwargs):
         """Create unit plan loader."""
-        return UnitPlanLoader(self, topic, **kwargs)
+        return UnitPlanLoader(self, topic, registry=self.registry, check=self.check, **kwargs)
 
     def create_resources_loader(self, **kwargs):
         """Create resources loader."""
-        return ResourcesLoader(**kwargs)
+        return ResourcesLoader(registry=self.registry, check=self.check, **kwargs)
@@ -0,0 +1,139 @@
+"""Registry of objects referenced by loaders, keyed by slug."""
+
+
+class SlugRegistry:
+    """Registry of objects referenced by loaders, keyed by slug.
+
+    Objects of a model are read from the database once, when first
+    requested, and objects created by loaders are added as they are
+    saved. This allows all references between content to be resolved
+    without a query per reference.
+
+    If the registry does not read the database, only objects added to
+    the registry are found, which allows content to be checked without
+    a database.
+    """
+
+    def __init__(self, read_database=True):
+        """Create an empty registry.
+
+        Args:
+            read_database: Boolean if objects are read from the database (bool).
+        """
+        self.read_database = read_database
+        self.objects = dict()
+        # All added objects, keyed by model, if the database is not read
+        self.added_objects = dict()
+        # Models whose loader failed, so objects of them may be missing
+        self.failed_models = set()
+
+    def get_objects(self, model, key_field="slug"):
+        """Return all objects of a model, keyed by the given field.
+
+        Args:
+            model: Model class (Model).
+            key_field: Name of the field to key objects by (str).
+
+        Returns:
+            Dictionary of objects, keyed by field value (dict).
+        """
+        registry_key = (model, key_field)
+        if registry_key not in self.objects:
+            if self.read_database:
+                model_objects = model.objects.all()
+            else:
+                model_objects = self.added_objects.get(model, [])
+            self.objects[registry_key] = {
+                getattr(model_object, key_field): model_object
+                for model_object in model_objects
+            }
+        return self.objects[registry_key]
+
+    def get(self, model, value, key_field="slug"):
+        """Return the object of a model with the given field value.
+
+        Args:
+            model: Model class (Model).
+            value: Value of key field (str).
+            key_field: Name of the field to key objects by (str).
+
+        Returns:
+            Model object, or None if no object has the value.
+        """
+        return self.get_objects(model, key_field).get(value)
+
+    def filter(self, model, **values):
+        """Return objects of a model with the given field values.
+
+        These objects are not kept by the registry, so each call reads
+        the database (if the registry reads the database). A field name
+        ending with "__in" matches any value within the given values.
+
+        Args:
+            model: Model class (Model).
+            values: Field values of objects to return, keyed by field name.
+
+        Returns:
+            Iterable of objects.
+        """
+        if self.read_database:
+            return model.objects.filter(**values)
+        return [
+            model_object for model_object in self.added_objects.get(model, [])
+            if all(self.matches(model_object, field, value) for (field, value) in values.items())
+        ]
+
+    @staticmethod
+    def matches(model_object, field, value):
+        """Return True if the field of an object matches the value.
+
+        Args:
+            model_object: Model object (Model).
+            field: Name of field, optionally ending with "__in" (str).
+            value: Value to match, or iterable of values if field ends with "__in".
+
+        Returns:
+            True if the field matches, otherwise False (bool).
+        """
+        if field.endswith("__in"):
+            return getattr(model_object, field[:-len("__in")]) in value
+        return getattr(model_object, field) == value
+
+    def add(self, model_objects):
+        """Add saved objects to the registry.
+
+        If the database is read, objects are only added for models
+        already read from the database, as other models are read when
+        first requested.
+
+        Args:
+            model_objects: Iterable of saved objects (iterable).
+        """
+        for model_object in model_objects:
+            if not self.read_database:
+                self.added_objects.setdefault(type(model_object), []).append(model_object)
+            for ((model, key_field), objects) in self.objects.items():
+                if isinstance(model_object, model):
+                    objects[getattr(model_object, key_field)] = model_object
+
+    def mark_failed(self, models):
+        """Record that the loader of the given models failed.
+
+        Objects of these models may be missing from the registry, so
+        references to them cannot be checked.
+
+        Args:
+            models: Iterable of model classes (iterable).
+        """
+        self.failed_models.update(models)
+
+    def has_failed(self, model):
+        """Return True if the loader of a model failed.
+
+        Args:
+            model: Model class (Model).
+
+        Returns:
+            True if the loader of the model failed, otherwise False (bool).
+        """
+        return model in self.failed_models
@@ -31,6 +31,10 @@ class TranslatableModel(models.Model):
 
     languages = ArrayField(models.CharField(max_length=10), default=[])
 
+    # HTML fields with a "<field>_rendered" variant, storing the HTML
+    # with static template tags resolved when the content is loaded.
+    rendered_html_fields = ()
+
     objects = models.Manager()
     translated_objects = TranslatedModelManager()
     untranslated_objects = UntranslatedModelManager()
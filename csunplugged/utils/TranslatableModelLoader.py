@@ -1,12 +1,14 @@
 """Module for TranslatableModelLoader abstract base class."""
 
 from utils.BaseLoader import BaseLoader
+from utils.convert_markdown_files import convert_markdown_translations
 from utils.language_utils import get_available_languages, get_default_language
 from utils.errors.CouldNotFindYAMLFileError import CouldNotFindYAMLFileError
 from utils.errors.CouldNotFindMarkdownFileError import CouldNotFindMarkdownFileError
 from utils.errors.InvalidYAMLValueError import InvalidYAMLValueError
 from utils.errors.MissingRequiredModelsError import MissingRequiredModelsError
 from utils.errors.MissingRequiredFieldError import MissingRequiredFieldError
+from config.templatetags.render_html_field import render_html_with_static
 from django.utils import translation
 from modeltranslation.utils import fallbacks
 
@@ -111,14 +113,17 @@ class TranslatableModelLoader(BaseLoader):
             CouldNotFindMarkdownFileError if the requested file could not be found
                 in the /en directory tree
         """
+        md_file_paths = {
+            language: self.get_localised_file(language, filename) for language in get_available_languages()
+        }
+        # Convert all languages in parallel, if worker processes are running
+        convert_markdown_translations(md_file_paths.values(), kwargs.get("remove_title", True))
+
         content_translations = {}
-        for language in get_available_languages():
+        for (language, md_file_path) in md_file_paths.items():
             try:
                 content_translations[language] = self.convert_md_file(
-                    self.get_localised_file(
-                        language,
-                        filename,
-                    ),
+                    md_file_path,
                     self.structure_file_path,
                     **kwargs
                 )
@@ -131,6 +136,9 @@ class TranslatableModelLoader(BaseLoader):
     def populate_translations(model, model_translations_dict):
         """Populate the translation fields of the given model.
 
+        Fields listed in the model's rendered_html_fields also have their
+        rendered variant populated, with static template tags resolved.
+
         Args:
             model: TranslatableModel instance
             model_translations_dict: dictionary of form
@@ -145,6 +153,8 @@ class TranslatableModelLoader(BaseLoader):
             with translation.override(language):
                 for field, value in values_dict.items():
                     setattr(model, field, value)
+                    if field in model.rendered_html_fields:
+                        setattr(model, "{}_rendered".format(field), render_html_with_static(value))
 
     @staticmethod
     def mark_translation_availability(model, required_fields=[]):
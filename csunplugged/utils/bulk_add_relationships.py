@@ -0,0 +1,25 @@
+"""Save many-to-many relationships for many objects at once."""
+
+
+def bulk_add_relationships(relationship, pairs):
+    """Save many-to-many relationships with a single query.
+
+    Each pair is only saved once, as with the related manager's add() method.
+
+    Args:
+        relationship: Many-to-many field of a model, for example
+            Lesson.learning_outcomes.
+        pairs: Iterable of tuples of saved source object and saved
+            target object (iterable).
+    """
+    source_field_name = relationship.field.m2m_field_name()
+    target_field_name = relationship.field.m2m_reverse_field_name()
+    added_pairs = set()
+    through_objects = []
+    for (source, target) in pairs:
+        if (source.pk, target.pk) not in added_pairs:
+            added_pairs.add((source.pk, target.pk))
+            through_objects.append(
+                relationship.through(**{source_field_name: source, target_field_name: target})
+            )
+    relationship.through.objects.bulk_create(through_objects)
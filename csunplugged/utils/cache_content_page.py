@@ -0,0 +1,71 @@
+"""Cache responses of content views until the content is next loaded."""
+
+from functools import wraps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.utils.cache import get_cache_key, learn_cache_key
+from utils.content_version import get_content_version
+
+CONTENT_PAGE_KEY_PREFIX_TEMPLATE = "content-page:{}"
+
+
+def cache_content_page(view_function):
+    """Cache successful responses of a content view.
+
+    Responses are cached by URL and active language (and any headers the
+    response varies on), with a key prefix of the content version.
+    When content is loaded the version changes, so pages of previous
+    content are no longer used.
+
+    Only GET requests are cached, and pages are not cached when no
+    content version has been recorded.
+
+    The wrapped view is excluded from ATOMIC_REQUESTS, so cached pages are
+    served without connecting to the database. Instead, the view is run in
+    a transaction for each database with ATOMIC_REQUESTS only when its
+    response is not cached.
+
+    Args:
+        view_function: View function to cache responses of.
+
+    Returns:
+        Wrapped view function.
+    """
+    @wraps(view_function)
+    def cached_view_function(request, *args, **kwargs):
+        content_version = get_content_version()
+        if content_version is None or request.method != "GET":
+            return atomic_view_function(request, *args, **kwargs)
+
+        cache = caches[settings.CONTENT_PAGE_CACHE_ALIAS]
+        key_prefix = CONTENT_PAGE_KEY_PREFIX_TEMPLATE.format(content_version)
+        cache_key = get_cache_key(request, key_prefix, "GET", cache=cache)
+        if cache_key is not None:
+            response = cache.get(cache_key)
+            if response is not None:
+                return response
+
+        response = atomic_view_function(request, *args, **kwargs)
+        if response.status_code != 200 or response.streaming or response.cookies:
+            return response
+        timeout = settings.CONTENT_PAGE_CACHE_TIMEOUT
+        cache_key = learn_cache_key(request, response, timeout, key_prefix, cache=cache)
+        if hasattr(response, "render") and callable(response.render):
+            response.add_post_render_callback(
+                lambda rendered_response: cache.set(cache_key, rendered_response, timeout)
+            )
+        else:
+            cache.set(cache_key, response, timeout)
+        return response
+
+    def atomic_view_function(request, *args, **kwargs):
+        view = view_function
+        for connection in connections.all():
+            if connection.settings_dict["ATOMIC_REQUESTS"]:
+                view = transaction.atomic(using=connection.alias)(view)
+        return view(request, *args, **kwargs)
+
+    for connection in connections.all():
+        cached_view_function = transaction.non_atomic_requests(using=connection.alias)(cached_view_function)
+    return cached_view_function
@@ -1,18 +1,34 @@
 """Module for checking glossary links found within Markdown conversions."""
 
-from django.core.exceptions import ObjectDoesNotExist
 from utils.errors.CouldNotFindGlossaryTermError import CouldNotFindGlossaryTermError
+from utils.errors.ReferenceNotCheckedError import ReferenceNotCheckedError
 from topics.models import GlossaryTerm
 
 
-def check_converter_glossary_links(glossary_links, md_file_path):
+def check_converter_glossary_links(glossary_links, md_file_path, registry=None):
     """Process glossary links found by Markdown converter.
 
     Args:
         glossary_links: Dictionary of glossary links (dict).
+        md_file_path: Path to Markdown file containing links (str).
+        registry: Registry of loaded objects, if not given glossary
+            terms are read from the database (SlugRegistry).
+
+    Raises:
+        CouldNotFindGlossaryTermError: when a linked glossary term does not exist.
+        ReferenceNotCheckedError: when a linked glossary term could not be found,
+            as the glossary terms loader failed.
     """
+    if not glossary_links:
+        return
+    if registry is None:
+        glossary_slugs = set(
+            GlossaryTerm.objects.filter(slug__in=glossary_links.keys()).values_list("slug", flat=True)
+        )
+    else:
+        glossary_slugs = registry.get_objects(GlossaryTerm)
     for slug in glossary_links.keys():
-        try:
-            GlossaryTerm.objects.get(slug=slug)
-        except ObjectDoesNotExist:
+        if slug not in glossary_slugs:
+            if registry is not None and registry.has_failed(GlossaryTerm):
+                raise ReferenceNotCheckedError(md_file_path, slug, "Glossary Terms")
             raise CouldNotFindGlossaryTermError(slug, md_file_path)
@@ -6,6 +6,10 @@ from django.contrib.staticfiles import finders
 from django.conf import settings
 from utils.errors.CouldNotFindImageError import CouldNotFindImageError
 
+# Index of static file paths and list of missing images while images are
+# checked for a content load, None when each image is found individually
+image_checks = None
+
 
 def check_converter_required_files(required_files, md_file_path):
     """Process data within required files found by Markdown converter.
@@ -35,9 +39,56 @@ def render_scratch_images(scratch_images):
                 scratch_temp_file.write(scratch_image.text)
 
 
+def get_static_file_paths():
+    """Return paths of all files found by the static file finders.
+
+    Returns:
+        Set of normalised static file paths (set).
+    """
+    static_file_paths = set()
+    for finder in finders.get_finders():
+        for (path, storage) in finder.list([]):
+            prefix = getattr(storage, "prefix", None)
+            if prefix:
+                path = os.path.join(prefix, path)
+            static_file_paths.add(os.path.normpath(path))
+    return static_file_paths
+
+
+def start_image_checks():
+    """Check images against an index of all static files.
+
+    Missing images are collected until finish_image_checks() is called,
+    rather than raising an error for the first missing image.
+    """
+    global image_checks
+    image_checks = {
+        "static_file_paths": get_static_file_paths(),
+        "missing_images": [],
+    }
+
+
+def finish_image_checks():
+    """Stop checking images against the index of static files.
+
+    Returns:
+        List of tuples of missing image and path to file referencing
+        the image, in the order the images were checked (list).
+    """
+    global image_checks
+    if image_checks is None:
+        return []
+    missing_images = image_checks["missing_images"]
+    image_checks = None
+    return missing_images
+
+
 def find_image_files(images, md_file_path):
     """Confirm each image is in static folder.
 
+    If images are being checked for a content load (see start_image_checks()),
+    missing images are collected instead of raising an error.
+
     Args:
         images: image file names (set).
         md_file_path: path to Markdown file (str).
@@ -46,5 +97,8 @@ def find_image_files(images, md_file_path):
         CouldNotFindImageError: when image file cannot be found.
     """
     for image in images:
-        if not finders.find(image):
-            raise CouldNotFindImageError(image, md_file_path)
+        if image_checks is None:
+            if not finders.find(image):
+                raise CouldNotFindImageError(image, md_file_path)
+        elif os.path.normpath(image) not in image_checks["static_file_paths"]:
+            image_checks["missing_images"].append((image, md_file_path))
@@ -0,0 +1,164 @@
+"""Read and update the version of the loaded content."""
+
+import hashlib
+import json
+import os
+from uuid import uuid4
+from django.conf import settings
+from django.core.cache import cache
+from config import __version__
+from general.models import ContentVersion, ContentHash
+
+CONTENT_VERSION_CACHE_KEY = "content-version"
+SHARED_CONTENT_HASH_NAME = "shared"
+TOPIC_CONTENT_HASH_NAME_TEMPLATE = "topic:{}"
+
+
+def get_content_version_details():
+    """Return the version of the content loaded into the database.
+
+    The details are cached for CONTENT_VERSION_CACHE_TIMEOUT seconds, so
+    most requests do not query the database for them.
+
+    Returns:
+        Tuple of version of content (str) and time the version was
+        recorded (datetime), or (None, None) if no content has been loaded.
+    """
+    details = cache.get(CONTENT_VERSION_CACHE_KEY)
+    if details is None:
+        content_version = ContentVersion.objects.order_by("-updated").first()
+        if content_version is None:
+            details = (None, None)
+        else:
+            details = (content_version.version, content_version.updated)
+        cache.set(CONTENT_VERSION_CACHE_KEY, details, settings.CONTENT_VERSION_CACHE_TIMEOUT)
+    return details
+
+
+def get_content_version():
+    """Return the version of the content loaded into the database.
+
+    Returns:
+        Version of content (str), or None if no content has been loaded.
+    """
+    return get_content_version_details()[0]
+
+
+def update_content_version(version=None):
+    """Record a new version of the content loaded into the database.
+
+    Pages cached for previous versions of the content are no longer used.
+
+    Args:
+        version: Version of content, a new unique version is used if not
+            given (str).
+
+    Returns:
+        Version of content (str).
+    """
+    if version is None:
+        version = uuid4().hex
+    ContentVersion.objects.all().delete()
+    ContentVersion.objects.create(version=version)
+    cache.delete(CONTENT_VERSION_CACHE_KEY)
+    return version
+
+
+def update_file_hash(content_hash, file_path, relative_path):
+    """Add the path, length and contents of a file to a hash.
+
+    Args:
+        content_hash: Hash object to update (hashlib hash).
+        file_path: Path to file (str).
+        relative_path: Path to file relative to its content directory (str).
+    """
+    with open(file_path, "rb") as content_file:
+        contents = content_file.read()
+    content_hash.update("{}\0{}\0".format(relative_path, len(contents)).encode("UTF-8"))
+    content_hash.update(contents)
+
+
+def calculate_content_revision(*directories):
+    """Return a hash of the website version and all files within the given directories.
+
+    The hash includes the path of each file relative to its directory,
+    so renamed or moved files also change the revision. The website
+    version is included, as loaders may change between versions.
+
+    Args:
+        directories: Paths of content directories (str).
+
+    Returns:
+        Hex digest of content (str).
+    """
+    content_hash = hashlib.sha256()
+    content_hash.update("{}\0".format(__version__).encode("UTF-8"))
+    for directory in directories:
+        for (root, dirnames, filenames) in os.walk(directory):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                file_path = os.path.join(root, filename)
+                update_file_hash(content_hash, file_path, os.path.relpath(file_path, directory))
+    return content_hash.hexdigest()
+
+
+def calculate_content_hashes(resources_path, topics_path, structure):
+    """Return hashes of the content of each topic, and of all other content.
+
+    Files of a topic are within the topic's directory in the structure
+    directory and each language directory. All other files (including
+    resources) are shared content, as objects loaded from them are used
+    by every topic. The website version is included in the shared
+    content hash, as loaders may change between versions.
+
+    Args:
+        resources_path: Path to resources content directory (str).
+        topics_path: Path to topics content directory (str).
+        structure: Contents of the topics structure file (dict).
+
+    Returns:
+        Dictionary of hex digests, keyed by content hash name.
+    """
+    topic_hashes = {slug: hashlib.sha256() for slug in structure.get("topics") or []}
+    shared_hash = hashlib.sha256()
+    shared_hash.update("{}\0".format(calculate_content_revision(resources_path)).encode("UTF-8"))
+    # Adding or removing topics is handled by comparing topic hashes
+    shared_structure = {key: value for (key, value) in structure.items() if key != "topics"}
+    shared_hash.update(json.dumps(shared_structure, sort_keys=True).encode("UTF-8"))
+    for (root, dirnames, filenames) in os.walk(topics_path):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            file_path = os.path.join(root, filename)
+            relative_path = os.path.relpath(file_path, topics_path)
+            path_parts = relative_path.split(os.sep)
+            if len(path_parts) > 2 and path_parts[1] in topic_hashes:
+                update_file_hash(topic_hashes[path_parts[1]], file_path, relative_path)
+            elif path_parts != ["structure", "structure.yaml"]:
+                update_file_hash(shared_hash, file_path, relative_path)
+
+    content_hashes = {SHARED_CONTENT_HASH_NAME: shared_hash.hexdigest()}
+    for (slug, topic_hash) in topic_hashes.items():
+        content_hashes[TOPIC_CONTENT_HASH_NAME_TEMPLATE.format(slug)] = topic_hash.hexdigest()
+    return content_hashes
+
+
+def get_content_hashes():
+    """Return hashes of the content loaded into the database.
+
+    Returns:
+        Dictionary of hex digests, keyed by content hash name.
+    """
+    return dict(ContentHash.objects.values_list("name", "content_hash"))
+
+
+def save_content_hashes(content_hashes):
+    """Record hashes of the content loaded into the database.
+
+    Args:
+        content_hashes: Dictionary of hex digests, keyed by content hash name.
+    """
+    ContentHash.objects.all().delete()
+    ContentHash.objects.bulk_create(
+        ContentHash(name=name, content_hash=content_hash)
+        for (name, content_hash) in sorted(content_hashes.items())
+    )
@@ -0,0 +1,193 @@
+"""Convert Markdown files in advance across multiple processes."""
+
+import hashlib
+import os
+from multiprocessing import Pool
+
+# Results of conversions done in advance, keyed by get_markdown_key()
+converted_markdown = dict()
+# Converter of each worker process, created by setup_worker()
+worker_loader = None
+# Pool of worker processes kept while content is loaded, see start_worker_pool()
+worker_pool = None
+
+
+def get_markdown_key(content, remove_title):
+    """Return key for the conversion of Markdown content.
+
+    Args:
+        content: Markdown content (str).
+        remove_title: Boolean if the content's first heading is removed (bool).
+
+    Returns:
+        Tuple of content hash and remove title setting.
+    """
+    return (hashlib.sha256(content.encode("UTF-8")).hexdigest(), remove_title)
+
+
+def get_converted_markdown(content, remove_title):
+    """Return the result of converting Markdown content in advance.
+
+    Args:
+        content: Markdown content (str).
+        remove_title: Boolean if the content's first heading is removed (bool).
+
+    Returns:
+        VertoResult object, or None if the content was not converted in advance.
+    """
+    return converted_markdown.get(get_markdown_key(content, remove_title))
+
+
+def find_markdown_files(directories):
+    """Return paths of all Markdown files within the given directories.
+
+    Args:
+        directories: List of directory paths (list).
+
+    Returns:
+        Sorted list of Markdown file paths (list).
+    """
+    md_file_paths = []
+    for directory in directories:
+        for (root, dirnames, filenames) in os.walk(directory):
+            for filename in filenames:
+                if filename.endswith(".md"):
+                    md_file_paths.append(os.path.join(root, filename))
+    return sorted(md_file_paths)
+
+
+def setup_worker():
+    """Create the Markdown converter for a worker process."""
+    # Imported here to avoid a circular import, as BaseLoader uses this module
+    from utils.BaseLoader import BaseLoader
+    global worker_loader
+    worker_loader = BaseLoader()
+
+
+def convert_markdown(job):
+    """Convert Markdown content within a worker process.
+
+    Args:
+        job: Tuple of key, Markdown content, and remove title setting.
+
+    Returns:
+        Tuple of key and VertoResult object, or None as the result if the
+        content could not be converted.
+    """
+    (key, content, remove_title) = job
+    try:
+        result = worker_loader.convert_md_content(content, remove_title)
+    except Exception:
+        # Converted again when the file is loaded, to raise the error
+        # with the file's details and in the order of loading
+        result = None
+    return (key, result)
+
+
+def start_worker_pool(processes):
+    """Start a pool of worker processes to keep while content is loaded.
+
+    While the pool is running, it is used by convert_markdown_files and
+    convert_markdown_translations instead of starting a new pool.
+
+    Args:
+        processes: Number of worker processes (int).
+    """
+    global worker_pool
+    stop_worker_pool()
+    worker_pool = Pool(processes, initializer=setup_worker)
+
+
+def stop_worker_pool():
+    """Stop the pool of worker processes started by start_worker_pool()."""
+    global worker_pool
+    if worker_pool is not None:
+        worker_pool.close()
+        worker_pool.join()
+        worker_pool = None
+
+
+def get_conversion_jobs(md_file_paths, remove_title):
+    """Return jobs for converting Markdown files not already converted.
+
+    Args:
+        md_file_paths: List of Markdown file paths (list).
+        remove_title: Boolean if the first heading of each file is removed (bool).
+
+    Returns:
+        Dictionary of jobs for convert_markdown, keyed by get_markdown_key() (dict).
+    """
+    jobs = dict()
+    for md_file_path in md_file_paths:
+        with open(md_file_path, encoding="UTF-8") as md_file:
+            content = md_file.read()
+        key = get_markdown_key(content, remove_title)
+        if key not in converted_markdown:
+            jobs[key] = (key, content, remove_title)
+    return jobs
+
+
+def run_conversion_jobs(pool, jobs, chunksize):
+    """Convert Markdown content across a pool of processes.
+
+    Args:
+        pool: Pool of worker processes (Pool).
+        jobs: Dictionary of jobs, from get_conversion_jobs() (dict).
+        chunksize: Number of jobs sent to a worker at a time (int).
+
+    Returns:
+        Number of files converted (int).
+    """
+    count = 0
+    for (key, result) in pool.imap_unordered(convert_markdown, jobs.values(), chunksize=chunksize):
+        if result is not None:
+            converted_markdown[key] = result
+            count += 1
+    return count
+
+
+def convert_markdown_files(md_file_paths, processes, remove_title=True):
+    """Convert Markdown files across a pool of processes.
+
+    Results are stored for BaseLoader.convert_md_file to use instead of
+    converting the file again. Files that cannot be converted are left
+    to be converted (and their errors raised) when loaded.
+
+    Args:
+        md_file_paths: List of Markdown file paths (list).
+        processes: Number of worker processes, if the pool from
+            start_worker_pool() is not running (int).
+        remove_title: Boolean if the first heading of each file is removed (bool).
+
+    Returns:
+        Number of files converted (int).
+    """
+    jobs = get_conversion_jobs(md_file_paths, remove_title)
+    if not jobs:
+        return 0
+    if worker_pool is not None:
+        return run_conversion_jobs(worker_pool, jobs, chunksize=4)
+    with Pool(processes, initializer=setup_worker) as pool:
+        return run_conversion_jobs(pool, jobs, chunksize=4)
+
+
+def convert_markdown_translations(md_file_paths, remove_title=True):
+    """Convert the translations of a Markdown file in parallel.
+
+    Translations are only converted if the pool from start_worker_pool()
+    is running and more than one translation needs converting, otherwise
+    each translation is converted when loaded. Missing files are ignored.
+
+    Args:
+        md_file_paths: List of paths to each translation of a file (list).
+        remove_title: Boolean if the first heading of each file is removed (bool).
+
+    Returns:
+        Number of files converted (int).
+    """
+    if worker_pool is None:
+        return 0
+    jobs = get_conversion_jobs(filter(os.path.isfile, md_file_paths), remove_title)
+    if len(jobs) < 2:
+        return 0
+    return run_conversion_jobs(worker_pool, jobs, chunksize=1)
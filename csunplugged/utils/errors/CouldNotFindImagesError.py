@@ -0,0 +1,36 @@
+"""Custom error for multiple missing images."""
+
+from .Error import Error, ERROR_TITLE_TEMPLATE, ERROR_FILENAME_TEMPLATE
+
+ERROR_MESSAGE_TEMPLATE = "\nCould not find {count} image{plural}.\n"
+
+
+class CouldNotFindImagesError(Error):
+    """Custom error for multiple missing images."""
+
+    def __init__(self, missing_images):
+        """Create the error for multiple missing images.
+
+        Args:
+            missing_images: List of tuples of image path and path to file
+                referencing the image (list).
+        """
+        super().__init__()
+        self.missing_images = missing_images
+
+    def __str__(self):
+        """Override default error string.
+
+        Returns:
+            Error message listing all missing image files.
+        """
+        message = ERROR_TITLE_TEMPLATE
+        for (image_path, reference_file_path) in self.missing_images:
+            message += ERROR_FILENAME_TEMPLATE.format(filename=image_path)
+            message += self.reference_message.format(reference=reference_file_path)
+        if len(self.missing_images) > 1:
+            plural = "s"
+        else:
+            plural = ""
+        error_message = ERROR_MESSAGE_TEMPLATE.format(count=len(self.missing_images), plural=plural)
+        return message + error_message + self.missing_file_suggestions
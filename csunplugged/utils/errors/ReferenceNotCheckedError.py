@@ -0,0 +1,29 @@
+"""Custom error for a key referencing content that failed to load."""
+
+from .Error import Error
+
+ERROR_MESSAGE_TEMPLATE = """
+Key: {key}
+"{key}" could not be checked, as the {field} could not be loaded
+"""
+
+
+class ReferenceNotCheckedError(Error):
+    """Custom error for a key referencing content that failed to load."""
+
+    def __init__(self, config_file_path, key, field):
+        """Create the error for a key referencing content that failed to load."""
+        super().__init__()
+        self.config_file_path = config_file_path
+        self.key = key
+        self.field = field
+
+    def __str__(self):
+        """Override default error string.
+
+        Returns:
+            Error message for key that could not be checked.
+        """
+        base_message = self.base_message.format(filename=self.config_file_path)
+        error_message = ERROR_MESSAGE_TEMPLATE.format(key=self.key, field=self.field)
+        return base_message + error_message
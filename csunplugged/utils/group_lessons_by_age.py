@@ -1,10 +1,56 @@
 """Return ordered groups of lessons."""
 
 from collections import OrderedDict
-from topics.models import (
-    AgeGroup,
-    LessonNumber,
-)
+from topics.models import LessonNumber
+
+
+def get_lesson_numbers(lessons=None):
+    """Return lesson numbers with their lessons and age groups loaded.
+
+    The returned QuerySet is evaluated in a constant number of queries,
+    so can be grouped with group_lesson_numbers_by_age without any
+    further queries.
+
+    Args:
+        lessons: Optional QuerySet or list of Lesson objects to
+            restrict the lesson numbers to (QuerySet).
+
+    Returns:
+        QuerySet of LessonNumber objects, ordered by age group and number.
+    """
+    lesson_numbers = LessonNumber.objects.select_related(
+        "age_group",
+        "lesson__topic",
+        "lesson__unit_plan",
+    ).prefetch_related(
+        "lesson__programming_challenges",
+    ).order_by(
+        "age_group__ages",
+        "age_group_id",
+        "number",
+    )
+    if lessons is not None:
+        lesson_numbers = lesson_numbers.filter(lesson__in=lessons)
+    return lesson_numbers
+
+
+def group_lesson_numbers_by_age(lesson_numbers):
+    """Return ordered groups of lessons from lesson numbers.
+
+    Args:
+        lesson_numbers: Iterable of LessonNumber objects, ordered by
+            age group and number, such as from get_lesson_numbers.
+
+    Returns:
+        A ordered dictionary of grouped lessons, in the same form as
+        group_lessons_by_age.
+    """
+    grouped_lessons = OrderedDict()
+    for lesson_number in lesson_numbers:
+        lesson = lesson_number.lesson
+        lesson.number = lesson_number.number
+        grouped_lessons.setdefault(lesson_number.age_group, []).append(lesson)
+    return grouped_lessons
 
 
 def group_lessons_by_age(lessons):
@@ -22,12 +68,4 @@ def group_lessons_by_age(lessons):
         the lessons.
         The value for a key is a sorted list of lessons (ordered by number).
     """
-    grouped_lessons = OrderedDict()
-    for age_group in AgeGroup.objects.distinct():
-        for lesson in age_group.lessons.filter(id__in=lessons).order_by("lessonnumber"):
-            lesson.number = LessonNumber.objects.get(lesson=lesson, age_group=age_group).number
-            if age_group in grouped_lessons.keys():
-                grouped_lessons[age_group].append(lesson)
-            else:
-                grouped_lessons[age_group] = [lesson]
-    return grouped_lessons
+    return group_lesson_numbers_by_age(get_lesson_numbers(lessons))
@@ -0,0 +1,113 @@
+"""Cache of Markdown conversions stored on disk between loads of content."""
+
+import hashlib
+import os
+import os.path
+import pickle
+import tempfile
+import verto
+from django.conf import settings
+
+# Increase when the stored result or converter extensions change,
+# so conversions from the previous format are not used
+CACHE_FORMAT_VERSION = 1
+
+
+def get_templates_hash(templates):
+    """Return hash of custom HTML templates given to the converter.
+
+    Args:
+        templates: Dictionary of HTML templates, keyed by name (dict).
+
+    Returns:
+        SHA256 hex digest of templates (str).
+    """
+    templates_hash = hashlib.sha256()
+    for (name, template) in sorted(templates.items()):
+        templates_hash.update(name.encode("UTF-8"))
+        templates_hash.update(b"\0")
+        templates_hash.update(template.encode("UTF-8"))
+        templates_hash.update(b"\0")
+    return templates_hash.hexdigest()
+
+
+def get_conversion_key(content, templates_hash, processors):
+    """Return key for a conversion of Markdown content.
+
+    The key changes if the content, Verto version, custom templates,
+    or processors used for conversion change.
+
+    Args:
+        content: Markdown content (str).
+        templates_hash: Hash of custom HTML templates (str).
+        processors: Set of Verto processor names (set).
+
+    Returns:
+        SHA256 hex digest of conversion settings and content (str).
+    """
+    key_hash = hashlib.sha256()
+    for part in [
+        str(CACHE_FORMAT_VERSION),
+        verto.__version__,
+        templates_hash,
+        ",".join(sorted(processors)),
+        content,
+    ]:
+        key_hash.update(part.encode("UTF-8"))
+        key_hash.update(b"\0")
+    return key_hash.hexdigest()
+
+
+def get_cached_conversion_path(key):
+    """Return path of the cache file for a conversion.
+
+    Args:
+        key: Conversion key from get_conversion_key() (str).
+
+    Returns:
+        Path to cache file (str), or None if the cache is disabled.
+    """
+    location = settings.MARKDOWN_CONVERSION_CACHE_LOCATION
+    if not location:
+        return None
+    return os.path.join(location, "{}.pickle".format(key))
+
+
+def read_cached_conversion(key):
+    """Return a cached conversion of Markdown content.
+
+    Args:
+        key: Conversion key from get_conversion_key() (str).
+
+    Returns:
+        VertoResult object, or None if the conversion is not cached.
+    """
+    path = get_cached_conversion_path(key)
+    if path is None:
+        return None
+    try:
+        with open(path, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        # Missing or incomplete files are converted again
+        return None
+
+
+def write_cached_conversion(key, result):
+    """Store a conversion of Markdown content in the cache.
+
+    The file is written under a temporary name and then renamed, so
+    processes converting at the same time never read a partial file.
+
+    Args:
+        key: Conversion key from get_conversion_key() (str).
+        result: VertoResult object.
+    """
+    path = get_cached_conversion_path(key)
+    if path is None:
+        return
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as cache_file:
+        pickle.dump(result, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(cache_file.name, path)
@@ -0,0 +1,111 @@
+"""Markdown converters shared by all content loaders."""
+
+import copy
+import os
+import re
+import mdx_math
+from verto import Verto
+from django.conf import settings
+from .markdown_conversion_cache import get_templates_hash
+
+# Custom HTML templates and their hash, keyed by template directory
+template_files = dict()
+# Converters keyed by template directory and processor names
+markdown_converters = dict()
+
+
+def load_template_files(template_path):
+    """Load custom HTML templates for converter from a directory.
+
+    Args:
+        template_path: Path to directory of templates (str).
+
+    Returns:
+        templates: dictionary of html templates
+    """
+    templates = dict()
+    for file in os.listdir(template_path):
+        template_file = re.search(r"(.*?).html$", file)
+        if template_file:
+            template_name = template_file.groups()[0]
+            with open(os.path.join(template_path, file)) as template:
+                templates[template_name] = template.read()
+    return templates
+
+
+def get_template_files():
+    """Return custom HTML templates for converter.
+
+    Templates are only read from CUSTOM_VERTO_TEMPLATES once per process.
+
+    Returns:
+        Tuple of dictionary of html templates and hash of templates (str).
+    """
+    template_path = settings.CUSTOM_VERTO_TEMPLATES
+    if template_path not in template_files:
+        templates = load_template_files(template_path)
+        template_files[template_path] = (templates, get_templates_hash(templates))
+    return template_files[template_path]
+
+
+def get_markdown_processors(remove_title):
+    """Return the Verto processors used for converting content.
+
+    Args:
+        remove_title: Boolean if the content's first heading is removed (bool).
+
+    Returns:
+        Set of processor names (set).
+    """
+    processors = Verto.processor_defaults()
+    if remove_title:
+        processors.add("remove-title")
+    return processors
+
+
+def get_markdown_converter(processors):
+    """Return the shared converter for a set of processors.
+
+    The converter is created with custom processors, html templates,
+    and extensions when first requested.
+
+    Args:
+        processors: Set of processor names (set).
+
+    Returns:
+        Verto object.
+    """
+    key = (settings.CUSTOM_VERTO_TEMPLATES, tuple(sorted(processors)))
+    converter = markdown_converters.get(key)
+    if converter is None:
+        (templates, templates_hash) = get_template_files()
+        extensions = [
+            "markdown.extensions.fenced_code",
+            "markdown.extensions.codehilite",
+            "markdown.extensions.sane_lists",
+            "markdown.extensions.tables",
+            mdx_math.MathExtension()
+        ]
+        converter = Verto(processors=processors, html_templates=templates, extensions=extensions)
+        markdown_converters[key] = converter
+    return converter
+
+
+def convert_markdown_content(content, processors):
+    """Convert Markdown content with the shared converter for a set of processors.
+
+    Args:
+        content: Markdown content to convert (str).
+        processors: Set of processor names (set).
+
+    Returns:
+        VertoResult object.
+    """
+    converter = get_markdown_converter(processors)
+    # Data such as required files is kept by the converter between
+    # documents, so each result is given its own copy of the data
+    converter.clear_saved_data()
+    result = converter.convert(content)
+    result.required_files = copy.deepcopy(result.required_files)
+    result.required_glossary_terms = copy.deepcopy(result.required_glossary_terms)
+    return result
@@ -0,0 +1,37 @@
+"""Parse YAML files, keeping parsed files for the current content load."""
+
+import os
+import yaml
+
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    # PyYAML was installed without libyaml
+    from yaml import SafeLoader as YAMLLoader
+
+# Contents of parsed YAML files, keyed by file path and modification time
+parsed_yaml_files = dict()
+
+
+def parse_yaml_file(yaml_file_path):
+    """Return the contents of a YAML file.
+
+    Each file is only parsed again if it has been modified since it was
+    last parsed. The same contents are returned to every caller, so they
+    must not be changed.
+
+    Args:
+        yaml_file_path: Path to YAML file (str).
+
+    Returns:
+        Contents of YAML file.
+
+    Raises:
+        FileNotFoundError: when the file cannot be found.
+        yaml.YAMLError: when the file is incorrectly formatted.
+    """
+    key = (yaml_file_path, os.stat(yaml_file_path).st_mtime_ns)
+    if key not in parsed_yaml_files:
+        with open(yaml_file_path, encoding="UTF-8") as yaml_file:
+            parsed_yaml_files[key] = yaml.load(yaml_file.read(), Loader=YAMLLoader)
+    return parsed_yaml_files[key]
@@ -1,3 +1,4 @@
 # Configuration options for development deployment
 
 export INCLUDE_INCONTEXT_L10N=true
+export GOOGLE_CLOUD_STORAGE_BUCKET_NAME=cs-unplugged-dev.appspot.com
@@ -8,14 +8,7 @@ source ./infrastructure/prod-deploy/load-prod-deploy-config-envs.sh
 ./csu update
 
 # Generate static PDF resources for deployment.
-docker-compose exec django /docker_venv/bin/python3 ./manage.py makeresources "Modulo Clock"
-docker-compose exec django /docker_venv/bin/python3 ./manage.py makeresources "Parity Cards"
-docker-compose exec django /docker_venv/bin/python3 ./manage.py makeresources "Piano Keys"
-docker-compose exec django /docker_venv/bin/python3 ./manage.py makeresources "Pixel Painter"
-docker-compose exec django /docker_venv/bin/python3 ./manage.py makeresources "Searching Cards"
-docker-compose exec django /docker_venv/bin/python3 ./manage.py makeresources "Sorting Network"
-docker-compose exec django /docker_venv/bin/python3 ./manage.py makeresources "Sorting Network Cards"
-docker-compose exec django /docker_venv/bin/python3 ./manage.py makeresources "Train Stations"
+docker-compose exec django /docker_venv/bin/python3 ./manage.py makeresources --shard 2/3
 
 # Install Google Cloud SDK
 ./infrastructure/install_google_cloud_sdk.sh
@@ -38,4 +31,9 @@ ssh-keygen -q -N "" -f ~/.ssh/google_compute_engine
 # This copies the generated static files from tests to the Google Storage
 # Bucket.
 # See: https://cloud.google.com/python/django/flexible-environment#deploy_the_app_to_the_app_engine_flexible_environment
-gsutil rsync -R ./csunplugged/staticfiles/resources/ gs://cs-unplugged.appspot.com/static/resources/
+#
+# PDFs are stored under content hash directories so they never change and
+# can be cached indefinitely. Manifests are uploaded after the PDFs they
+# reference, and are not cached so new PDFs are served straight away.
+gsutil -h "Cache-Control:public, max-age=31536000" rsync -R -x "manifest-.*\.json$" ./csunplugged/staticfiles/resources/ gs://cs-unplugged.appspot.com/static/resources/
+gsutil -h "Cache-Control:no-cache" cp ./csunplugged/staticfiles/resources/manifest-*.json gs://cs-unplugged.appspot.com/static/resources/
@@ -1,3 +1,4 @@
 # Configuration options for production deployment
 
 export INCLUDE_INCONTEXT_L10N=false
+export GOOGLE_CLOUD_STORAGE_BUCKET_NAME=cs-unplugged.appspot.com
@@ -12,7 +12,9 @@ mv ./infrastructure/cloud-sql-proxy/docker-compose.yml ./docker-compose.yml
 source ./load-prod-deploy-envs.sh
 
 # Start the system and run the migrate and updatedata system commands.
+# Only changed content is loaded, in a single transaction, so the website
+# continues to serve the previous content until loading is complete.
 docker-compose up -d
 ./csu dev static
 ./csu dev migrate
-./csu dev updatedata
+./csu dev updatedata --incremental